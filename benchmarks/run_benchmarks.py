@@ -0,0 +1,326 @@
+# ****************************************************************************
+# Copyright 2023 Technology Innovation Institute
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ****************************************************************************
+
+"""Benchmarks the parameter optimization of the estimators and compares the results against stored references.
+
+For every instance of `instances.yaml` and every algorithm of its estimator, the benchmark records the optimization
+time (the minimum over several fresh estimators), the peak of the memory allocated during the optimization, and the
+number of parameter candidates generated and evaluated (see `BaseAlgorithm.optimization_statistics`), including the
+ones of the inner estimators optimized for the algorithm.
+
+The numbers of candidates do not depend on the machine and are compared against the committed `counts.json`. Time
+and memory peak are only compared against a local `baseline.json`, which is recorded on the same machine and is not
+committed.
+
+Usage:
+    python benchmarks/run_benchmarks.py                    # run and compare against counts.json and baseline.json
+    python benchmarks/run_benchmarks.py --long             # include the long running instances
+    python benchmarks/run_benchmarks.py --save-baseline    # run and replace the local baseline
+    python benchmarks/run_benchmarks.py --save-counts      # run and replace the committed counts
+    python benchmarks/run_benchmarks.py --filter MQ        # only instances whose key contains "MQ"
+
+The process exits with status 1 if a benchmark regressed.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+from time import perf_counter
+from typing import Dict, List, Optional
+
+import yaml
+from prettytable import PrettyTable
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIRECTORY))
+
+from cryptographic_estimators.estimate_cache import _package_version  # noqa: E402
+
+DEFAULT_INSTANCES = os.path.join(BENCHMARKS_DIRECTORY, "instances.yaml")
+DEFAULT_COUNTS = os.path.join(BENCHMARKS_DIRECTORY, "counts.json")
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIRECTORY, "baseline.json")
+# measurements which do not depend on the machine
+COUNTS = ("candidates", "evaluations")
+# a benchmark regressed if its time or memory grew by more than this factor ...
+DEFAULT_THRESHOLD = 1.25
+# ... and by more than these absolute amounts, which hide the noise of very short runs
+MINIMAL_TIME_DIFFERENCE = 0.02
+MINIMAL_MEMORY_DIFFERENCE = 2**20
+
+
+def load_instances(path: str, include_long: bool = False, pattern: Optional[str] = None) -> List[dict]:
+    """Returns the benchmark instances described in `path`.
+
+    Args:
+        path (str): YAML file mapping estimator names to lists of instances with a `name`, the `parameters` of the
+            estimator and an optional `long` flag.
+        include_long (bool, optional): Include the instances flagged as long. Defaults to False.
+        pattern (str, optional): Keep only the instances whose key `<estimator>/<name>` contains `pattern`.
+    """
+    with open(path) as file:
+        description = yaml.safe_load(file)
+
+    instances = []
+    for estimator, entries in description.items():
+        for entry in entries:
+            key = f"{estimator}/{entry['name']}"
+            if entry.get("long", False) and not include_long:
+                continue
+            if pattern is not None and pattern not in key:
+                continue
+            instances.append({"key": key, "estimator": estimator, "parameters": entry["parameters"]})
+    return instances
+
+
+def estimator_class(name: str):
+    """Returns the estimator class `name`, which is defined in the subpackage of the same name."""
+    module = importlib.import_module(f"cryptographic_estimators.{name}")
+    return getattr(module, name)
+
+
+def optimize(algorithm):
+    """Runs the parameter optimization of `algorithm`."""
+    algorithm.time_complexity()
+    algorithm.memory_complexity()
+
+
+def inner_counts(estimator) -> Dict[str, int]:
+    """Returns the candidates and evaluations of all algorithms of the inner estimators registered by `estimator`.
+
+    Only the algorithms constructed so far are considered, this does not construct new ones.
+    """
+    counts = dict.fromkeys(COUNTS, 0)
+    for inner in estimator.sub_estimators.estimators():
+        for algorithm in inner._algorithm_instances.values():
+            if algorithm is not None:
+                statistics = algorithm.optimization_statistics
+                for i in COUNTS:
+                    counts[i] += statistics[i]
+    return counts
+
+
+def benchmark_instance(instance: dict, repeat: int) -> Dict[str, dict]:
+    """Benchmarks all algorithms of the estimator of `instance` and returns the measurements keyed by algorithm.
+
+    The time is the minimum over `repeat` fresh estimators, the memory peak is measured in an additional run with
+    `tracemalloc` enabled, as tracing slows down the optimization. The counts of an algorithm include the work of
+    the inner estimators it optimizes (see `SubEstimatorRegistry`), inner estimators already optimized for an earlier
+    algorithm of the same estimator are reused and not counted again.
+
+    Args:
+        instance (dict): Instance as returned by `load_instances`.
+        repeat (int): Number of timed runs.
+    """
+    Estimator = estimator_class(instance["estimator"])
+    results = {}
+    for run in range(repeat + 1):
+        trace_memory = run == repeat
+        estimator = Estimator(**instance["parameters"])
+        for algorithm in estimator.algorithms():
+            name = algorithm.__class__.__name__
+            if trace_memory:
+                tracemalloc.start()
+                optimize(algorithm)
+                results[name]["memory_peak"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                continue
+
+            inner = inner_counts(estimator)
+            start = perf_counter()
+            optimize(algorithm)
+            elapsed = perf_counter() - start
+            if name not in results:
+                statistics = algorithm.optimization_statistics
+                results[name] = {"time": elapsed}
+                for i, count in inner_counts(estimator).items():
+                    results[name][i] = statistics[i] + count - inner[i]
+            results[name]["time"] = min(results[name]["time"], elapsed)
+    return results
+
+
+def run_benchmarks(instances: List[dict], repeat: int, log=partial(print, flush=True)) -> dict:
+    """Benchmarks all `instances` and returns the report, see `benchmark_instance`.
+
+    Args:
+        instances (List[dict]): Instances as returned by `load_instances`.
+        repeat (int): Number of timed runs per instance.
+        log (callable, optional): Called with a progress message per instance. Defaults to print.
+    """
+    results = {}
+    for index, instance in enumerate(instances):
+        log(f"[{index + 1}/{len(instances)}] {instance['key']}")
+        for name, measurements in benchmark_instance(instance, repeat).items():
+            results[f"{instance['key']}/{name}"] = measurements
+
+    metadata = {"date": datetime.now(timezone.utc).isoformat(timespec="seconds"), "version": _package_version(),
+                "python": platform.python_version(), "machine": platform.machine(),
+                "processor": platform.processor(), "repeat": repeat}
+    return {"metadata": metadata, "results": results}
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD):
+    """Compares two reports and returns the comparison table and the keys of the regressed benchmarks.
+
+    A benchmark regressed if it generates or evaluates more candidates, or if its time or memory peak grew by more
+    than the factor `threshold` (and by more than `MINIMAL_TIME_DIFFERENCE` seconds or `MINIMAL_MEMORY_DIFFERENCE`
+    bytes). Time and memory are only compared if the baseline holds them.
+
+    Args:
+        baseline (dict): Report of the baseline run, possibly holding only the `COUNTS` of each benchmark.
+        current (dict): Report of the current run.
+        threshold (float, optional): Tolerated growth factor. Defaults to DEFAULT_THRESHOLD.
+    """
+    table = PrettyTable(["benchmark", "time", "time ratio", "memory (MiB)", "memory ratio", "candidates",
+                         "evaluations", "status"])
+    table.align["benchmark"] = "l"
+    regressions = []
+
+    def ratio(new, old, key):
+        if key not in old:
+            return None
+        return new[key] / old[key] if old[key] > 0 else 1.0
+
+    def count(new, old, key):
+        return str(new[key]) if new[key] == old[key] else f"{old[key]} -> {new[key]}"
+
+    def show(value):
+        return "--" if value is None else f"{value:.2f}"
+
+    for key, new in current["results"].items():
+        old = baseline["results"].get(key)
+        if old is None:
+            table.add_row([key, f"{new['time']:.3f}", "--", f"{new['memory_peak'] / 2**20:.1f}", "--",
+                           new["candidates"], new["evaluations"], "new"])
+            continue
+
+        time_ratio = ratio(new, old, "time")
+        memory_ratio = ratio(new, old, "memory_peak")
+        slower = time_ratio is not None and time_ratio > threshold \
+            and new["time"] - old["time"] > MINIMAL_TIME_DIFFERENCE
+        larger = memory_ratio is not None and memory_ratio > threshold \
+            and new["memory_peak"] - old["memory_peak"] > MINIMAL_MEMORY_DIFFERENCE
+        faster = time_ratio is not None and time_ratio < 1 / threshold \
+            and old["time"] - new["time"] > MINIMAL_TIME_DIFFERENCE
+        if slower or larger or any(new[i] > old[i] for i in COUNTS):
+            status = "regression"
+            regressions.append(key)
+        elif faster or any(new[i] < old[i] for i in COUNTS):
+            status = "improvement"
+        else:
+            status = "ok"
+
+        table.add_row([key, f"{new['time']:.3f}", show(time_ratio), f"{new['memory_peak'] / 2**20:.1f}",
+                       show(memory_ratio), count(new, old, "candidates"), count(new, old, "evaluations"), status])
+
+    instances = {key.rsplit("/", 1)[0] for key in current["results"]}
+    for key in baseline["results"]:
+        if key.rsplit("/", 1)[0] in instances and key not in current["results"]:
+            table.add_row([key, "--", "--", "--", "--", "--", "--", "missing"])
+
+    return table, regressions
+
+
+def load_report(path: str) -> Optional[dict]:
+    """Returns the report stored in `path`, or None if there is none."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_report(path: str, report: dict, fields: Optional[tuple] = None):
+    """Stores `report` in `path`, keeping the results of the benchmarks which were not run.
+
+    Args:
+        path (str): JSON file to write.
+        report (dict): Report as returned by `run_benchmarks`.
+        fields (tuple, optional): Measurements to store, defaults to all of them.
+    """
+    metadata = report["metadata"] if fields is None else {i: report["metadata"][i] for i in ("date", "version")}
+    results = {key: {i: value[i] for i in fields or value} for key, value in report["results"].items()}
+    previous = load_report(path)
+    if previous is not None:
+        previous["results"].update(results)
+        results = previous["results"]
+    with open(path, "w") as file:
+        json.dump({"metadata": metadata, "results": results}, file, indent=2)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks the parameter optimization of the estimators.")
+    parser.add_argument("--instances", default=DEFAULT_INSTANCES, help="YAML file describing the instances")
+    parser.add_argument("--counts", default=DEFAULT_COUNTS, help="JSON report of the committed candidate counts")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON report of a local run to compare against")
+    parser.add_argument("--output", help="write the JSON report of this run to the given file")
+    parser.add_argument("--save-baseline", action="store_true", help="replace the local baseline by this run")
+    parser.add_argument("--save-counts", action="store_true", help="replace the committed counts by this run")
+    parser.add_argument("--long", action="store_true", help="include the long running instances")
+    parser.add_argument("--filter", help="only run the instances whose key contains the given string")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs per instance")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="tolerated growth factor")
+    args = parser.parse_args(arguments)
+
+    if args.repeat < 1:
+        parser.error("--repeat must be positive")
+
+    instances = load_instances(args.instances, args.long, args.filter)
+    if not instances:
+        parser.error("no instances selected")
+
+    report = run_benchmarks(instances, args.repeat)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if args.save_baseline or args.save_counts:
+        if args.save_baseline:
+            save_report(args.baseline, report)
+            print(f"Baseline written to {args.baseline}")
+        if args.save_counts:
+            save_report(args.counts, report, COUNTS)
+            print(f"Counts written to {args.counts}")
+        return 0
+
+    counts = load_report(args.counts) or {"results": {}}
+    baseline = load_report(args.baseline)
+    if baseline is None:
+        print(f"No local baseline found at {args.baseline}, only the counts are compared. "
+              f"Run with --save-baseline on an unchanged tree to compare time and memory.")
+        baseline = {"results": {}}
+    else:
+        print(f"Baseline: {baseline['metadata']['date']} (version {baseline['metadata']['version']})")
+
+    # the committed counts take precedence over the ones of the local baseline
+    keys = set(counts["results"]) | set(baseline["results"])
+    reference = {"results": {key: {**baseline["results"].get(key, {}), **counts["results"].get(key, {})}
+                             for key in keys}}
+    table, regressions = compare(reference, report, args.threshold)
+    print(table)
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
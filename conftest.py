@@ -15,3 +15,4 @@ def add_longtests(request, doctest_namespace):
     doctest_namespace["skip_long_doctests"] = request.config.getoption(
         "--skip-long-doctests"
     )
+    doctest_namespace["pytest"] = pytest
@@ -18,7 +18,7 @@
 
 from ..bike_algorithm import BIKEAlgorithm
 from ..bike_problem import BIKEProblem
-from ...base_constants import BASE_ATTACK_TYPE_KEY_RECOVERY
+from ...base_constants import BASE_COMPLEXITY_TYPE, BASE_ATTACK_TYPE_KEY_RECOVERY
 from ...base_algorithm import BaseAlgorithm
 from ...SDEstimator import SDEstimator
 from math import log2
@@ -36,14 +36,23 @@ class SDKeyAttack(BIKEAlgorithm):
         super(SDKeyAttack, self).__init__(problem, **kwargs)
         self._attack_type = BASE_ATTACK_TYPE_KEY_RECOVERY
         r, w, _ = self.problem.get_parameters()
-        self._SDEstimator = SDEstimator(n=2 * r, k=r, w=w, nsolutions=log2(r), memory_bound=self.problem.memory_bound,
-                                        bit_complexities=0, **kwargs)
+        self._sd_estimator_parameters = dict(n=2 * r, k=r, w=w, nsolutions=log2(r), memory_bound=self.problem.memory_bound,
+                                             bit_complexities=0, **kwargs)
+        self._request_sd_estimator()
 
     @BaseAlgorithm.complexity_type.setter
     def complexity_type(self, input_type):
         """Sets complexity type of algorithm and included SDEstimator object."""
         BaseAlgorithm.complexity_type.fset(self, input_type)
-        self._SDEstimator.complexity_type = input_type
+        self._request_sd_estimator()
+
+    def _request_sd_estimator(self):
+        """Requests the SDEstimator for the current complexity type from the registry of sub-estimators.
+
+        The registered estimators are shared with other algorithms, so their settings are never changed.
+        """
+        self._sd_estimator_parameters[BASE_COMPLEXITY_TYPE] = self._complexity_type
+        self._SDEstimator = self._sub_estimators.get(SDEstimator, **self._sd_estimator_parameters)
 
     def get_fastest_sd_algorithm(self):
         """Fastest algorithm returned by the SDEstimator object."""
@@ -90,4 +99,4 @@ class SDKeyAttack(BIKEAlgorithm):
     def reset(self):
         """Reset to the initial state of the estimation object."""
         super().reset()
-        self._SDEstimator.reset()
+        self._request_sd_estimator()
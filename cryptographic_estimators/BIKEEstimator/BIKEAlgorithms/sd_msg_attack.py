@@ -18,7 +18,7 @@
 
 from ..bike_algorithm import BIKEAlgorithm
 from ..bike_problem import BIKEProblem
-from ...base_constants import BASE_ATTACK_TYPE_MSG_RECOVERY
+from ...base_constants import BASE_COMPLEXITY_TYPE, BASE_ATTACK_TYPE_MSG_RECOVERY
 from ...base_algorithm import BaseAlgorithm
 from ...SDEstimator import SDEstimator
 from math import log2
@@ -37,13 +37,22 @@ class SDMsgAttack(BIKEAlgorithm):
         super(SDMsgAttack, self).__init__(problem, **kwargs)
         self._attack_type = BASE_ATTACK_TYPE_MSG_RECOVERY
         r, _, t = self.problem.get_parameters()
-        self._SDEstimator = SDEstimator(n=2 * r, k=r, w=t, nsolutions=0, memory_bound=self.problem.memory_bound,
-                                        bit_complexities=0, **kwargs)
+        self._sd_estimator_parameters = dict(n=2 * r, k=r, w=t, nsolutions=0, memory_bound=self.problem.memory_bound,
+                                             bit_complexities=0, **kwargs)
+        self._request_sd_estimator()
 
     @BaseAlgorithm.complexity_type.setter
     def complexity_type(self, input_type):
         BaseAlgorithm.complexity_type.fset(self, input_type)
-        self._SDEstimator.complexity_type = input_type
+        self._request_sd_estimator()
+
+    def _request_sd_estimator(self):
+        """Requests the SDEstimator for the current complexity type from the registry of sub-estimators.
+
+        The registered estimators are shared with other algorithms, so their settings are never changed.
+        """
+        self._sd_estimator_parameters[BASE_COMPLEXITY_TYPE] = self._complexity_type
+        self._SDEstimator = self._sub_estimators.get(SDEstimator, **self._sd_estimator_parameters)
 
     def get_fastest_sd_algorithm(self):
         return self._SDEstimator.fastest_algorithm()
@@ -90,4 +99,4 @@ class SDMsgAttack(BIKEAlgorithm):
     def reset(self):
         """Reset to the initial state of the estimation object."""
         super().reset()
-        self._SDEstimator.reset()
+        self._request_sd_estimator()
@@ -123,8 +123,9 @@ class BBPS(LEAlgorithm):
         if M_second > 0:
             return inf, inf
 
-        self.SDFqEstimator = SDFqEstimator(n=n, k=k, w=w_prime, q=q, bit_complexities=0, nsolutions=0,
-                                           memory_bound=self.problem.memory_bound, **self._SDFqEstimator_parameters)
+        self.SDFqEstimator = self._sub_estimators.get(SDFqEstimator, n=n, k=k, w=w_prime, q=q, bit_complexities=0,
+                                                      nsolutions=0, memory_bound=self.problem.memory_bound,
+                                                      **self._SDFqEstimator_parameters)
         c_isd = self.SDFqEstimator.fastest_algorithm().time_complexity()
 
         time = c_isd + L_prime - Nw_prime
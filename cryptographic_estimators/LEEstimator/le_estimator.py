@@ -16,7 +16,6 @@
 # ****************************************************************************
 
 
-import pytest
 from ..LEEstimator.le_algorithm import LEAlgorithm
 from ..LEEstimator.le_problem import LEProblem
 from ..base_estimator import BaseEstimator
@@ -37,7 +36,7 @@ class LEEstimator(BaseEstimator):
         if not kwargs.get("excluded_algorithms"):
             kwargs["excluded_algorithms"] = []
 
-        kwargs["excluded_algorithms"] += self.excluded_algorithms_by_default
+        kwargs["excluded_algorithms"] = list(kwargs["excluded_algorithms"]) + self.excluded_algorithms_by_default
         super(LEEstimator, self).__init__(
             LEAlgorithm, LEProblem(n, k, q, memory_bound=memory_bound, **kwargs), **kwargs)
 
@@ -18,9 +18,8 @@
 
 from cryptographic_estimators.MQEstimator.mq_algorithm import MQAlgorithm
 from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
-from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeries
-from cryptographic_estimators.MQEstimator.series.nmonomial import NMonomialSeries
-from cryptographic_estimators.MQEstimator.mq_helper import nmonomials_up_to_degree
+from cryptographic_estimators.MQEstimator.series.hilbert import hilbert_series
+from cryptographic_estimators.MQEstimator.series.monomial_count_table import monomial_count_table
 from cryptographic_estimators.base_algorithm import optimal_parameter
 from math import log2, inf, comb as binomial
 
@@ -162,20 +161,11 @@ class Crossbred(MQAlgorithm):
         if d >= D:
             raise ValueError("d must be smaller than D")
 
-        n, _, q = self.get_reduced_parameters()
-        nms0 = NMonomialSeries(n=k, q=q, max_prec=D + 1)
-        nms1 = NMonomialSeries(n=n - k, q=q, max_prec=D + 1)
-
-        ncols = 0
-        for dk in range(d + 1, D + 1):
-            ncols += sum(
-                [
-                    nms0.nmonomials_of_degree(dk) * nms1.nmonomials_of_degree(dp)
-                    for dp in range(D - dk + 1)
-                ]
-            )
-
-        return ncols
+        n, _, _ = self.get_reduced_parameters()
+        table = self._monomial_count_table(D)
+        nmonomials_k = table.monomials_of_degree(k)
+        nmonomials_up_to_degree_n_k = table.monomials_up_to_degree(n - k)
+        return sum(nmonomials_k[dk] * nmonomials_up_to_degree_n_k[D - dk] for dk in range(d + 1, D + 1))
 
     def _ncols_in_linearization_step(self, k: int, d: int):
         """Returns the number of columns involved in the linearization step.
@@ -191,7 +181,16 @@ class Crossbred(MQAlgorithm):
              >>> E._ncols_in_linearization_step(4, 3)
              35
         """
-        return nmonomials_up_to_degree(d, k, q=self.problem.order_of_the_field())
+        return self._monomial_count_table(d).monomials_up_to_degree(k)[d]
+
+    def _monomial_count_table(self, degree: int):
+        """Return the table of monomial counts of the reduced problem covering degrees up to `max(degree, max_D)`.
+
+        Args:
+            degree (int): The maximal degree needed.
+        """
+        n, m, q = self.get_reduced_parameters()
+        return monomial_count_table(n, m, q, max(degree, self.max_D))
 
     def _C(self, parameters: dict):
         k, D, d = parameters["k"], parameters["D"], parameters["d"]
@@ -201,15 +200,10 @@ class Crossbred(MQAlgorithm):
             parameters["q"],
             parameters["max_D"],
         )
-        Hk = HilbertSeries(n=k, degrees=[2] * m, q=q)
-        N = NMonomialSeries(n=n - k, q=q, max_prec=max_D + 1)
-        out = sum(
-            [
-                Hk.coefficient_of_degree(i) * N.nmonomials_of_degree(D - i)
-                for i in range(d + 1)
-            ]
-        )
-        return out
+        table = monomial_count_table(n, m, q, max(max_D, D))
+        Hk = table.hilbert_coefficients(k)
+        N = table.monomials_of_degree(n - k)
+        return sum(Hk[i] * N[D - i] for i in range(d + 1))
 
     # TODO: Add reference to the crossbred paper (Remark 1).
     def _valid_choices(self):
@@ -221,6 +215,10 @@ class Crossbred(MQAlgorithm):
             >>> E = Crossbred(MQProblem(n=10, m=12, q=5))
             >>> len([x for x in E._valid_choices()])
             135
+            >>> from cryptographic_estimators.MQEstimator.series.hilbert import hilbert_series
+            >>> E = Crossbred(MQProblem(n=10, m=12, q=5), max_D=3)  # the table misses the coefficients for k >= 8
+            >>> len([x for x in E._valid_choices()]), hilbert_series(10, [2]*12, q=5).precision
+            (10, 24)
         """
 
         new_ranges = self._fix_ranges_for_already_set_parameters()
@@ -228,28 +226,25 @@ class Crossbred(MQAlgorithm):
         n, m, q = self.get_reduced_parameters()
         max_D = self.max_D
 
-        Hn = HilbertSeries(n=n, degrees=[2] * m, q=q)
+        table = self._monomial_count_table(max_D)
+        Hn_up_to_degree = table.hilbert_coefficients_up_to_degree(n)
         k = new_ranges["k"]["min"]
         stop = False
         while not stop:
 
-            Hk = HilbertSeries(n=k, degrees=[2] * m, q=q)
-            h_k_d_reg = Hk.first_nonpositive_coefficient()
-            N = NMonomialSeries(n=n - k, q=q, max_prec=max_D + 1)
+            Hk = table.hilbert_coefficients(k)
+            Hk_up_to_degree = table.hilbert_coefficients_up_to_degree(k)
+            h_k_d_reg = table.first_nonpositive_hilbert_coefficient(k)
+            if h_k_d_reg is None or h_k_d_reg >= 2 * m:
+                # the coefficient is searched within the default precision 2m of the series, beyond it this raises
+                h_k_d_reg = hilbert_series(n=k, degrees=[2] * m, q=q).first_nonpositive_coefficient()
+            N = table.monomials_up_to_degree(n - k)
             for D in range(2, self._max_D + 1):
+                # C_D_d = sum(Hk[i] * N[D - i] for i in range(d + 1)), accumulated over d
+                C_D_d = Hk[0] * N[D]
                 for d in range(1, min(h_k_d_reg, D)):
-                    C_D_d = sum(
-                        [
-                            Hk.coefficient_of_degree(i)
-                            * N.nmonomials_up_to_degree(D - i)
-                            for i in range(d + 1)
-                        ]
-                    )
-                    coefficient_D_d = (
-                        C_D_d
-                        - Hn.coefficient_up_to_degree(D)
-                        - Hk.coefficient_up_to_degree(d)
-                    )
+                    C_D_d += Hk[d] * N[D - d]
+                    coefficient_D_d = C_D_d - Hn_up_to_degree[D] - Hk_up_to_degree[d]
                     if (
                         0 <= coefficient_D_d
                         and new_ranges["D"]["min"] <= D <= new_ranges["D"]["max"]
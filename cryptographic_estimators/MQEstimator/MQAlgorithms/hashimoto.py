@@ -22,7 +22,6 @@ from ...MQEstimator.mq_problem import MQProblem
 from ..mq_constants import MQ_LAS_VEGAS
 from ...MQEstimator.MQAlgorithms.booleansolve_fxl import BooleanSolveFXL
 from math import log2, inf
-import pytest
 
 
 class Hashimoto(MQAlgorithm):
@@ -16,7 +16,8 @@
 # ****************************************************************************
 
 
-from ..MQEstimator.series.hilbert import HilbertSeries
+from ..MQEstimator.series.hilbert import hilbert_series, quadratic_first_nonpositive_coefficient, \
+    quadratic_first_nonpositive_coefficients
 
 
 def generic_system(n: int, degrees: list[int], q=None):
@@ -112,7 +113,7 @@ def semi_regular_system(n: int, degrees: list[int], q=None):
         raise ValueError(
             "the number of polynomials must be >= than the number of variables")
 
-    s = HilbertSeries(n, degrees, q=q)
+    s = hilbert_series(n, degrees, q=q)
     return s.first_nonpositive_coefficient()
 
 
@@ -132,5 +133,51 @@ def quadratic_system(n: int, m: int, q=None):
         3
         >>> degree_of_regularity.quadratic_system(15, 15)
         16
+
+    Tests:
+        >>> def outcome(f, *args):
+        ...     try:
+        ...         return f(*args)
+        ...     except ValueError as e:
+        ...         return str(e)
+        >>> all(outcome(degree_of_regularity.quadratic_system, n, m, q)
+        ...     == outcome(degree_of_regularity.generic_system, n, [2] * m, q)
+        ...     for m in range(1, 30) for n in range(1, m + 1) for q in [None, 2, 3, 4, 7, 31])
+        True
+        >>> degree_of_regularity.quadratic_system(10, 9)
+        Traceback (most recent call last):
+        ...
+        ValueError: degree of regularity is defined for system with n <= m
+    """
+    if n > m:
+        raise ValueError(
+            "degree of regularity is defined for system with n <= m")
+
+    return quadratic_first_nonpositive_coefficient(n, m, q=q)
+
+
+def quadratic_system_grid(ns: list[int], ms: list[int], q=None):
+    """Compute the degrees of regularity for quadratic systems with all combinations of `n` in `ns` and `m` in `ms`.
+
+    For each number of polynomials the series of all numbers of variables are derived in a single pass, see
+    `series.hilbert.quadratic_first_nonpositive_coefficients`. Combinations with n > m are omitted.
+
+    Args:
+        ns (list[int]): The numbers of variables.
+        ms (list[int]): The numbers of polynomials.
+        q (Optional[int]): The order of the finite field. Defaults to `None`.
+
+    Returns:
+        dict: Maps `(n, m)` to the degree of regularity (or None if it exceeds the precision 2m).
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator import degree_of_regularity
+        >>> degree_of_regularity.quadratic_system_grid([10, 15], [15, 20], q=2)
+        {(10, 15): 3, (15, 15): 4, (10, 20): 3, (15, 20): 4}
     """
-    return generic_system(n, [2] * m, q=q)
+    degrees = dict()
+    for m in ms:
+        valid = [n for n in ns if n <= m]
+        for n, degree in quadratic_first_nonpositive_coefficients(valid, m, q=q).items():
+            degrees[n, m] = degree
+    return degrees
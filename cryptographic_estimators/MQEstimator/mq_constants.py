@@ -23,3 +23,8 @@ MQ_FIELD_SIZE = "field size"
 MQ_LAS_VEGAS = "las_vegas"
 MQ_DETERMINISTIC = "deterministic"
 MQ_VARIANT = "variant"
+
+# maximal number of Hilbert series kept in the process-wide cache (see `series.hilbert.hilbert_series`)
+MQ_HILBERT_SERIES_CACHE_SIZE = 1024
+# maximal number of monomial count tables kept in the process-wide cache (see `series.monomial_count_table`)
+MQ_MONOMIAL_COUNT_TABLE_CACHE_SIZE = 64
@@ -1,2 +1,3 @@
-from .hilbert import HilbertSeries
-from .nmonomial import NMonomialSeries
\ No newline at end of file
+from .hilbert import HilbertSeries, hilbert_series
+from .monomial_count_table import MonomialCountTable, monomial_count_table
+from .nmonomial import NMonomialSeries
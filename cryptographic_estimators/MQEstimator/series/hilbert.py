@@ -17,18 +17,21 @@
 
 
 from cryptographic_estimators.helper import is_prime_power
+from cryptographic_estimators.MQEstimator.mq_constants import MQ_HILBERT_SERIES_CACHE_SIZE
 from flint import fmpq_series as power_series
+from functools import lru_cache
 from math import prod
 
 
 class HilbertSeries(object):
-    def __init__(self, n: int, degrees: list[int], q=None):
+    def __init__(self, n: int, degrees: list[int], q=None, prec=None):
         """Construct an instance of Hilbert series.
 
         Args:
             n (int): The number of variables.
             degrees (list[int]): A list of integers representing the degree of the polynomials.
             q (int, optional): The order of the finite field. Defaults to None.
+            prec (int, optional): The precision of the series. Defaults to twice the number of polynomials.
 
         Examples:
             >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeries
@@ -43,23 +46,52 @@ class HilbertSeries(object):
         self._q = q
         self._nvariables = n
         self._degrees = degrees
+        if q is not None and not is_prime_power(q):
+            raise ValueError("The order of finite field q must be a prime power.")
+
+        self._first_nonpositive_coefficient = None
+        self._first_nonpositive_coefficient_up_to_degree = None
         # Precision sufficient for systems with variables not exceeding equations.
-        self._prec = 2 * len(self._degrees)
-        self._gen = power_series([0, 1], prec=self._prec)
-        x = self._gen
-        if q is not None:
-            if not is_prime_power(q):
-                raise ValueError("The order of finite field q must be a prime power.")
-            if q < 2 * len(self._degrees):
-                self._series = (
-                    prod([(1 - x**d) / (1 - x ** (d * q)) for d in degrees])
-                    * ((1 - x**q) / (1 - x)) ** n
-                )
-            else:
-                self._series = prod([1 - x**d for d in degrees]) / (1 - x) ** n
+        self._prec = 0
+        self.extend_precision(2 * len(self._degrees) if prec is None else prec)
+
+    def extend_precision(self, prec: int):
+        """Increase the precision of the series to `prec` in place.
+
+        The series is only recomputed if `prec` exceeds the current precision.
+
+        Args:
+            prec (int): The new precision of the series.
+
+        Examples:
+            >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeries
+            >>> H = HilbertSeries(11, [2]*3, q=2)
+            >>> H.first_nonpositive_coefficient()
+            Traceback (most recent call last):
+            ...
+            ValueError: Unable to find a nonpositive coefficient in the serie.
+            >>> H.extend_precision(12)
+            >>> H.precision, H.first_nonpositive_coefficient()
+            (12, 6)
+        """
+        if prec <= self._prec:
+            return
+
+        degrees, n, q = self._degrees, self._nvariables, self._q
+        x = power_series([0, 1], prec=prec)
+        # The field equations only affect the coefficients of degree at least q.
+        if q is not None and q < prec:
+            series = (
+                prod([(1 - x**d) / (1 - x ** (d * q)) for d in degrees])
+                * ((1 - x**q) / (1 - x)) ** n
+            )
         else:
-            self._series = prod([1 - x**d for d in degrees]) / (1 - x) ** n
-        self._series_up_to_degree = self._series / (1 - x)
+            series = prod([1 - x**d for d in degrees]) / (1 - x) ** n
+
+        self._gen = x
+        self._series = series
+        self._series_up_to_degree = series / (1 - x)
+        self._prec = prec
 
     @property
     def _hilbert_series(self):
@@ -175,11 +207,15 @@ class HilbertSeries(object):
             >>> H.first_nonpositive_coefficient()
             4
         """
-        serie = self._series
-        for d in range(self.precision):
-            if serie[d] <= 0:
-                return int(d)
-        raise ValueError("Unable to find a nonpositive coefficient in the serie.")
+        if self._first_nonpositive_coefficient is None:
+            serie = self._series
+            for d in range(self.precision):
+                if serie[d] <= 0:
+                    self._first_nonpositive_coefficient = int(d)
+                    break
+            else:
+                raise ValueError("Unable to find a nonpositive coefficient in the serie.")
+        return self._first_nonpositive_coefficient
 
     def first_nonpositive_coefficient_up_to_degree(self):
         """Return the first non-positive integer of the serie self._series/(1-x).
@@ -190,15 +226,230 @@ class HilbertSeries(object):
             >>> H.first_nonpositive_coefficient_up_to_degree()
             5
         """
-        for d in range(self.precision):
-            if self._series_up_to_degree[d] <= 0:
-                return int(d)
-        raise ValueError(
-            "Unable to find a nonpositive coefficient in the up_to_degree serie."
-        )
+        if self._first_nonpositive_coefficient_up_to_degree is None:
+            serie = self._series_up_to_degree
+            for d in range(self.precision):
+                if serie[d] <= 0:
+                    self._first_nonpositive_coefficient_up_to_degree = int(d)
+                    break
+            else:
+                raise ValueError(
+                    "Unable to find a nonpositive coefficient in the up_to_degree serie."
+                )
+        return self._first_nonpositive_coefficient_up_to_degree
 
     def __repr__(self):
         text = f"Hilbert series for system with {self.nvariables} variables and {self.npolynomials} polynomials"
         if self._q is not None:
             text += f" over F_{self._q}"
         return text
+
+
+@lru_cache(maxsize=MQ_HILBERT_SERIES_CACHE_SIZE)
+def _shared_hilbert_series(n: int, degrees: tuple, q):
+    return HilbertSeries(n, list(degrees), q=q)
+
+
+def hilbert_series(n: int, degrees: list[int], q=None):
+    """Return the Hilbert series of a system with the default precision, shared by all callers in the process.
+
+    The series are kept in a bounded LRU cache keyed by the number of variables, the multiset of degrees and `q`.
+    As the derived quantities (e.g. the first non-positive coefficient) are memoized by the series, they are computed
+    at most once per system as well. The shared series must not be modified (e.g. by `extend_precision`), as this
+    would change the results of the other callers. Callers needing a higher precision construct their own series.
+
+    Args:
+        n (int): The number of variables.
+        degrees (list[int]): A list of integers representing the degree of the polynomials.
+        q (int, optional): The order of the finite field. Defaults to None.
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator.series.hilbert import hilbert_series
+        >>> H = hilbert_series(9, [3, 2, 2] + [2]*10, q=5)
+        >>> H is hilbert_series(9, [2]*12 + [3], q=5)
+        True
+        >>> H is hilbert_series(9, [2]*12 + [3], q=7)
+        False
+        >>> H.precision
+        26
+    """
+    return _shared_hilbert_series(n, tuple(sorted(degrees)), q)
+
+
+hilbert_series.cache_info = _shared_hilbert_series.cache_info
+hilbert_series.cache_clear = _shared_hilbert_series.cache_clear
+
+
+def _quadratic_differential_equation(n: int, m: int, q, prec: int, up_to_degree: bool):
+    """Return `(e, A)` such that the Hilbert series S of `m` quadratic polynomials in `n` variables satisfies
+    `(1 - x^e) S' = A S` for the polynomial `A`.
+
+    Args:
+        n (int): The number of variables.
+        m (int): The number of polynomials.
+        q (int): The order of the finite field or None.
+        prec (int): The precision of the series, which decides whether the field equations are taken into account.
+        up_to_degree (bool): Use the series S / (1 - x) instead.
+    """
+    if q is not None and q < prec:
+        # S = ((1 - x^2) / (1 - x^(2q)))^m * ((1 - x^q) / (1 - x))^n
+        e = 2 * q
+        A = [n] * e
+        for i in range(q):
+            A[2 * i + 1] -= 2 * m
+        A[q - 1] -= n * q
+        A[e - 1] += 2 * q * m - n * q
+    else:
+        # S = (1 - x^2)^m / (1 - x)^n
+        e = 2
+        A = [n, n - 2 * m]
+
+    if up_to_degree:
+        # (1 - x^e) / (1 - x) = 1 + x + ... + x^(e-1)
+        A = [a + 1 for a in A]
+    return e, A
+
+
+def quadratic_hilbert_coefficients(n: int, m: int, q=None, prec=None, up_to_degree=False):
+    """Yield the coefficients of the Hilbert series of `m` quadratic polynomials in `n` variables one at a time.
+
+    The coefficients coincide with those of `HilbertSeries(n, [2]*m, q=q, prec=prec)`, but are computed by an integer
+    recurrence of length at most 2q, which is derived from the differential equation satisfied by the series.
+
+    Args:
+        n (int): The number of variables.
+        m (int): The number of polynomials.
+        q (int, optional): The order of the finite field. Defaults to None.
+        prec (int, optional): The precision of the series. Defaults to 2m.
+        up_to_degree (bool, optional): Yield the coefficients of the series divided by (1 - x). Defaults to False.
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator.series.hilbert import quadratic_hilbert_coefficients
+        >>> list(quadratic_hilbert_coefficients(5, 7))
+        [1, 5, 8, 0, -14, -14, 0, 8, 5, 1, 0, 0, 0, 0]
+        >>> list(quadratic_hilbert_coefficients(5, 7, up_to_degree=True))
+        [1, 6, 14, 14, 0, -14, -14, -6, -1, 0, 0, 0, 0, 0]
+
+    Tests:
+        >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeries
+        >>> def coefficients(H, u):
+        ...     return [H.coefficient_up_to_degree(d) if u else H.coefficient_of_degree(d) for d in range(H.precision)]
+        >>> all(list(quadratic_hilbert_coefficients(n, m, q, up_to_degree=u)) == coefficients(HilbertSeries(n, [2]*m, q=q), u)
+        ...     for n in range(1, 12) for m in range(n, 16) for q in [None, 2, 3, 4, 7, 31] for u in [False, True])
+        True
+    """
+    if q is not None and not is_prime_power(q):
+        raise ValueError("The order of finite field q must be a prime power.")
+    prec = 2 * m if prec is None else prec
+    e, A = _quadratic_differential_equation(n, m, q, prec, up_to_degree)
+
+    # comparing the coefficients of x^(k-1) in (1 - x^e) S' = A S yields
+    # k s_k = (k - e) s_(k-e) + sum_j A_j s_(k-1-j)
+    s = []
+    for k in range(prec):
+        if k == 0:
+            c = 1
+        else:
+            t = sum(A[j] * s[k - 1 - j] for j in range(min(len(A), k)))
+            if k >= e:
+                t += (k - e) * s[k - e]
+            c = t // k
+        s.append(c)
+        yield c
+
+
+@lru_cache(maxsize=MQ_HILBERT_SERIES_CACHE_SIZE)
+def quadratic_first_nonpositive_coefficient(n: int, m: int, q=None, up_to_degree=False):
+    """Return the index of the first non-positive coefficient of the Hilbert series of a quadratic system.
+
+    Equivalent to `HilbertSeries(n, [2]*m, q=q).first_nonpositive_coefficient()` (or the `_up_to_degree` variant), but
+    the coefficients are generated by `quadratic_hilbert_coefficients` and the computation stops at the first
+    non-positive one.
+
+    Args:
+        n (int): The number of variables.
+        m (int): The number of polynomials.
+        q (int, optional): The order of the finite field. Defaults to None.
+        up_to_degree (bool, optional): Use the series divided by (1 - x). Defaults to False.
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator.series.hilbert import quadratic_first_nonpositive_coefficient
+        >>> quadratic_first_nonpositive_coefficient(10, 15), quadratic_first_nonpositive_coefficient(10, 15, q=2)
+        (4, 3)
+        >>> quadratic_first_nonpositive_coefficient(10, 15, up_to_degree=True)
+        5
+
+    Tests:
+        >>> quadratic_first_nonpositive_coefficient(11, 3, q=2)
+        Traceback (most recent call last):
+        ...
+        ValueError: Unable to find a nonpositive coefficient in the serie.
+    """
+    for d, c in enumerate(quadratic_hilbert_coefficients(n, m, q=q, up_to_degree=up_to_degree)):
+        if c <= 0:
+            return d
+    if up_to_degree:
+        raise ValueError("Unable to find a nonpositive coefficient in the up_to_degree serie.")
+    raise ValueError("Unable to find a nonpositive coefficient in the serie.")
+
+
+def quadratic_first_nonpositive_coefficients(ns: list[int], m: int, q=None, up_to_degree=False):
+    """Return the indices of the first non-positive coefficients for quadratic systems with `m` polynomials and each
+    number of variables in `ns`.
+
+    The series of all systems are derived from each other in a single pass, as increasing the number of variables
+    by one multiplies the series by (1 - x^q) / (1 - x) (or 1 / (1 - x) without field equations), i.e. replaces the
+    coefficients by their sliding window (or prefix) sums.
+
+    Args:
+        ns (list[int]): The numbers of variables.
+        m (int): The number of polynomials.
+        q (int, optional): The order of the finite field. Defaults to None.
+        up_to_degree (bool, optional): Use the series divided by (1 - x). Defaults to False.
+
+    Returns:
+        dict: Maps each number of variables to the index of the first non-positive coefficient, or to None if there is
+            no such coefficient within the precision 2m.
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator.series.hilbert import quadratic_first_nonpositive_coefficients
+        >>> quadratic_first_nonpositive_coefficients([4, 8, 10], 10)
+        {4: 2, 8: 5, 10: 11}
+        >>> quadratic_first_nonpositive_coefficients([4, 8, 10], 10, q=2)
+        {4: 2, 8: 3, 10: 4}
+
+    Tests:
+        >>> from cryptographic_estimators.MQEstimator.series.hilbert import quadratic_first_nonpositive_coefficient
+        >>> def scalar(n, m, q, u):
+        ...     try:
+        ...         return quadratic_first_nonpositive_coefficient(n, m, q, u)
+        ...     except ValueError:
+        ...         return None
+        >>> all(quadratic_first_nonpositive_coefficients(range(1, m + 4), m, q, u)
+        ...     == {n: scalar(n, m, q, u) for n in range(1, m + 4)}
+        ...     for m in range(1, 20) for q in [None, 2, 3, 5, 16] for u in [False, True])
+        True
+    """
+    prec = 2 * m
+    window = q if q is not None and q < prec else prec
+
+    def window_sums(s, w):
+        sums = [0]
+        for c in s:
+            sums.append(sums[-1] + c)
+        return [sums[k + 1] - sums[max(0, k + 1 - w)] for k in range(len(s))]
+
+    ns = sorted(set(ns))
+    result = dict()
+    if not ns:
+        return result
+
+    n = ns[0]
+    coefficients = list(quadratic_hilbert_coefficients(n, m, q=q, prec=prec))
+    for target in ns:
+        while n < target:
+            coefficients = window_sums(coefficients, window)
+            n += 1
+        series = window_sums(coefficients, prec) if up_to_degree else coefficients
+        result[target] = next((d for d, c in enumerate(series) if c <= 0), None)
+    return result
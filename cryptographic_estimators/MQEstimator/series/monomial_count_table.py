@@ -0,0 +1,198 @@
+# ****************************************************************************
+# Copyright 2023 Technology Innovation Institute
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ****************************************************************************
+
+
+from cryptographic_estimators.helper import is_prime_power
+from cryptographic_estimators.MQEstimator.mq_constants import MQ_MONOMIAL_COUNT_TABLE_CACHE_SIZE
+from functools import lru_cache
+from itertools import accumulate
+
+
+def _multiply_by_truncated_geometric_series(coefficients: list, q: int):
+    """Return the coefficients of the series times `(1 - x^q) / (1 - x)`, truncated to the same precision.
+
+    Args:
+        coefficients (list): The coefficients of the series.
+        q (int): The order of the finite field.
+    """
+    partial_sums = list(accumulate(coefficients))
+    return partial_sums[:q] + [partial_sums[d] - partial_sums[d - q] for d in range(q, len(coefficients))]
+
+
+class MonomialCountTable(object):
+    def __init__(self, n: int, m: int, q: int, max_D: int):
+        """Construct the tables of monomial counts and Hilbert series coefficients for every number of variables up to `n`.
+
+        For every `n' <= n` and every degree `d <= max_D`, the table holds the number of monomials of degree `d`
+        (resp. up to degree `d`) in `n'` variables over F_q, and the coefficients of the Hilbert series of `m`
+        quadratic polynomials in `n'` variables over F_q (resp. of the series divided by `1 - x`). The rows are
+        computed from each other with the recurrence of multiplying by `(1 - x^q) / (1 - x)`, so building the whole
+        table costs as much as a handful of series.
+
+        Args:
+            n (int): The maximal number of variables.
+            m (int): The number of quadratic polynomials.
+            q (int): The order of the finite field.
+            max_D (int): The maximal degree.
+
+        Examples:
+            >>> from cryptographic_estimators.MQEstimator.series.monomial_count_table import MonomialCountTable
+            >>> T = MonomialCountTable(n=6, m=8, q=5, max_D=6)
+            >>> T
+            Table of monomial counts up to degree 6 in at most 6 variables over F_5
+            >>> T.monomials_of_degree(6)
+            (1, 6, 21, 56, 126, 246, 426)
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator.series.nmonomial import NMonomialSeries
+            >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeries
+            >>> T = MonomialCountTable(n=9, m=12, q=3, max_D=10)
+            >>> all(T.monomials_of_degree(i) == tuple(NMonomialSeries(i, q=3, max_prec=11).nmonomials_of_degree(d)
+            ...     for d in range(11)) for i in range(10))
+            True
+            >>> all(T.monomials_up_to_degree(i) == tuple(NMonomialSeries(i, q=3, max_prec=11).nmonomials_up_to_degree(d)
+            ...     for d in range(11)) for i in range(10))
+            True
+            >>> all(T.hilbert_coefficients(i) == tuple(HilbertSeries(i, [2]*12, q=3, prec=11).coefficient_of_degree(d)
+            ...     for d in range(11)) for i in range(10))
+            True
+            >>> H = HilbertSeries(7, [2]*12, q=3, prec=11)
+            >>> T.hilbert_coefficients_up_to_degree(7) == tuple(H.coefficient_up_to_degree(d) for d in range(11))
+            True
+            >>> T.first_nonpositive_hilbert_coefficient(7) == H.first_nonpositive_coefficient()
+            True
+            >>> MonomialCountTable(n=11, m=3, q=2, max_D=5).first_nonpositive_hilbert_coefficient(11) is None
+            True
+        """
+        if not is_prime_power(q):
+            raise ValueError("the order of finite field q must be a prime power")
+
+        self._n = n
+        self._m = m
+        self._q = q
+        self._max_D = max_D
+        prec = max_D + 1
+
+        # The field equations are always taken into account: they only affect the coefficients of degree at least q,
+        # hence the coefficients coincide with those of the series of smaller precision.
+        of_degree = [1] + [0] * max_D
+        self._of_degree = [tuple(of_degree)]
+        for _ in range(n):
+            of_degree = _multiply_by_truncated_geometric_series(of_degree, q)
+            self._of_degree.append(tuple(of_degree))
+        self._up_to_degree = [tuple(accumulate(row)) for row in self._of_degree]
+
+        # Hilbert series of the polynomials in zero variables, i.e. ((1 - x^2) / (1 - x^(2q)))^m
+        hilbert = [1] + [0] * max_D
+        for _ in range(m):
+            hilbert = [hilbert[d] - hilbert[d - 2] if d >= 2 else hilbert[d] for d in range(prec)]
+            for d in range(2 * q, prec):
+                hilbert[d] += hilbert[d - 2 * q]
+        self._hilbert = [tuple(hilbert)]
+        for _ in range(n):
+            hilbert = _multiply_by_truncated_geometric_series(hilbert, q)
+            self._hilbert.append(tuple(hilbert))
+        self._hilbert_up_to_degree = [tuple(accumulate(row)) for row in self._hilbert]
+
+        self._first_nonpositive = [next((d for d, c in enumerate(row) if c <= 0), None) for row in self._hilbert]
+
+    @property
+    def max_D(self):
+        """Return the maximal degree of the table."""
+        return self._max_D
+
+    def monomials_of_degree(self, nvariables: int):
+        """Return the numbers of monomials of degree 0, ..., max_D in `nvariables` variables.
+
+        Args:
+            nvariables (int): The number of variables (at most `n`).
+        """
+        return self._of_degree[nvariables]
+
+    def monomials_up_to_degree(self, nvariables: int):
+        """Return the numbers of monomials up to degree 0, ..., max_D in `nvariables` variables.
+
+        Args:
+            nvariables (int): The number of variables (at most `n`).
+
+        Examples:
+            >>> from cryptographic_estimators.MQEstimator.series.monomial_count_table import MonomialCountTable
+            >>> T = MonomialCountTable(n=6, m=8, q=5, max_D=6)
+            >>> T.monomials_up_to_degree(6)
+            (1, 7, 28, 84, 210, 456, 882)
+        """
+        return self._up_to_degree[nvariables]
+
+    def hilbert_coefficients(self, nvariables: int):
+        """Return the coefficients of degree 0, ..., max_D of the Hilbert series in `nvariables` variables.
+
+        Args:
+            nvariables (int): The number of variables (at most `n`).
+
+        Examples:
+            >>> from cryptographic_estimators.MQEstimator.series.monomial_count_table import MonomialCountTable
+            >>> T = MonomialCountTable(n=6, m=8, q=5, max_D=6)
+            >>> T.hilbert_coefficients(4)
+            (1, 4, 2, -12, -17, 4, 12)
+        """
+        return self._hilbert[nvariables]
+
+    def hilbert_coefficients_up_to_degree(self, nvariables: int):
+        """Return the coefficients of degree 0, ..., max_D of the Hilbert series in `nvariables` variables divided
+        by `1 - x`.
+
+        Args:
+            nvariables (int): The number of variables (at most `n`).
+        """
+        return self._hilbert_up_to_degree[nvariables]
+
+    def first_nonpositive_hilbert_coefficient(self, nvariables: int):
+        """Return the degree of the first non-positive coefficient of the Hilbert series in `nvariables` variables, or
+        None if all coefficients up to degree max_D are positive.
+
+        Args:
+            nvariables (int): The number of variables (at most `n`).
+
+        Examples:
+            >>> from cryptographic_estimators.MQEstimator.series.monomial_count_table import MonomialCountTable
+            >>> T = MonomialCountTable(n=6, m=8, q=5, max_D=6)
+            >>> T.first_nonpositive_hilbert_coefficient(4)
+            3
+        """
+        return self._first_nonpositive[nvariables]
+
+    def __repr__(self):
+        return (f"Table of monomial counts up to degree {self._max_D} in at most {self._n} variables "
+                f"over F_{self._q}")
+
+
+@lru_cache(maxsize=MQ_MONOMIAL_COUNT_TABLE_CACHE_SIZE)
+def monomial_count_table(n: int, m: int, q: int, max_D: int):
+    """Return the `MonomialCountTable` for the given parameters, shared by all callers in the process.
+
+    Args:
+        n (int): The maximal number of variables.
+        m (int): The number of quadratic polynomials.
+        q (int): The order of the finite field.
+        max_D (int): The maximal degree.
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator.series.monomial_count_table import monomial_count_table
+        >>> monomial_count_table(10, 12, 5, 10) is monomial_count_table(10, 12, 5, 10)
+        True
+    """
+    return MonomialCountTable(n, m, q, max_D)
@@ -16,7 +16,20 @@
 # ****************************************************************************
 
 
-from ..MQEstimator.series.hilbert import HilbertSeries
+from ..MQEstimator.series.hilbert import hilbert_series, quadratic_first_nonpositive_coefficient, \
+    quadratic_first_nonpositive_coefficients
+
+
+def _check_number_of_polynomials(n: int, m: int, q=None):
+    """Raise a ValueError if the witness degree is not defined for `m` polynomials in `n` variables."""
+    if m <= n and q is None:
+        raise ValueError(
+            "The number of polynomials must be greater than the number of variables"
+        )
+    elif m < n and q is not None:
+        raise ValueError(
+            "The number of polynomials must be greater than or equal to the number of variables"
+        )
 
 
 def semi_regular_system(n: int, degrees: list[int], q=None):
@@ -34,17 +47,8 @@ def semi_regular_system(n: int, degrees: list[int], q=None):
         >>> witness_degree.semi_regular_system(10, [2]*15, q=2)
         4
     """
-    m = len(degrees)
-    if m <= n and q is None:
-        raise ValueError(
-            "The number of polynomials must be greater than the number of variables"
-        )
-    elif m < n and q is not None:
-        raise ValueError(
-            "The number of polynomials must be greater than or equal to the number of variables"
-        )
-
-    serie = HilbertSeries(n, degrees, q=q)
+    _check_number_of_polynomials(n, len(degrees), q)
+    serie = hilbert_series(n, degrees, q=q)
     return serie.first_nonpositive_coefficient_up_to_degree()
 
 
@@ -64,5 +68,48 @@ def quadratic_system(n: int, m: int, q=None):
         4
         >>> witness_degree.quadratic_system(15, 15, q=7)
         12
+
+    Tests:
+        >>> def outcome(f, *args):
+        ...     try:
+        ...         return f(*args)
+        ...     except ValueError as e:
+        ...         return str(e)
+        >>> all(outcome(witness_degree.quadratic_system, n, m, q) == outcome(witness_degree.semi_regular_system, n, [2] * m, q)
+        ...     for m in range(1, 30) for n in range(1, m + 1) for q in [None, 2, 3, 4, 7, 31])
+        True
+        >>> witness_degree.quadratic_system(15, 15)
+        Traceback (most recent call last):
+        ...
+        ValueError: The number of polynomials must be greater than the number of variables
+    """
+    _check_number_of_polynomials(n, m, q)
+    return quadratic_first_nonpositive_coefficient(n, m, q=q, up_to_degree=True)
+
+
+def quadratic_system_grid(ns: list[int], ms: list[int], q=None):
+    """Returns the witness degrees for quadratic systems with all combinations of `n` in `ns` and `m` in `ms`.
+
+    For each number of polynomials the series of all numbers of variables are derived in a single pass, see
+    `series.hilbert.quadratic_first_nonpositive_coefficients`. Combinations for which the witness degree is not
+    defined are omitted.
+
+    Args:
+        ns (list[int]): The numbers of variables.
+        ms (list[int]): The numbers of polynomials.
+        q (Optional[int]): The order of the finite field (default is None).
+
+    Returns:
+        dict: Maps `(n, m)` to the witness degree (or None if it exceeds the precision 2m).
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator import witness_degree
+        >>> witness_degree.quadratic_system_grid([10, 15], [15, 20], q=7)
+        {(10, 15): 5, (15, 15): 12, (10, 20): 4, (15, 20): 7}
     """
-    return semi_regular_system(n, [2] * m, q=q)
+    degrees = dict()
+    for m in ms:
+        valid = [n for n in ns if m > n or (m == n and q is not None)]
+        for n, degree in quadratic_first_nonpositive_coefficients(valid, m, q=q, up_to_degree=True).items():
+            degrees[n, m] = degree
+    return degrees
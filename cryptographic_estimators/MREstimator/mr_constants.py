@@ -28,3 +28,5 @@ MR_NUMBER_OF_KERNEL_VECTORS_TO_GUESS = "a"
 MR_NUMBER_OF_COEFFICIENTS_TO_GUESS = "lv"
 MR_REDUCED_NUMBER_OF_COLUMNS = "nprime"
 MR_LINEAR_VARIABLES_DEGREE = "b"
+
+MR_MINORS_DETERMINANT_CACHE_SIZE = 1024
@@ -20,7 +20,6 @@ from .mr_algorithm import MRAlgorithm
 from .mr_problem import MRProblem
 from ..base_estimator import BaseEstimator
 from math import inf
-import pytest
 
 
 class MREstimator(BaseEstimator):
@@ -20,9 +20,9 @@ from enum import Enum
 from itertools import product
 from math import comb as binomial
 from math import inf
-from sympy import Poly, QQ
-from sympy.abc import t
-from sympy.polys.matrices import DomainMatrix
+from functools import lru_cache
+from flint import fmpz_poly
+from .mr_constants import MR_MINORS_DETERMINANT_CACHE_SIZE
 
 
 class Variant(Enum):
@@ -55,43 +55,121 @@ def _binomial_mult(n, m, i, j, l):
     return binomial(m - i, l) * binomial(n - j, l)
 
 
-def entry_i_j_of_A(n, m, t, i, j):
+def entry_i_j_of_A(n, m, i, j):
+    """Returns the entry `(i, j)` of the matrix `A` as an integer polynomial in `t`.
+
+    Args:
+        n (int): Number of columns.
+        m (int): Number of rows.
+        i (int): Row index (starting from 1).
+        j (int): Column index (starting from 1).
+    """
     limit = max(m - i, n - j)
-    return sum([_binomial_mult(n, m, i, j, l) * t ** l for l in range(limit +  1)])
+    return fmpz_poly([_binomial_mult(n, m, i, j, l) for l in range(limit + 1)])
 
 
-def matrix_A(m, n, r, t):
-    A = DomainMatrix.zeros((r, r), QQ[t])
+def matrix_A(m, n, r):
+    """Returns the r x r matrix `A` whose determinant defines the series of the minors, as rows of `fmpz_poly`.
+
+    Args:
+        m (int): Number of rows.
+        n (int): Number of columns.
+        r (int): Target rank.
+    """
     square_r = range(1, r + 1)
-    for i, j in product(square_r, square_r):
-        entry_i_j = entry_i_j_of_A(n, m, t, i, j)
-        A[i-1,j-1] = QQ[t].from_sympy(entry_i_j)
-    return A
+    return [[entry_i_j_of_A(n, m, i, j) for j in square_r] for i in square_r]
+
 
+@lru_cache(maxsize=MR_MINORS_DETERMINANT_CACHE_SIZE)
+def determinant_of_A(m, n, r):
+    """Returns the determinant of `matrix_A(m, n, r)` as an `fmpz_poly`.
 
-def determinant_of_A(m, n, r, t):
-    A = matrix_A(m, n, r, t)
-    return A.det()
+    The determinant is computed by fraction-free (Bareiss) elimination, in which every division is exact, and cached
+    per `(m, n, r)`.
+
+    Args:
+        m (int): Number of rows.
+        n (int): Number of columns.
+        r (int): Target rank.
+
+    Examples:
+        >>> from cryptographic_estimators.MREstimator.mr_helper import determinant_of_A
+        >>> determinant_of_A(5, 4, 2)
+        6*x^5 + 16*x^4 + 21*x^3 + 6*x^2 + x
+
+    Tests:
+        >>> determinant_of_A(3, 3, 0)
+        1
+        >>> determinant_of_A(3, 3, 1)
+        x^2 + 4*x + 1
+    """
+    if r == 0:
+        return fmpz_poly([1])
+
+    A = matrix_A(m, n, r)
+    sign, previous_pivot = 1, fmpz_poly([1])
+    for k in range(r - 1):
+        if A[k][k] == 0:
+            pivot_row = next((i for i in range(k + 1, r) if A[i][k] != 0), None)
+            if pivot_row is None:
+                return fmpz_poly()
+            A[k], A[pivot_row] = A[pivot_row], A[k]
+            sign = -sign
+        for i in range(k + 1, r):
+            for j in range(k + 1, r):
+                A[i][j] = (A[k][k] * A[i][j] - A[i][k] * A[k][j]) // previous_pivot
+        previous_pivot = A[k][k]
+    return sign * A[r - 1][r - 1]
 
 
 def minors_series(m, n, k, r):
+    """Returns the polynomial `(1 - t)^((m - r)(n - r) - k - 1) * det(A) / t^binomial(r, 2)` as an `fmpz_poly`.
+
+    Args:
+        m (int): Number of rows.
+        n (int): Number of columns.
+        k (int): Length of the solution vector.
+        r (int): Target rank.
+
+    Examples:
+        >>> from cryptographic_estimators.MREstimator.mr_helper import minors_series
+        >>> minors_series(5, 4, 1, 2).coeffs()
+        [1, 2, 3, -36, 45, -6, -7, -8, 6]
+    """
     exp = (m - r) * (n - r) - (k + 1)
-    num = QQ[t].from_sympy((1 - t) ** exp) * determinant_of_A(m, n, r, t)
-    den = QQ[t].from_sympy((t ** binomial(r, 2)))
-    series = num/den
-    return series
+    shifted_determinant = fmpz_poly(determinant_of_A(m, n, r).coeffs()[binomial(r, 2):])
+    return fmpz_poly([1, -1]) ** exp * shifted_determinant
+
 
 def minors_polynomial_degree(m, n_reduced, k_reduced, r):
-    poly = 0
+    """Returns the degree of the truncation of `minors_series` before its first non-positive coefficient.
+
+    Args:
+        m (int): Number of rows.
+        n_reduced (int): Number of columns.
+        k_reduced (int): Length of the solution vector.
+        r (int): Target rank.
+
+    Examples:
+        >>> from cryptographic_estimators.MREstimator.mr_helper import minors_polynomial_degree
+        >>> minors_polynomial_degree(9, 10, 15, 4)
+        4
+
+    Tests:
+        >>> minors_polynomial_degree(5, 4, 6, 2)
+        inf
+    """
     if k_reduced >= (m - r) * (n_reduced - r):
         return inf
     series = minors_series(m, n_reduced, k_reduced, r)
-    series_coeffs = list(reversed(Poly(QQ[t].to_sympy(series)).all_coeffs())) # cast from PolyElement to Poly
+    series_coeffs = series.coeffs()
+    degree = -inf
     for D in range(series.degree()):
-        poly += series_coeffs[D] * QQ[t].from_sympy(t) ** D
+        if series_coeffs[D] != 0:
+            degree = D
         if series_coeffs[D + 1] <= 0:
             break
-    return poly.degree()
+    return degree
 
 
 def extended_binomial(n, k):
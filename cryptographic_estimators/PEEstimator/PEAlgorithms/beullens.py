@@ -88,8 +88,9 @@ class Beullens(PEAlgorithm):
 
         list_size = (search_space_size + log2(2 * log2(n))) / 2
 
-        self.SDFqEstimator = SDFqEstimator(n=n, k=k, w=w, q=q, bit_complexities=0, nsolutions=0,
-                                           memory_bound=self.problem.memory_bound, **self._SDFqEstimator_parameters)
+        self.SDFqEstimator = self._sub_estimators.get(SDFqEstimator, n=n, k=k, w=w, q=q, bit_complexities=0,
+                                                      nsolutions=0, memory_bound=self.problem.memory_bound,
+                                                      **self._SDFqEstimator_parameters)
         c_isd = self.SDFqEstimator.fastest_algorithm().time_complexity()
         m_isd = self.SDFqEstimator.fastest_algorithm().memory_complexity()
         list_computation = c_isd - search_space_size + list_size + 1
@@ -79,8 +79,9 @@ class Leon(PEAlgorithm):
         n, k, q, _ = self.problem.get_parameters()
         w = parameters["w"]
         N = number_of_weight_d_codewords(n, k, q, w)
-        self.SDFqEstimator = SDFqEstimator(n=n, k=k, w=w, q=q, nsolutions=0, memory_bound=self.problem.memory_bound,
-                                           bit_complexities=0, **self._SDFqEstimator_parameters)
+        self.SDFqEstimator = self._sub_estimators.get(SDFqEstimator, n=n, k=k, w=w, q=q, nsolutions=0,
+                                                      memory_bound=self.problem.memory_bound, bit_complexities=0,
+                                                      **self._SDFqEstimator_parameters)
         c_isd = self.SDFqEstimator.fastest_algorithm().time_complexity()
         return c_isd + log2(ceil(2 * (0.57 + log(N))))
 
@@ -23,6 +23,11 @@ PE_FIELD_SIZE = "field size"
 PE_HULL_DIMENSION = "hull dimension"
 PE_SD_PARAMETERS = "sd_parameters"
 
+# number of random vectors whose median orbit size is used by Beullens algorithm (see `pe_helper`)
+PE_ORBIT_SAMPLES = 2**11
+# maximal number of memoized median orbit sizes
+PE_ORBIT_CACHE_SIZE = 4096
+
 
 class VerboseInformation(Enum):
     LIST_COMPUTATION = "list_computation"
@@ -16,7 +16,6 @@
 # ****************************************************************************
 
 
-import pytest
 from ..PEEstimator.pe_algorithm import PEAlgorithm
 from ..PEEstimator.pe_problem import PEProblem
 from ..base_estimator import BaseEstimator
@@ -40,7 +39,7 @@ class PEEstimator(BaseEstimator):
         if not kwargs.get("excluded_algorithms"):
             kwargs["excluded_algorithms"] = []
 
-        kwargs["excluded_algorithms"] += self.excluded_algorithms_by_default
+        kwargs["excluded_algorithms"] = list(kwargs["excluded_algorithms"]) + self.excluded_algorithms_by_default
         super(PEEstimator, self).__init__(
             PEAlgorithm, PEProblem(n, k, q, memory_bound=memory_bound, **kwargs), **kwargs)
 
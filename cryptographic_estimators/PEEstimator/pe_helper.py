@@ -15,8 +15,10 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ****************************************************************************
 
+from functools import lru_cache
 from math import comb as binomial, log2, factorial
-from random import randint
+import numpy as np
+from .pe_constants import PE_ORBIT_SAMPLES, PE_ORBIT_CACHE_SIZE
 
 
 def gv_distance(n: int, k: int, q: int):
@@ -35,25 +37,72 @@ def number_of_weight_d_codewords(n: int, k: int, q: int, d: int):
     """Returns the number of weight d code words in a (n,k,q) code."""
     return binomial(n, d) * (q - 1) ** d // q ** (n - k)
 
-def random_sparse_vec_orbit(n: int, w: int, q: int):
-    counts = [0] * (q - 1)
-    s = 0
-    while s < w:
-        a = randint(0, q - 2)
-        s += 1
-        counts[a] += 1
-    orbit_size = factorial(n) // factorial(n - w)
-    for c in counts:
-        orbit_size //= factorial(c)
-    return log2(orbit_size)
+def random_sparse_vec_orbits(n: int, w: int, q: int, samples: int, rng: np.random.Generator):
+    """Returns the logarithms of the orbit sizes of `samples` random weight-w vectors of length n over F_q.
 
+    The orbit of a vector with c_1, ..., c_{q-1} entries equal to the nonzero field elements has n! / ((n-w)! c_1! ...
+    c_{q-1}!) elements. For small fields the counts c_i are tabulated directly, otherwise the entries of each vector are
+    sorted, such that log2(c_i!) is the sum of log2(j) over the positions j = 1, ..., c_i within each run of equal
+    entries.
 
+    Args:
+        n (int): Length of the vectors.
+        w (int): Hamming weight of the vectors.
+        q (int): Size of the field.
+        samples (int): Number of vectors.
+        rng (np.random.Generator): Source of randomness.
+
+    Tests:
+        >>> import numpy as np
+        >>> from cryptographic_estimators.PEEstimator.pe_helper import random_sparse_vec_orbits
+        >>> [round(float(i), 10) for i in random_sparse_vec_orbits(10, 4, 2, 2, np.random.default_rng(0))]
+        [7.7142455177, 7.7142455177]
+        >>> A = random_sparse_vec_orbits(50, 20, 7, 100, np.random.default_rng(0))
+        >>> B = random_sparse_vec_orbits(50, 20, 7**3, 100, np.random.default_rng(0))
+        >>> bool(A.min() < A.max() < B.min())
+        True
+        >>> float(random_sparse_vec_orbits(10, 0, 7, 1, np.random.default_rng(0))[0])
+        0.0
+    """
+    entries = rng.integers(q - 1, size=(samples, w))
+    if q - 1 <= w:
+        log2_factorials = np.cumsum(np.log2(np.maximum(np.arange(w + 1), 1)))
+        entries += (q - 1) * np.arange(samples)[:, None]
+        counts = np.bincount(entries.ravel(), minlength=samples * (q - 1)).reshape(samples, q - 1)
+        log2_symmetries = log2_factorials[counts].sum(axis=1)
+    else:
+        entries.sort(axis=1)
+        position = np.broadcast_to(np.arange(w), (samples, w))
+        run_starts = np.ones((samples, w), dtype=bool)
+        run_starts[:, 1:] = entries[:, 1:] != entries[:, :-1]
+        first_in_run = np.maximum.accumulate(np.where(run_starts, position, 0), axis=1)
+        log2_symmetries = np.log2(position - first_in_run + 1).sum(axis=1)
+    return log2(factorial(n) // factorial(n - w)) - log2_symmetries
+
+
+@lru_cache(maxsize=PE_ORBIT_CACHE_SIZE)
 def median_size_of_random_orbit(n: int, w: int, q: int):
-    S = []
-    for x in range(100):
-        S.append(random_sparse_vec_orbit(n, w, q))
-    S.sort()
-    return S[49]
+    """Returns the logarithm of the median orbit size of PE_ORBIT_SAMPLES random weight-w vectors over F_q.
+
+    The vectors are drawn from a generator seeded with `(n, w, q)`, hence the result is reproducible and memoized.
+
+    Args:
+        n (int): Length of the vectors.
+        w (int): Hamming weight of the vectors.
+        q (int): Size of the field.
+
+    Examples:
+        >>> from cryptographic_estimators.PEEstimator.pe_helper import median_size_of_random_orbit
+        >>> round(median_size_of_random_orbit(100, 40, 31), 6)
+        230.70725
+
+    Tests:
+        >>> round(median_size_of_random_orbit(100, 40, 2), 10) == round(log2(binomial(100, 40)), 10)
+        True
+    """
+    rng = np.random.default_rng([n, w, q])
+    S = np.sort(random_sparse_vec_orbits(n, w, q, PE_ORBIT_SAMPLES, rng))
+    return float(S[(PE_ORBIT_SAMPLES - 1) // 2])
 
 
 def hamming_ball(n: int, q: int, w: int):
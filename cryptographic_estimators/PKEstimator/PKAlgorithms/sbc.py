@@ -22,20 +22,43 @@ from ...base_algorithm import optimal_parameter
 from math import factorial, inf, comb as binomial, log2
 from ..pk_helper import gauss_binomial, cost_for_finding_subcode
 from ...SDFqEstimator.sdfq_estimator import SDFqEstimator
+from ...SDEstimator.sd_vectorized_helper import AMBIGUITY_TOLERANCE, OPTIMALITY_TOLERANCE, log2_floor_pow2, \
+    log2_memory_access_cost
+from ...helper import LogBinomialTable
+import numpy as np
 
 
 class SBC(PKAlgorithm):
+    _lower_bound_parameters = ("d", "w")
+
     def __init__(self, problem: PKProblem, **kwargs):
         """Complexity estimate of the SBC algorithm.
 
         The estimates are adapted versions of the code accompanying [SBC22]_, original code is accessible at
         https://github.com/secomms/pkpattack
 
+        Args:
+            problem (PKProblem): PKProblem object including all necessary parameters
+            **kwargs: Additional keyword arguments
+                sd_parameters (dict): Dictionary of parameters for SDFqEstimator used as a subroutine (default: {})
+                vectorized (bool): Preselect the parameters with the log-domain evaluation of whole `(w1, u)` grids,
+                    see `_find_optimal_parameters` (default: True)
+
         Examples:
             >>> from cryptographic_estimators.PKEstimator.PKAlgorithms import SBC
             >>> from cryptographic_estimators.PKEstimator import PKProblem
             >>> SBC(PKProblem(n=20,m=10,q=7,ell=2))
             SBC estimator for the permuted kernel problem with (n,m,q,ell) = (20,10,7,2)
+
+        Tests:
+            >>> A = SBC(PKProblem(n=69,m=41,q=251,ell=1), memory_access=2)
+            >>> B = SBC(PKProblem(n=69,m=41,q=251,ell=1), memory_access=2, vectorized=False)
+            >>> A.time_complexity() == B.time_complexity() and A.optimal_parameters() == B.optimal_parameters()
+            True
+            >>> A = SBC(PKProblem(n=50,m=30,q=13,ell=2, memory_bound=60))
+            >>> B = SBC(PKProblem(n=50,m=30,q=13,ell=2, memory_bound=60), vectorized=False)
+            >>> A.time_complexity() == B.time_complexity() and A.optimal_parameters() == B.optimal_parameters()
+            True
         """
         super().__init__(problem, **kwargs)
         self._name = "SBC"
@@ -45,6 +68,9 @@ class SBC(PKAlgorithm):
         self.set_parameter_ranges("w", 1, n)
         self.set_parameter_ranges("w1", 1, n)
 
+        self._vectorized = kwargs.get("vectorized", True)
+        self._subcode_costs = dict()
+
         self.SDFqEstimator = None
         self.SDFqEstimator_parameters = kwargs.get("sd_parameters", {})
         self.SDFqEstimator_parameters.pop("nsolutions", None)
@@ -101,6 +127,218 @@ class SBC(PKAlgorithm):
             return True
         return False
 
+    def _cost_for_finding_subcode(self, d: int, w: int):
+        """Returns the logarithm of the cost of finding a subcode of dimension `d` and support size `w`.
+
+        Returns inf, if no such subcode exists in expectation. The cost only depends on `d` and `w` (and the memory
+        bound of the inner SDFq estimation), hence it is computed once and reused for all values of `w1`.
+
+        Args:
+            d (int): Dimension of the subcode.
+            w (int): Support size of the subcode.
+        """
+        key = (d, w, self.problem.memory_bound)
+        if key not in self._subcode_costs:
+            self._subcode_costs[key] = self._compute_cost_for_finding_subcode(d, w)
+        c_isd, self.SDFqEstimator = self._subcode_costs[key]
+        return c_isd
+
+    def _compute_cost_for_finding_subcode(self, d: int, w: int):
+        """Returns the cost of finding a subcode of dimension `d` and support size `w` and the SDFqEstimator used.
+
+        Args:
+            d (int): Dimension of the subcode.
+            w (int): Support size of the subcode.
+        """
+        n, m, q, _ = self.problem.get_parameters()
+
+        N_w = log2(binomial(n, w)) + log2((q ** d - 1)) * (w - d) + gauss_binomial(m, d, q) - gauss_binomial(n, d,
+                                                                                                             q)  # number of expected subcodes
+
+        if N_w < 0:
+            return inf, None
+
+        if d == 1:
+            estimator = self._sub_estimators.get(SDFqEstimator, n=n, k=m, w=w, q=q, bit_complexities=0,
+                                                 nsolutions=N_w, memory_bound=self.problem.memory_bound,
+                                                 **self.SDFqEstimator_parameters)
+            return estimator.fastest_algorithm().time_complexity(), estimator
+
+        return cost_for_finding_subcode(n, m, d, w, N_w), None
+
+    def _time_lower_bound(self, parameters: dict):
+        """Returns the cost of finding the subcode, which only depends on `d` and `w`.
+
+        Args:
+            parameters (dict): Dictionary including the parameters.
+        """
+        c_isd = self._cost_for_finding_subcode(parameters["d"], parameters["w"])
+        if c_isd == inf:
+            return inf
+        return log2(int(2 ** c_isd)) if c_isd >= 0 else -inf
+
+    def _find_optimal_parameters(self):
+        """Enumerates all valid parameter configurations and saves the best result in `_optimal_parameters`.
+
+        The evaluation is staged: the cost of finding the subcode is computed once per `(d, w)`, then the whole
+        `(w1, u)` grid of each `(d, w)` is evaluated in the log domain (see `_log2_time_and_memory_grid`). The
+        `(d, w)` blocks are processed in increasing order of the subcode cost, which lower bounds their time
+        complexity, so that blocks which cannot contain the optimum are skipped. Finally, the ambiguous and the
+        near-optimal parameter sets are re-evaluated exactly in the order of the generic enumeration, such that the
+        result coincides with the one of `BaseAlgorithm._find_optimal_parameters`.
+        """
+        if not self._vectorized or callable(self.memory_access) or self.cost_for_list_operation < 1:
+            super()._find_optimal_parameters()
+            return
+
+        self._start_optimization()
+        n, m, _, _ = self.problem.get_parameters()
+        ranges = self._fix_ranges_for_already_set_parameters()
+        log2_factorials = LogBinomialTable().log2_factorials(n + m)
+        memory_bound = self.problem.memory_bound
+
+        blocks = []
+        for w in range(ranges["w"]["min"], ranges["w"]["max"] + 1):
+            for d in range(ranges["d"]["min"], ranges["d"]["max"] + 1):
+                w1 = np.arange(ranges["w1"]["min"], min(w, ranges["w1"]["max"]) + 1)
+                if len(w1) == 0 or self._are_parameters_invalid({"d": d, "w": w, "w1": w1[0]}):
+                    continue
+                c_isd = self._cost_for_finding_subcode(d, w)
+                if c_isd == inf:
+                    continue
+                blocks.append((log2(int(2 ** c_isd)) if c_isd >= 0 else -inf, d, w, w1))
+        blocks.sort(key=lambda block: block[0])
+        self._statistics["candidates"] += sum(len(block[3]) for block in blocks)
+
+        best = inf
+        candidates = []
+        for index, (lower_bound, d, w, w1) in enumerate(blocks):
+            if self._pruning and lower_bound > best + OPTIMALITY_TOLERANCE:
+                pruned = sum(len(block[3]) for block in blocks[index:])
+                self._pruned_points += pruned
+                self._statistics["pruned"] += pruned
+                break
+
+            time, memory, ambiguous = self._log2_time_and_memory_grid(d, w, w1, log2_factorials)
+            if self.bit_complexities:
+                memory = self.problem.to_bitcomplexity_memory(memory)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                time = time + log2_memory_access_cost(self.memory_access, memory)
+                ambiguous |= np.abs(memory - memory_bound) <= AMBIGUITY_TOLERANCE
+                feasible = (memory <= memory_bound) & np.isfinite(time) & ~ambiguous
+            if feasible.any():
+                best = min(best, float(time[feasible].min()))
+            candidates.append((d, w, w1, time, feasible, ambiguous))
+
+        selected = []
+        for d, w, w1, time, feasible, ambiguous in candidates:
+            chosen = ambiguous | (feasible & (time <= best + OPTIMALITY_TOLERANCE))
+            selected += [(int(i), w, d) for i in w1[chosen]]
+
+        time = inf
+        for w1, w, d in sorted(selected):
+            if not self._continue_optimization():
+                break
+            params = {"d": d, "w": w, "w1": w1}
+            tmp_time, tmp_memory = self._compute_time_and_memory(params)
+            if self.bit_complexities:
+                tmp_memory = self.problem.to_bitcomplexity_memory(tmp_memory)
+
+            tmp_time += self.memory_access_cost(tmp_memory)
+
+            if tmp_time < time and tmp_memory <= memory_bound:
+                time = tmp_time
+                self._current_minimum_for_early_abort = tmp_time
+                for i in params:
+                    self._optimal_parameters[i] = params[i]
+
+            self._register_evaluation(time)
+
+        self._current_minimum_for_early_abort = inf
+        self._time_lower_bounds = dict()
+
+    def _log2_time_and_memory_grid(self, d: int, w: int, w1: np.ndarray, log2_factorials: np.ndarray):
+        """Log-domain version of `_compute_time_and_memory` for fixed `d` and `w` and all values of `w1`.
+
+        Returns the approximated time and memory complexities and the mask of the entries whose approximation is
+        not reliable, i.e. which depend on a rounding step that cannot be decided in floating point or whose optimal
+        `u` is not unique. Quotients which are integral (ratios of factorials) are never rounded.
+
+        Args:
+            d (int): Dimension of the subcode.
+            w (int): Support size of the subcode.
+            w1 (np.ndarray): Values of the parameter w1.
+            log2_factorials (np.ndarray): Table of log2(i!) for 0 <= i <= n + m.
+
+        Tests:
+            >>> import numpy as np
+            >>> from cryptographic_estimators.helper import LogBinomialTable
+            >>> from cryptographic_estimators.PKEstimator.PKAlgorithms import SBC
+            >>> from cryptographic_estimators.PKEstimator import PKProblem
+            >>> A = SBC(PKProblem(n=40,m=20,q=251,ell=2))
+            >>> w1 = np.arange(1, 24)
+            >>> time, memory, ambiguous = A._log2_time_and_memory_grid(4, 23, w1, LogBinomialTable().log2_factorials(60))
+            >>> exact = [A._compute_time_and_memory({"d": 4, "w": 23, "w1": int(i)}) for i in w1]
+            >>> bool(max(abs(time[i] - exact[i][0]) for i in range(len(w1))) < 1e-9)
+            True
+            >>> all(abs(memory[i] - exact[i][1]) < 1e-9 or ambiguous[i] for i in range(len(w1)))
+            True
+        """
+        n, m, q, ell = self.problem.get_parameters()
+        lf = log2_factorials
+        log2_q = log2(q)
+        w1 = w1[:, None]
+        w2 = w - w1
+        u = np.arange(1, m)[None, :]
+        if u.size == 0:
+            infinity = np.full(len(w1), inf)
+            return infinity, infinity.copy(), np.zeros(len(w1), dtype=bool)
+
+        def log2_floor(x, exact):
+            # log2(floor(2**x)), where `exact` marks the entries for which 2**x is known to be an integer
+            value, ambiguous = log2_floor_pow2(x)
+            return np.where(exact, x, value), ambiguous & np.logical_not(exact)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            falling_w1 = lf[n] - lf[n - w1]
+            falling_w2 = lf[n] - lf[n - w2]
+            collisions, ambiguous = log2_floor(2 * lf[n] - d * ell * log2_q - lf[n - w1] - lf[n - w2], False)
+            T_K = np.logaddexp2(np.logaddexp2(falling_w1, falling_w2), collisions)
+
+            size_K, ambiguous_K = log2_floor(np.array(lf[n] - lf[n - w] - d * ell * log2_q), False)
+            size_K = max(0., float(size_K))
+            ambiguous = ambiguous | bool(ambiguous_K)
+
+            # floor(n! / (m + w - u)!) is zero for m + w - u > n
+            R = np.where(m + w - u <= n, lf[n] - lf[np.minimum(m + w - u, n)], -inf)
+            above = u > d
+            shift = np.abs(u - d) * ell * log2_q
+            merge_above, ambiguous_merge_above = log2_floor(R + size_K - shift, False)
+            merge_below, ambiguous_merge_below = log2_floor(lf[n] + shift - lf[m + w - u], m + w - u <= n)
+            merge = np.where(above, merge_above, merge_below + size_K)
+            test_above, ambiguous_test_above = log2_floor(lf[n - w] - shift - lf[m - u], False)
+            test_below, ambiguous_test_below = log2_floor(lf[n - w] + shift - lf[m - u], m - u <= n - w)
+            T_test = np.where(above, test_above, test_below) + size_K
+            T_L = np.logaddexp2(np.logaddexp2(R, size_K), merge)
+            ambiguous = ambiguous | np.where(above, ambiguous_merge_above | ambiguous_test_above,
+                                             ambiguous_merge_below | ambiguous_test_below).any(axis=1, keepdims=True)
+
+            c_isd = self._cost_for_finding_subcode(d, w)
+            local_time = np.logaddexp2(log2(int(2 ** c_isd)),
+                                       np.logaddexp2(np.logaddexp2(T_K, T_L), T_test)
+                                       + log2(self.cost_for_list_operation))
+            L = np.maximum.accumulate(np.maximum(np.minimum(falling_w1, falling_w2), np.minimum(R, size_K)), axis=1)
+            local_memory = L + log2(self.memory_for_list_element)
+
+        best_u = np.argmin(local_time, axis=1)[:, None]
+        time = np.take_along_axis(local_time, best_u, axis=1)
+        memory = np.take_along_axis(local_memory, best_u, axis=1)
+        # the memory depends on the first optimal `u`, which is only known approximately in case of near ties
+        near_optimal = local_time <= time + OPTIMALITY_TOLERANCE
+        ambiguous = ambiguous | (near_optimal & (np.abs(local_memory - memory) > AMBIGUITY_TOLERANCE)).any(
+            axis=1, keepdims=True)
+        return time[:, 0], memory[:, 0], ambiguous[:, 0]
+
     def _compute_time_and_memory(self, parameters: dict, verbose_information=None):
         """Computes the time and memory complexity of the SBC algorithm.
     
@@ -119,22 +357,10 @@ class SBC(PKAlgorithm):
         best_u = 0
         n, m, q, ell = self.problem.get_parameters()
 
-
-
-        N_w = log2(binomial(n, w)) + log2((q ** d - 1)) * (w - d) + gauss_binomial(m, d, q) - gauss_binomial(n, d,
-                                                                                                             q)  # number of expected subcodes
-
-        if N_w < 0:  # continue only if at least one subcode exists in expectation
+        c_isd = self._cost_for_finding_subcode(d, w)
+        if c_isd == inf:  # continue only if at least one subcode exists in expectation
             return inf, inf
 
-        if d == 1:
-            self.SDFqEstimator = SDFqEstimator(n=n, k=m, w=w, q=q, bit_complexities=0, nsolutions=N_w,
-                                               memory_bound=self.problem.memory_bound, **self.SDFqEstimator_parameters)
-            c_isd = self.SDFqEstimator.fastest_algorithm().time_complexity()
-        else:
-            self.SDFqEstimator = None
-            c_isd = cost_for_finding_subcode(n, m, d, w, N_w)
-
         w2 = w - w1
         T_K = factorial(n) // factorial(n - w1) + factorial(n) // factorial(n - w2) \
               + factorial(n) ** 2 // q ** (d * ell) // (factorial(n - w1) * factorial(n - w2))
@@ -15,7 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ****************************************************************************
 
-import pytest
 from ..PKEstimator.pk_algorithm import PKAlgorithm
 from ..PKEstimator.pk_problem import PKProblem
 from ..base_estimator import BaseEstimator
@@ -44,7 +43,7 @@ class PKEstimator(BaseEstimator):
         if not kwargs.get("excluded_algorithms"):
             kwargs["excluded_algorithms"] = []
 
-        kwargs["excluded_algorithms"] += self.excluded_algorithms_by_default
+        kwargs["excluded_algorithms"] = list(kwargs["excluded_algorithms"]) + self.excluded_algorithms_by_default
         super(PKEstimator, self).__init__(
             PKAlgorithm, PKProblem(n, m, q, ell=ell, memory_bound=memory_bound, **kwargs), **kwargs)
 
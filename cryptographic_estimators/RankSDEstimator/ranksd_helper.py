@@ -91,6 +91,102 @@ def compute_mb(m, n, k, r, b):
         return binomial(k + b - 1, b) * (binomial(n, r) - m * binomial(n - k - 1, r))
 
 
+class SupportMinorsCounter:
+    """Counts the rows and columns of the Support Minors systems of the instances (m, n, k, r) for fixed m and r.
+
+       The parameter searches evaluate `compute_nb` and `compute_mb` for many reduced instances. `compute_nb` sums
+       O(k) products of binomials; the counter evaluates the sum in closed form with O(b) binomials, independently of
+       k, by applying the hockey-stick identity b times (see `_rows_fqm`).
+
+       Args:
+           m (int): Extension degree.
+           r (int): Target rank.
+
+       Examples:
+           >>> from cryptographic_estimators.RankSDEstimator.ranksd_helper import SupportMinorsCounter
+           >>> C = SupportMinorsCounter(31, 10)
+           >>> C.rows(22, 4, 1) == compute_nb(31, 22, 4, 10, 1), C.columns(22, 4, 1) == compute_mb(31, 22, 4, 10, 1)
+           (True, True)
+
+       Tests:
+           >>> from itertools import product
+           >>> all(C.rows(n, k, b) == compute_nb(31, n, k, 10, b) and C.columns(n, k, b) == compute_mb(31, n, k, 10, b)
+           ...     for n, k, b in product(range(25), range(-1, 25), range(-1, 5)))
+           True
+           >>> C = SupportMinorsCounter(127, 7)
+           >>> all(C.rows(n, k, b) == compute_nb(127, n, k, 7, b) for n, k, b in product(range(60, 130, 7), range(1, 50, 3), range(1, 12)))
+           True
+    """
+
+    def __init__(self, m, r):
+        self.m = m
+        self.r = r
+
+    def _rows_fqm(self, n, k, b):
+        """Returns `nb_fqm(m, n, k, r, b)` for valid parameters.
+
+           With d = n - k, nb_fqm is the sum T(r, b) = sum_{j < k} binomial(d + j, r) * binomial(j + b - 1, b - 1)
+           minus a single product. Writing binomial(j + b - 1, b - 1) as a sum over i <= j (hockey-stick identity) and
+           summing over j first gives T(r, b) = binomial(n, r + 1) * binomial(k + b - 2, b - 1) - T(r + 1, b - 1),
+           and T(s, 1) = binomial(n, s + 1) - binomial(d, s + 1).
+        """
+        d, r = n - k, self.r
+        total, sign = 0, 1
+        for t in range(b - 1):
+            total += sign * binomial(n, r + 1 + t) * binomial(k + b - 2 - t, b - 1 - t)
+            sign = -sign
+        total += sign * (binomial(n, r + b) - binomial(d, r + b))
+        return total - binomial(d - 1, r) * binomial(k + b - 1, b)
+
+    def _is_valid(self, n, k):
+        return 1 <= k <= n and 1 <= self.r <= n - k - 1 and self.m >= 1
+
+    def rows(self, n, k, b):
+        """Returns `compute_nb(m, n, k, r, b)`."""
+        m, r = self.m, self.r
+        if b == 0:
+            return m * binomial(n - k - 1, r) if n - k - 1 >= r else None
+        if b < 1 or not self._is_valid(n, k):
+            return None
+
+        return self._rows_fqm(n, k, b) - nb_fq_syz(m, n, k, r, b)
+
+    def columns(self, n, k, b):
+        """Returns `compute_mb(m, n, k, r, b)`."""
+        if b < 0 or not self._is_valid(n, k):
+            return None
+        if b == 0:
+            return binomial(n, self.r)
+        return binomial(k + b - 1, b) * (binomial(n, self.r) - self.m * binomial(n - k - 1, self.r))
+
+    def is_feasible(self, n, k, b):
+        """Returns whether the Support Minors system at degree `b` has enough rows, i.e. Nb >= Mb - 1."""
+        nb = self.rows(n, k, b)
+        if nb is None:
+            return False
+        mb = self.columns(n, k, b)
+        return mb is not None and nb >= mb - 1
+
+    def largest_feasible_p(self, n, k, b, p_min, p_max):
+        """Returns the largest p in [p_min, min(n - 2, p_max)] such that the code punctured on p positions is
+           feasible, or None.
+
+           Feasibility is not monotone in p, hence all values are checked.
+        """
+        p_selected = None
+        for p in range(p_min, min(n - 1, p_max + 1)):
+            if self.is_feasible(n - p, k, b):
+                p_selected = p
+        return p_selected
+
+    def smallest_feasible_b(self, n, k, b_min, b_max):
+        """Returns the smallest b in [b_min, b_max] such that the system is feasible, or inf."""
+        for b in range(b_min, b_max + 1):
+            if self.is_feasible(n, k, b):
+                return b
+        return inf
+
+
 def find_p_sm_fqm(m, n, k, r, b, p_min, p_max):
     """Returns p for the given instance.
 
@@ -103,18 +199,10 @@ def find_p_sm_fqm(m, n, k, r, b, p_min, p_max):
            p_min (int): minimum value for p
            p_max (int): maximum value for p
     """
+    return SupportMinorsCounter(m, r).largest_feasible_p(n, k, b, p_min, p_max)
 
-    p_selected = None
-    for p in range(p_min, min(n - 1, p_max + 1), 1):
-        nb = compute_nb(m, n - p, k, r, b)
-        mb = compute_mb(m, n - p, k, r, b)
-        if nb is not None and mb is not None and nb >= mb - 1:
-            p_selected = p
 
-    return p_selected
-
-
-def find_best_choice_param_mm(m, n, k, r, a_min, a_max, p_min, p_max):
+def find_best_choice_param_mm(m, n, k, r, a_min, a_max, p_min, p_max, counter=None):
     """Returns the best choice (a,p) for Max Minors for the given instance.
 
        Args:
@@ -126,19 +214,21 @@ def find_best_choice_param_mm(m, n, k, r, a_min, a_max, p_min, p_max):
            a_max (int): maximum value for a
            p_min (int): minimum value for p
            p_max (int): maximum value for p
+           counter (SupportMinorsCounter, optional): Counter for (m, r) to reuse.
     """
+    if counter is None:
+        counter = SupportMinorsCounter(m, r)
+
     values = {}
     a_selected = None
     for a in range(a_min, a_max + 1, 1):
-        nb = compute_nb(m, n - a, k - a, r, 0)
-        mb = compute_mb(m, n - a, k - a, r, 0)
-        if nb is not None and mb is not None and nb >= mb - 1:
+        if counter.is_feasible(n - a, k - a, 0):
             a_selected = a
             break
     if a_selected is None or a_selected >= k:
         return values
 
-    p_selected = find_p_sm_fqm(m, n - a_selected, k - a_selected, r, 0, p_min, p_max)
+    p_selected = counter.largest_feasible_p(n - a_selected, k - a_selected, 0, p_min, p_max)
     values[RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS] = a_selected
     values[RANKSD_NUMBER_OF_PUNCTURED_POSITIONS] = p_selected
     return values
@@ -155,15 +245,7 @@ def find_b_sm_fqm(m, n, k, r, b_min, b_max):
            b_min (int): minimum value for b
            b_max (int): maximum value for b
     """
-    b_selected = inf
-    for b in range(b_min, b_max + 1, 1):
-        nb = compute_nb(m, n, k, r, b)
-        mb = compute_mb(m, n, k, r, b)
-        if nb is not None and mb is not None and nb >= mb - 1:
-            b_selected = b
-            break
-
-    return b_selected
+    return SupportMinorsCounter(m, r).smallest_feasible_b(n, k, b_min, b_max)
 
 
 def find_valid_choices_param_sm_fqm(m, n, k, r, a_min, a_max, p_min, p_max, b_min, b_max):
@@ -182,7 +264,8 @@ def find_valid_choices_param_sm_fqm(m, n, k, r, a_min, a_max, p_min, p_max, b_mi
             b_max (int): maximum value for b
     """
     # This function assumes the system has an unique solution.
-    values = find_best_choice_param_mm(m, n, k, r, a_min, a_max, p_min, p_max)
+    counter = SupportMinorsCounter(m, r)
+    values = find_best_choice_param_mm(m, n, k, r, a_min, a_max, p_min, p_max, counter)
     valid_choices = []
 
     if len(values) <= 0 or values[RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS] == 0:
@@ -191,11 +274,11 @@ def find_valid_choices_param_sm_fqm(m, n, k, r, a_min, a_max, p_min, p_max, b_mi
     a0 = values[RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS]
 
     for a in range(a0 - 1, -1, -1):
-        b = find_b_sm_fqm(m, n - a, k - a, r, b_min, b_max)
+        b = counter.smallest_feasible_b(n - a, k - a, b_min, b_max)
         if b == inf:
             break
 
-        p = find_p_sm_fqm(m, n - a, k - a, r, b, p_min, p_max)
+        p = counter.largest_feasible_p(n - a, k - a, b, p_min, p_max)
         valid_choices.append({RANKSD_LINEAR_VARIABLES_DEGREE: b,
                               RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS: a,
                               RANKSD_NUMBER_OF_PUNCTURED_POSITIONS: p})
@@ -20,6 +20,7 @@ from ..regsd_algorithm import RegSDAlgorithm
 from ..regsd_problem import RegSDProblem
 from ..regsd_helper import r_int
 from math import log2, ceil, inf
+import numpy as np
 
 
 class CCJ(RegSDAlgorithm):
@@ -78,6 +79,53 @@ class CCJ(RegSDAlgorithm):
                 continue
             yield indices
 
+    def _valid_grid(self):
+        """Returns the parameters yielded by `_valid_choices` as dictionary of arrays (in the same order)."""
+        new_ranges = self._fix_ranges_for_already_set_parameters()
+
+        n, k, w = self.problem.get_parameters()
+        k_tilde_approx = k - (1 - k / n) / (1 - w / n) * w
+        L1_approx = log2(n / w) * (w * k_tilde_approx / (2 * n))
+        ell_approx = L1_approx
+        ell_min = ceil(ell_approx * 0.75)
+        ell_max = min(r_int(ell_approx * 1.5), n - k)
+        return {"ell": np.arange(max(new_ranges["ell"]["min"], ell_min), min(ell_max, new_ranges["ell"]["max"] + 1))}
+
+    def _vectorized_time_and_memory_complexity(self, grid: dict):
+        """Computes approximated time and memory complexity for all parameter sets in `grid`.
+
+        Tests:
+            >>> from cryptographic_estimators.RegSDEstimator.RegSDAlgorithms import CCJ
+            >>> from cryptographic_estimators.RegSDEstimator import RegSDProblem
+            >>> A = CCJ(RegSDProblem(n=2320, k=1210, w=40))
+            >>> B = CCJ(RegSDProblem(n=2320, k=1210, w=40), vectorized=0)
+            >>> A.time_complexity() == B.time_complexity() and A.optimal_parameters() == B.optimal_parameters()
+            True
+            >>> C = CCJ(RegSDProblem(n=2320, k=1210, w=40))
+            >>> grid = C._valid_grid()
+            >>> len(grid["ell"]) == len(list(C._valid_choices()))
+            True
+            >>> time, memory, _ = C._vectorized_time_and_memory_complexity(grid)
+            >>> exact = [C._compute_time_and_memory_complexity({"ell": i}) for i in grid["ell"].tolist()]
+            >>> bool(max(abs(t - e[0]) + abs(m - e[1]) for t, m, e in zip(time, memory, exact)) < 1e-6)
+            True
+        """
+        n, k, w = self.problem.get_parameters()
+        ell = grid["ell"]
+        k_tilde = k - (1 - (ell + k) / n) / (1 - w / n) * w
+
+        # cost of one iteration
+        log2_L = log2(n / w) * (w * (k_tilde + ell) / (2 * n))
+        log2_num_coll = log2_L * 2 - ell
+
+        # overall cost
+        with np.errstate(divide="ignore"):
+            time = np.logaddexp2(2 * np.log2(n - k_tilde), np.logaddexp2(1 + log2_L, log2_num_coll))
+
+        invalid = ell > n - k_tilde
+        time[invalid] = inf
+        return time, np.where(invalid, inf, log2_L), np.zeros(len(ell), dtype=bool)
+
     def _compute_time_and_memory_complexity(self, parameters: dict):
         """Return the time complexity of the algorithm for a given set of parameters.
     
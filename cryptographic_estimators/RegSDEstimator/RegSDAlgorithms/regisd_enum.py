@@ -19,8 +19,10 @@ from ...base_algorithm import optimal_parameter
 from ..regsd_algorithm import RegSDAlgorithm
 from ..regsd_problem import RegSDProblem
 from ..regsd_helper import r_int
-from math import log2, comb as binomial, ceil, floor
+from ...SDEstimator.sd_vectorized_helper import log2_binom
+from math import log2
 from types import SimpleNamespace
+import numpy as np
 
 class RegularISDEnum(RegSDAlgorithm):
     def __init__(self, problem: RegSDProblem, **kwargs):
@@ -88,7 +90,7 @@ class RegularISDEnum(RegSDAlgorithm):
         n, k, w = self.problem.get_parameters()
         k_prime = k - w
         for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"]+1), 2):
-            ell_approx = max(1, log2(binomial(r_int(w / 2), p // 2)) +log2(k_prime / w) * (p / 2))
+            ell_approx = max(1, self.problem.log2_binomial(r_int(w / 2), p // 2) +log2(k_prime / w) * (p / 2))
             ell_min = r_int(ell_approx * 0.5)
             ell_max = min(r_int(ell_approx * 1.5), n - k_prime)
 
@@ -98,6 +100,60 @@ class RegularISDEnum(RegSDAlgorithm):
                     continue
                 yield indices
 
+    def _valid_grid(self):
+        """Returns the parameters yielded by `_valid_choices` as dictionary of arrays (in the same order)."""
+        new_ranges = self._fix_ranges_for_already_set_parameters()
+
+        n, k, w = self.problem.get_parameters()
+        k_prime = k - w
+        p_values, ell_values = [], []
+        for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"]+1), 2):
+            ell_approx = max(1, self.problem.log2_binomial(r_int(w / 2), p // 2) +log2(k_prime / w) * (p / 2))
+            ell_min = r_int(ell_approx * 0.5)
+            ell_max = min(r_int(ell_approx * 1.5), n - k_prime)
+            ell = np.arange(max(new_ranges["ell"]["min"], ell_min), min(ell_max, new_ranges["ell"]["max"]+1))
+            p_values.append(np.full(len(ell), p))
+            ell_values.append(ell)
+
+        p = np.concatenate(p_values or [np.zeros(0, dtype=int)])
+        ell = np.concatenate(ell_values or [np.zeros(0, dtype=int)])
+        v = (k_prime + ell) / w
+        b = n/w
+        invalid = (w / 2 < p / 2) | (v / b >= 1)
+        return {"p": p[~invalid], "ell": ell[~invalid]}
+
+    def _vectorized_time_and_memory_complexity(self, grid: dict):
+        """Computes approximated time and memory complexity for all parameter sets in `grid`.
+
+        Tests:
+            >>> from cryptographic_estimators.RegSDEstimator.RegSDAlgorithms import RegularISDEnum
+            >>> from cryptographic_estimators.RegSDEstimator import RegSDProblem
+            >>> A = RegularISDEnum(RegSDProblem(n=954, k=582, w=106))
+            >>> B = RegularISDEnum(RegSDProblem(n=954, k=582, w=106), vectorized=0)
+            >>> A.time_complexity() == B.time_complexity() and A.optimal_parameters() == B.optimal_parameters()
+            True
+            >>> C = RegularISDEnum(RegSDProblem(n=954, k=582, w=106))
+            >>> grid = C._valid_grid()
+            >>> len(grid["p"]) == len(list(C._valid_choices()))
+            True
+            >>> time, memory, _ = C._vectorized_time_and_memory_complexity(grid)
+            >>> exact = [C._compute_time_and_memory_complexity({"ell": ell, "p": p}) for p, ell in zip(grid["p"].tolist(), grid["ell"].tolist())]
+            >>> bool(max(abs(t - e[0]) + abs(m - e[1]) for t, m, e in zip(time, memory, exact)) < 1e-6)
+            True
+        """
+        n, k, w = self.problem.get_parameters()
+        p, ell = grid["p"], grid["ell"]
+        fac = self.problem.log2_binomial.log2_factorials(n)
+        k_prime = k - w
+        v = (k_prime + ell) / w
+
+        p_iter = self._log2_success_probability_grid(p, ell, fac)
+        L = log2_binom(fac, r_int(w / 2), p // 2) + np.log2(v) * (p / 2)
+        T_iter = np.maximum(np.maximum(log2(n - k_prime) * 2, 1 + L), L * 2 - ell)
+
+        time = T_iter - p_iter
+        return time, L, np.zeros(len(p), dtype=bool)
+
     def _compute_time_and_memory_complexity(self, parameters: dict):
         """Return the time complexity of the algorithm for a given set of parameters.
     
@@ -107,7 +163,6 @@ class RegularISDEnum(RegSDAlgorithm):
         n, k, w = self.problem.get_parameters()
         ell = parameters["ell"]
         p = parameters["p"]
-        b = n//w
 
         # add parity-checks
         k_prime = k - w
@@ -115,11 +170,10 @@ class RegularISDEnum(RegSDAlgorithm):
         v = (k_prime + ell) / w  # number of coordinates per block
 
         # success probability
-        p_iter = log2(binomial(floor(w / 2), r_int(p / 2))) + log2(binomial(ceil(w / 2), r_int(p / 2))) + log2(
-            v / b) * p + log2(1 - v / b) * (w - p)
+        p_iter = self._log2_success_probability(p, ell)
 
         # cost of one iteration
-        L = log2(binomial(r_int(w / 2), p // 2)) + log2(v) * (p / 2)
+        L = self.problem.log2_binomial(r_int(w / 2), p // 2) + log2(v) * (p / 2)
         T_iter = max(log2(n - k_prime) * 2, 1 + L, L * 2 - ell)
 
         # overall cost
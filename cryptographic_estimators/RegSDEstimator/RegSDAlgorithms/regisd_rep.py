@@ -19,11 +19,16 @@ from ...base_algorithm import optimal_parameter
 from ..regsd_algorithm import RegSDAlgorithm
 from ..regsd_problem import RegSDProblem
 from ..regsd_helper import r_int
-from math import log2, comb as binomial, ceil, floor, inf
+from ..regsd_constants import RegSD_VECTORIZED_CHUNK_SIZE
+from ...SDEstimator.sd_vectorized_helper import log2_binom, near_integer
+from math import log2, comb as binomial, floor, inf
 from types import SimpleNamespace
+import numpy as np
 
 
 class RegularISDRep(RegSDAlgorithm):
+    _lower_bound_parameters = ("p", "ell")
+
     def __init__(self, problem: RegSDProblem, **kwargs):
         """Construct an instance of RegularISD-Enum estimator in depth 3 from [ES23]_.
 
@@ -134,6 +139,137 @@ class RegularISDRep(RegSDAlgorithm):
                             continue
                         yield indices
 
+    def _valid_grid(self):
+        """Returns the parameters yielded by `_valid_choices` as dictionary of arrays (in the same order)."""
+        chunks = list(self._valid_grid_chunks())
+        if not chunks:
+            return {i: np.zeros(0, dtype=int) for i in ("p", "ell", "eps_x", "eps_y")}
+        return {i: np.concatenate([chunk[i] for chunk in chunks]) for i in chunks[0]}
+
+    def _valid_grid_chunks(self):
+        """Yields the parameters yielded by `_valid_choices` in chunks of about RegSD_VECTORIZED_CHUNK_SIZE points.
+
+        The grid consists of ranges of `ell` for each choice of `p`, `eps_x` and `eps_y`, the ranges are only expanded
+        for a chunk at a time.
+        """
+        new_ranges = self._fix_ranges_for_already_set_parameters()
+
+        n, k, w = self.problem.get_parameters()
+        k_prime = k - w
+        blocks, size = [], 0
+        for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"])+1, 8):
+            for eps_x in range(new_ranges["eps_x"]["min"], new_ranges["eps_x"]["max"]+1, 4):
+                p_x = p/2 + eps_x
+                for eps_y in range(new_ranges["eps_y"]["min"], new_ranges["eps_y"]["max"] + 1):
+                    p_y = p_x / 2 + eps_y
+                    L1 = log2(max(binomial(r_int(w / 2), int(p_y / 2)) * k_prime ** (p_y // 2), 1))
+                    ell_approx = r_int(2 * L1)
+                    ell_min = max(new_ranges["ell"]["min"], r_int(ell_approx * 0.5))
+                    ell_max = min(r_int(ell_approx * 1.5), new_ranges["ell"]["max"])
+                    if ell_min >= ell_max:
+                        continue
+                    blocks.append((p, eps_x, eps_y, ell_min, ell_max))
+                    size += ell_max - ell_min
+                    if size >= RegSD_VECTORIZED_CHUNK_SIZE:
+                        yield from self._expand_blocks(blocks)
+                        blocks, size = [], 0
+        if blocks:
+            yield from self._expand_blocks(blocks)
+
+    def _expand_blocks(self, blocks: list):
+        """Yields the valid points of a list of tuples `(p, eps_x, eps_y, ell_min, ell_max)` as dictionary of arrays."""
+        n, k, w = self.problem.get_parameters()
+        p, eps_x, eps_y, ell_min, ell_max = (np.array(i) for i in zip(*blocks))
+        lengths = ell_max - ell_min
+        offsets = np.repeat(np.cumsum(lengths) - lengths - ell_min, lengths)
+        grid = {"p": np.repeat(p, lengths), "ell": np.arange(lengths.sum()) - offsets,
+                "eps_x": np.repeat(eps_x, lengths), "eps_y": np.repeat(eps_y, lengths)}
+
+        p, ell, eps_x, eps_y = grid["p"], grid["ell"], grid["eps_x"], grid["eps_y"]
+        v = (k - w + ell) / w
+        b = n / w
+        invalid = (w / 2 - p / 2 < eps_x / 2) | (w / 2 - p / 4 - eps_x / 2 < eps_y / 2) \
+            | (w / 2 < p / 2) | (v == 0) | (v >= b)
+        if not invalid.all():
+            yield {i: grid[i][~invalid] for i in grid}
+
+    def _vectorized_time_and_memory_complexity(self, grid: dict):
+        """Computes approximated time and memory complexity for all parameter sets in `grid`.
+
+        Points whose number of matched bits `ell_x` or `ell_y` (the floor of the logarithmic number of representations)
+        cannot be decided reliably in floating point are flagged as ambiguous.
+
+        Tests:
+            >>> from cryptographic_estimators.RegSDEstimator.RegSDAlgorithms import RegularISDRep
+            >>> from cryptographic_estimators.RegSDEstimator import RegSDProblem
+            >>> A = RegularISDRep(RegSDProblem(n=954, k=582, w=106))
+            >>> B = RegularISDRep(RegSDProblem(n=954, k=582, w=106), vectorized=0)
+            >>> A.time_complexity() == B.time_complexity() and A.optimal_parameters() == B.optimal_parameters()
+            True
+            >>> A = RegularISDRep(RegSDProblem(n=954, k=582, w=106), memory_access=2, memory_bound=40)
+            >>> B = RegularISDRep(RegSDProblem(n=954, k=582, w=106), memory_access=2, memory_bound=40, vectorized=0)
+            >>> A.time_complexity() == B.time_complexity() and A.optimal_parameters() == B.optimal_parameters()
+            True
+            >>> C = RegularISDRep(RegSDProblem(n=954, k=582, w=106))
+            >>> grid = C._valid_grid()
+            >>> len(grid["p"]) == len(list(C._valid_choices()))
+            True
+            >>> time, memory, ambiguous = C._vectorized_time_and_memory_complexity(grid)
+            >>> exact = [C._compute_time_and_memory_complexity(dict(zip(grid, i))) for i in zip(*(j.tolist() for j in grid.values()))]
+            >>> bool(max(abs(t - e[0]) for t, e, a in zip(time, exact, ambiguous) if e[0] < inf and not a) < 1e-6)
+            True
+            >>> all(t == inf for t, e, a in zip(time, exact, ambiguous) if e[0] == inf and not a)
+            True
+        """
+        n, k, w = self.problem.get_parameters()
+        p, ell, eps_x, eps_y = grid["p"], grid["ell"], grid["eps_x"], grid["eps_y"]
+        fac = self.problem.log2_binomial.log2_factorials(n)
+        k_prime = k - w
+        log2_v = np.log2((k_prime + ell) / w)
+
+        p_x = p // 2 + eps_x
+        p_y = p_x // 2 + eps_y
+        # Num reps
+        R_x = (log2_binom(fac, p // 2, p // 4) + log2_binom(fac, (w - p) // 2, eps_x // 2) + log2_v * (eps_x / 2)) * 2
+        R_y = (log2_binom(fac, p_x // 2, p_x // 4) + log2_binom(fac, (w - p_x) // 2, eps_y // 2) + log2_v * (
+                    eps_y // 2)) * 2
+        ambiguous = near_integer(R_x, np.abs(R_x)) | near_integer(R_y, np.abs(R_y))
+
+        ell_x = np.floor(R_x)
+        ell_y = np.floor(R_y)
+
+        # success probability
+        p_iter = self._log2_success_probability_grid(p, ell, fac)
+
+        L1 = log2_binom(fac, r_int(w / 2), p_y // 2) + log2_v * (p_y / 2)
+
+        L_y1 = L1 * 2 - ell_y
+        N_y = L_y1 * 2 - (ell_x - ell_y)
+
+        L_x1 = log2_binom(fac, r_int(w / 2), p_x // 2) * 2 + log2_v * p_x - ell_x
+        N_x = L_x1 * 2 - (ell - ell_x)
+
+        # cost of one iteration
+        T_gauss = log2(n - k_prime) * 2
+        T_iter = np.maximum.reduce([np.full(len(p), T_gauss), 3 + L1, 2 + L_y1, 1 + N_y, 1 + L_x1, N_x])
+
+        time = T_iter - p_iter
+        memory = np.maximum(np.maximum(L1, L_y1), L_x1)
+        invalid = ell_y > ell_x
+        time[invalid] = inf
+        memory[invalid] = inf
+        return time, memory, ambiguous
+
+    def _time_lower_bound(self, parameters: dict):
+        """Returns the cost of the Gaussian elimination divided by the success probability, which only depend on `p` and `ell`.
+
+        Args:
+            parameters (dict): Dictionary including the parameters.
+        """
+        n, k, w = self.problem.get_parameters()
+        T_gauss = log2(n - (k - w)) * 2
+        return T_gauss - self._log2_success_probability(parameters["p"], parameters["ell"])
+
     def _compute_time_and_memory_complexity(self, parameters: dict):
         """Return the time complexity of the algorithm for a given set of parameters.
     
@@ -145,13 +281,12 @@ class RegularISDRep(RegSDAlgorithm):
         
         k_prime = k-w
         v = (k_prime + ell) / w
-        b=n//w
 
         p_x = p//2 + eps_x
         p_y = p_x//2 + eps_y
         # Num reps
-        R_x = (log2(binomial(int(p / 2), int(p / 4))) + log2(binomial(int((w-p)/ 2), int(eps_x / 2))) + log2(v) * (eps_x / 2)) * 2
-        R_y = (log2(binomial(int(p_x / 2), int(p_x / 4))) + log2(binomial(int((w- p_x)/2), int(eps_y // 2))) + log2(v) * (
+        R_x = (self.problem.log2_binomial(int(p / 2), int(p / 4)) + self.problem.log2_binomial(int((w-p)/ 2), int(eps_x / 2)) + log2(v) * (eps_x / 2)) * 2
+        R_y = (self.problem.log2_binomial(int(p_x / 2), int(p_x / 4)) + self.problem.log2_binomial(int((w- p_x)/2), int(eps_y // 2)) + log2(v) * (
                     eps_y // 2)) * 2
 
         ell_x = floor(R_x)
@@ -161,15 +296,14 @@ class RegularISDRep(RegSDAlgorithm):
             return inf, inf
 
         # success probability
-        p_iter = log2(binomial(floor(w / 2), r_int(p / 2))) + log2(binomial(ceil(w / 2), r_int(p / 2))) + log2(
-            v / b) * p + log2(1 - v / b) * (w - p)
+        p_iter = self._log2_success_probability(p, ell)
 
-        L1 = log2(binomial(r_int(w / 2), int(p_y / 2))) + log2(v) * (p_y / 2)  # list size, first level (initial lists)
+        L1 = self.problem.log2_binomial(r_int(w / 2), int(p_y / 2)) + log2(v) * (p_y / 2)  # list size, first level (initial lists)
 
         L_y1 = L1 * 2 - ell_y
         N_y = L_y1 * 2 - (ell_x - ell_y)
 
-        L_x1 = log2(binomial(r_int(w / 2), p_x // 2)) * 2 + log2(v) * p_x - ell_x
+        L_x1 = self.problem.log2_binomial(r_int(w / 2), p_x // 2) * 2 + log2(v) * p_x - ell_x
         N_x = L_x1 * 2 - (ell - ell_x)
 
         # cost of one iteration
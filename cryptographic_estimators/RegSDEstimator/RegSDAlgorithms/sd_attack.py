@@ -39,10 +39,11 @@ class SDAttack(RegSDAlgorithm):
         _ = kwargs.pop("bit_complexities", None)
         _ = kwargs.pop("nsolutions", None)
         _ = kwargs.pop("excluded_algorithms", None)
-        self.SDEstimator = SDEstimator(n, k, w, bit_complexities=0
-                                       , nsolutions=self.problem.nsolutions
-                                       , excluded_algorithms=[BJMMdw, BJMMpdw, BJMMplus, MayOzerov, BothMay, Stern, Dumer]
-                                       , **kwargs)
+        self.SDEstimator = self._sub_estimators.get(SDEstimator, n=n, k=k, w=w, bit_complexities=0
+                                                    , nsolutions=self.problem.nsolutions
+                                                    , excluded_algorithms=[BJMMdw, BJMMpdw, BJMMplus, MayOzerov, BothMay,
+                                                                           Stern, Dumer]
+                                                    , **kwargs)
 
     def _compute_time_and_memory_complexity(self, parameters: dict):
         """Return the time complexity of the algorithm for a given set of parameters.
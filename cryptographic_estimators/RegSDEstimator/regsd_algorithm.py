@@ -17,7 +17,12 @@
 
 
 from ..base_algorithm import BaseAlgorithm
+from ..SDEstimator.sd_vectorized_helper import log2_binom, near_optimal_choices, near_optimal_mask
 from .regsd_problem import RegSDProblem
+from .regsd_helper import r_int
+from .regsd_constants import RegSD_VECTORIZED_CHUNK_SIZE
+from math import log2, ceil, floor
+import numpy as np
 
 
 class RegSDAlgorithm(BaseAlgorithm):
@@ -26,9 +31,12 @@ class RegSDAlgorithm(BaseAlgorithm):
 
         Args:
             problem (RegSDProblem): RegSDProblem object including all necessary parameters
+            vectorized (bool, optional): Use the vectorized cost evaluation to preselect parameters, if the algorithm
+                supports it. Defaults to True.
         """
         super(RegSDAlgorithm, self).__init__(problem, **kwargs)
         self._name = "sample_name"
+        self._vectorized = kwargs.get("vectorized", 1)
 
     def _compute_time_and_memory_complexity(self, parameters: dict):
         """Returns the time and memory complexity of the algorithm for a given set of parameters.
@@ -38,6 +46,100 @@ class RegSDAlgorithm(BaseAlgorithm):
         """
         raise NotImplementedError
 
+    def _log2_success_probability(self, p: int, ell: int):
+        """Returns the logarithm of the success probability of one iteration of the regular ISD algorithms.
+
+        Args:
+            p (int): Weight of the solution on the information set.
+            ell (int): Number of additional parity-check equations.
+        """
+        n, k, w = self.problem.get_parameters()
+        b = n//w
+        k_prime = k - w
+        v = (k_prime + ell) / w  # number of coordinates per block
+        return self.problem.log2_binomial(floor(w / 2), r_int(p / 2)) + self.problem.log2_binomial(ceil(w / 2), r_int(p / 2)) + log2(
+            v / b) * p + log2(1 - v / b) * (w - p)
+
+    def _log2_success_probability_grid(self, p: np.ndarray, ell: np.ndarray, log2_factorials: np.ndarray):
+        """Vectorized version of `_log2_success_probability`.
+
+        Args:
+            p (np.ndarray): Weights of the solution on the information set.
+            ell (np.ndarray): Numbers of additional parity-check equations.
+            log2_factorials (np.ndarray): Table of log2 factorials up to `n`.
+        """
+        n, k, w = self.problem.get_parameters()
+        b = n//w
+        k_prime = k - w
+        v = (k_prime + ell) / w
+        half_p = np.rint(p / 2).astype(int)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return log2_binom(log2_factorials, floor(w / 2), half_p) + log2_binom(log2_factorials, ceil(w / 2), half_p) \
+                + np.log2(v / b) * p + np.log2(1 - v / b) * (w - p)
+
+    def _optimization_candidates(self):
+        """Returns an iterable of the parameter sets evaluated by `_find_optimal_parameters`.
+
+        If the algorithm implements `_vectorized_time_and_memory_complexity`, the valid choices are evaluated in
+        floating point chunk by chunk (see `_valid_grid_chunks`), which bounds the memory of the arrays, and only those
+        parameter sets are returned that might be optimal. Each chunk only keeps the points that might be optimal within
+        the chunk, which include all points that might be optimal overall.
+
+        Tests:
+            >>> from cryptographic_estimators.RegSDEstimator.RegSDAlgorithms import RegularISDRep
+            >>> from cryptographic_estimators.RegSDEstimator import RegSDProblem
+            >>> from cryptographic_estimators.SDEstimator.sd_vectorized_helper import near_optimal_choices
+            >>> A = RegularISDRep(RegSDProblem(n=954, k=582, w=106))
+            >>> grid = A._valid_grid()
+            >>> whole = list(near_optimal_choices(A, grid, *A._vectorized_time_and_memory_complexity(grid)))
+            >>> whole == list(A._optimization_candidates()), A.optimization_statistics["candidates"]
+            (True, 220523)
+        """
+        if not self._vectorized or callable(self.memory_access):
+            return super()._optimization_candidates()
+
+        try:
+            chunks = self._valid_grid_chunks()
+        except NotImplementedError:
+            return super()._optimization_candidates()
+
+        selected = []
+        for grid in chunks:
+            self._statistics["candidates"] += len(next(iter(grid.values())))
+            time, memory, ambiguous = self._vectorized_time_and_memory_complexity(grid)
+            mask = near_optimal_mask(self, time, memory, ambiguous)
+            selected.append(({i: grid[i][mask] for i in grid}, time[mask], memory[mask], ambiguous[mask]))
+        if not selected:
+            return iter(())
+
+        grid = {i: np.concatenate([chunk[i] for chunk, *_ in selected]) for i in selected[0][0]}
+        time, memory, ambiguous = (np.concatenate(i) for i in list(zip(*selected))[1:])
+        return near_optimal_choices(self, grid, time, memory, ambiguous)
+
+    def _valid_grid(self):
+        """Returns a dictionary mapping each parameter to the array of its values in `_valid_choices`."""
+        raise NotImplementedError
+
+    def _valid_grid_chunks(self):
+        """Returns an iterable of non-empty dictionaries of parameter arrays, which together hold the points of
+        `_valid_grid` in the same order. Chunks hold about RegSD_VECTORIZED_CHUNK_SIZE points.
+        """
+        grid = self._valid_grid()
+        size = len(next(iter(grid.values())))
+        return ({i: grid[i][start:start + RegSD_VECTORIZED_CHUNK_SIZE] for i in grid}
+                for start in range(0, size, RegSD_VECTORIZED_CHUNK_SIZE))
+
+    def _vectorized_time_and_memory_complexity(self, grid: dict):
+        """Computes approximated time and memory complexity for all parameter sets in `grid`.
+
+        Args:
+            grid (dict): Dictionary of parameter arrays, see `_valid_grid`.
+
+        Returns:
+            Arrays of the time and memory complexities and the mask of points whose approximation is not reliable.
+        """
+        raise NotImplementedError
+
     def _compute_time_complexity(self, parameters: dict):
         """Return the time complexity of the algorithm for a given set of parameters.
     
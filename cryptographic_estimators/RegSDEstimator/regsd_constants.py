@@ -18,3 +18,5 @@
 RegSD_CODE_LENGTH = "code length"
 RegSD_CODE_DIMENSION = "code dimension"
 RegSD_ERROR_WEIGHT = "error weight"
+# number of parameter sets whose costs are evaluated at once by the vectorized optimization
+RegSD_VECTORIZED_CHUNK_SIZE = 2**11
@@ -35,6 +35,7 @@ class RegSDEstimator(BaseEstimator):
             **kwargs: Additional keyword arguments.
                 excluded_algorithms: A list/tuple of excluded algorithms (default: None).
                 nsolutions: No. of solutions.
+                vectorized: Preselect the parameters with the vectorized cost evaluation (default: 1).
         """
         super(RegSDEstimator, self).__init__(
             RegSDAlgorithm,
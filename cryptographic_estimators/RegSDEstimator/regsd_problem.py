@@ -17,6 +17,7 @@
 
 
 from ..base_problem import BaseProblem
+from ..helper import LogBinomialTable
 from math import log2
 from .regsd_constants import *
 
@@ -52,6 +53,7 @@ class RegSDProblem(BaseProblem):
         self.parameters[RegSD_ERROR_WEIGHT] = w
 
         self.block_length = n // w
+        self.log2_binomial = LogBinomialTable()
         self.nsolutions = kwargs.get("nsolutions", max(
             self.expected_number_solutions(), 0))
 
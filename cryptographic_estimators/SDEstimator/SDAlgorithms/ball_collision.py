@@ -34,6 +34,8 @@ from ..SDWorkfactorModels.ball_collision import BallCollisionScipyModel
 
 
 class BallCollision(SDAlgorithm):
+    _lower_bound_parameters = ("r", "p", "pl", "l")
+
     def __init__(self, problem: SDProblem, **kwargs):
         """Complexity estimate of the ball collision decoding algorithm.
 
@@ -168,9 +170,7 @@ class BallCollision(SDAlgorithm):
         memory = log2(2 * L1 + _mem_matrix(n, k, par.r))
         if memory > memory_bound:
             return inf, inf
-        solutions = self.problem.nsolutions
-        Tp = max(log2(binom(n, w)) - log2(binom(n - k - par.l, w - 2 * par.p - 2 * par.pl))
-                 - 2 * log2(binom(k1, par.p)) - 2 * log2(binom(par.l // 2, par.pl)) - solutions, 0)
+        Tp = self._log2_permutations(par)
         Tg = _gaussian_elimination_complexity(n, k, par.r)
         time = Tp + log2(Tg + _list_merge_complexity(L1, par.l, self._hmap))
 
@@ -182,6 +182,13 @@ class BallCollision(SDAlgorithm):
 
         return time, memory
 
+    def _log2_permutations(self, par: SimpleNamespace):
+        n, k, w = self.problem.get_parameters()
+        k1 = k // 2
+        solutions = self.problem.nsolutions
+        return max(self.problem.log2_binomial(n, w) - self.problem.log2_binomial(n - k - par.l, w - 2 * par.p - 2 * par.pl)
+                 - 2 * self.problem.log2_binomial(k1, par.p) - 2 * self.problem.log2_binomial(par.l // 2, par.pl) - solutions, 0)
+
     def __repr__(self):
         rep = "Ball Collision estimator for " + str(self.problem)
         return rep
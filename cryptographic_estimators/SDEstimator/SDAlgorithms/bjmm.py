@@ -30,8 +30,17 @@ from ...SDEstimator.sd_helper import (
     ceil,
     inf,
 )
+from ...SDEstimator.sd_vectorized_helper import (
+    log2_binom,
+    log2_floor_pow2,
+    log2_ceil_pow2,
+    log2_list_merge_complexity,
+    near_integer,
+    AMBIGUITY_TOLERANCE,
+)
 from types import SimpleNamespace
 from ..sd_constants import *
+import numpy as np
 from ..SDWorkfactorModels.bjmm import BJMMScipyModel
 from typing import Union
 
@@ -63,8 +72,8 @@ class BJMM(SDAlgorithm):
         self._name = "BJMM"
         self.initialize_parameter_ranges()
         self.limit_depth = kwargs.get("limit_depth", False)
-        self.BJMM_depth_2 = BJMMd2(problem, **kwargs)
-        self.BJMM_depth_3 = BJMMd3(problem, **kwargs)
+        self.BJMM_depth_2 = BJMMd2(problem, **self._warm_start_of_depth(kwargs, 2, "BJMM_depth_2"))
+        self.BJMM_depth_3 = BJMMd3(problem, **self._warm_start_of_depth(kwargs, 3, "BJMM_depth_3"))
 
     def initialize_parameter_ranges(self):
         """Initialize parameter range for d."""
@@ -103,6 +112,17 @@ class BJMM(SDAlgorithm):
         self.BJMM_depth_2.reset()
         self.BJMM_depth_3.reset()
 
+    @property
+    def optimization_is_partial(self):
+        """Returns whether the optimization of depth 2 or 3 was stopped early."""
+        return self.BJMM_depth_2.optimization_is_partial or self.BJMM_depth_3.optimization_is_partial
+
+    @property
+    def optimization_statistics(self):
+        """Returns the sum of the optimization counters of depth 2 and 3."""
+        depth_2, depth_3 = self.BJMM_depth_2.optimization_statistics, self.BJMM_depth_3.optimization_statistics
+        return {i: depth_2[i] + depth_3[i] for i in depth_2}
+
     def _find_optimal_parameters(self):
         """Finds optimal parameters for depth 2 and 3."""
         self.BJMM_depth_2._find_optimal_parameters()
@@ -159,6 +179,8 @@ class BJMM(SDAlgorithm):
 
 
 class BJMMd2(SDAlgorithm):
+    _lower_bound_parameters = ("r", "p", "l")
+
     def __init__(self, problem: SDProblem, **kwargs):
         """Complexity estimate of BJMM algorithm in depth 2.
 
@@ -251,7 +273,7 @@ class BJMMd2(SDAlgorithm):
 
         for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"]), 2):
             for p1 in range(max(new_ranges["p1"]["min"], (p + 1) // 2), new_ranges["p1"]["max"]):
-                ell_approx = 2 * log2(binom(k // 2, p1))
+                ell_approx = 2 * self.problem.log2_binomial(k // 2, p1)
                 for l in range(
                     max(new_ranges["l"]["min"], int(ell_approx * 0.75)),
                     min(
@@ -271,13 +293,101 @@ class BJMMd2(SDAlgorithm):
                         continue
                     yield indices
 
+    def _valid_grid(self):
+        """Returns the parameters yielded by `_valid_choices` as dictionary of arrays (in the same order)."""
+        new_ranges = self._fix_ranges_for_already_set_parameters()
+        n, k, w = self.problem.get_parameters()
+
+        p_values, p1_values, l_values = [], [], []
+        for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"]), 2):
+            for p1 in range(max(new_ranges["p1"]["min"], (p + 1) // 2), new_ranges["p1"]["max"]):
+                ell_approx = 2 * self.problem.log2_binomial(k // 2, p1)
+                l = np.arange(
+                    max(new_ranges["l"]["min"], int(ell_approx * 0.75)),
+                    min(int(1.25 * ell_approx), n - k - (w - 2 * p), new_ranges["l"]["max"]),
+                )
+                p_values.append(np.full(len(l), p))
+                p1_values.append(np.full(len(l), p1))
+                l_values.append(l)
+
+        grid = {
+            "p": np.concatenate(p_values or [np.zeros(0, dtype=int)]),
+            "p1": np.concatenate(p1_values or [np.zeros(0, dtype=int)]),
+            "l": np.concatenate(l_values or [np.zeros(0, dtype=int)]),
+        }
+        p, p1, l = grid["p"], grid["p1"], grid["l"]
+        k1 = (k + l) // 2
+        invalid = (p > w // 2) | (k1 < p) | (l >= n - k) | (n - k - l < w - 2 * p) \
+            | (k1 - p < p1 - p / 2) | (p1 < p / 2)
+        return {i: grid[i][~invalid] for i in grid}
+
+    def _vectorized_time_and_memory_complexity(self, grid: dict):
+        """Computes approximated time and memory complexity of the depth 2 version for all parameter sets in `grid`.
+
+        Tests:
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import BJMMd2
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> A = BJMMd2(SDProblem(n=100,k=50,w=10))
+            >>> B = BJMMd2(SDProblem(n=100,k=50,w=10), vectorized=0)
+            >>> A.get_optimal_parameters_dict() == B.get_optimal_parameters_dict()
+            True
+            >>> A = BJMMd2(SDProblem(n=1284,k=1028,w=24), hmap=0, memory_access=1, memory_bound=40)
+            >>> B = BJMMd2(SDProblem(n=1284,k=1028,w=24), hmap=0, memory_access=1, memory_bound=40, vectorized=0)
+            >>> A.time_complexity() == B.time_complexity() and A.optimal_parameters() == B.optimal_parameters()
+            True
+            >>> C = BJMMd2(SDProblem(n=1284,k=1028,w=24), hmap=0, memory_bound=40)
+            >>> r = C.r()
+            >>> grid = C._valid_grid()
+            >>> time, memory, ambiguous = C._vectorized_time_and_memory_complexity(grid)
+            >>> exact = [C._time_and_memory_complexity({"p": p, "p1": p1, "l": l, "r": r})[0] for p, p1, l in zip(*(i.tolist() for i in grid.values()))]
+            >>> bool(max(abs(t - e) for t, e, a in zip(time, exact, ambiguous) if e < inf and not a) < 1e-6)
+            True
+        """
+        n, k, w = self.problem.get_parameters()
+        p, p1, l = grid["p"], grid["p1"], grid["l"]
+        fac = self.problem.log2_binomial.log2_factorials(n)
+        k1 = (k + l) // 2
+        r = self._optimal_parameters["r"]
+
+        log2_L1 = log2_binom(fac, k1, p1)
+        log2_reps = 2 * (log2_binom(fac, p, p // 2) + log2_binom(fac, k1 - p, p1 - (p + 1) // 2))
+        ambiguous = near_integer(log2_reps)
+        l1 = np.ceil(log2_reps)
+
+        log2_L12, ambiguous_L12 = log2_floor_pow2(2 * log2_L1 - l1)
+        log2_L12 = np.maximum(0, log2_L12)
+        ambiguous |= ambiguous_L12
+
+        memory = np.logaddexp2(np.logaddexp2(1 + log2_L1, log2_L12), log2(_mem_matrix(n, k, r)))
+        ambiguous |= np.abs(memory - self.problem.memory_bound) <= AMBIGUITY_TOLERANCE
+
+        Tp = np.maximum(
+            self.problem.log2_binomial(n, w)
+            - log2_binom(fac, n - k - l, w - 2 * p)
+            - 2 * log2_binom(fac, k1, p)
+            - self.problem.nsolutions,
+            0,
+        )
+        Tg = log2(_gaussian_elimination_complexity(n, k, r))
+        merge_1, ambiguous_1 = log2_list_merge_complexity(log2_L1, l1, self._hmap)
+        merge_12, ambiguous_12 = log2_list_merge_complexity(log2_L12, l - l1, self._hmap)
+        T_tree = np.logaddexp2(1 + merge_1, merge_12)
+        T_rep, ambiguous_rep = log2_ceil_pow2(l1 - log2_reps)
+        ambiguous |= ambiguous_1 | ambiguous_12 | ambiguous_rep
+
+        time = Tp + np.logaddexp2(Tg, T_rep + T_tree)
+
+        invalid = (l1 > l) | (memory > self.problem.memory_bound)
+        time[invalid] = inf
+        memory[invalid] = inf
+        return time, memory, ambiguous
+
     def _time_and_memory_complexity(self, parameters: dict, verbose_information=None):
         """Computes the expected runtime and memory consumption for the depth 2 version."""
         n, k, w = self.problem.get_parameters()
         par = SimpleNamespace(**parameters)
         k1 = (k + par.l) // 2
 
-        solutions = self.problem.nsolutions
         memory_bound = self.problem.memory_bound
 
         L1 = binom(k1, par.p1)
@@ -297,13 +407,7 @@ class BJMMd2(SDAlgorithm):
         if memory > memory_bound:
             return inf, inf
 
-        Tp = max(
-            log2(binom(n, w))
-            - log2(binom(n - k - par.l, w - 2 * par.p))
-            - 2 * log2(binom((k + par.l) // 2, par.p))
-            - solutions,
-            0,
-        )
+        Tp = self._log2_permutations(par)
         Tg = _gaussian_elimination_complexity(n, k, par.r)
         T_tree = 2 * _list_merge_complexity(L1, l1, self._hmap) + _list_merge_complexity(L12, par.l - l1, self._hmap)
         T_rep = int(ceil(2 ** (l1 - log2(reps))))
@@ -324,12 +428,25 @@ class BJMMd2(SDAlgorithm):
 
         return time, memory
 
+    def _log2_permutations(self, par: SimpleNamespace):
+        n, k, w = self.problem.get_parameters()
+        solutions = self.problem.nsolutions
+        return max(
+            self.problem.log2_binomial(n, w)
+            - self.problem.log2_binomial(n - k - par.l, w - 2 * par.p)
+            - 2 * self.problem.log2_binomial((k + par.l) // 2, par.p)
+            - solutions,
+            0,
+        )
+
     def __repr__(self):
         rep = "BJMM estimator in depth 2 for " + str(self.problem)
         return rep
 
 
 class BJMMd3(SDAlgorithm):
+    _lower_bound_parameters = ("r", "p", "l")
+
     def __init__(self, problem: SDProblem, **kwargs):
         """Complexity estimate of BJMM algorithm in depth 2.
 
@@ -473,6 +590,104 @@ class BJMMd3(SDAlgorithm):
                             continue
                         yield indices
 
+    def _valid_grid(self):
+        """Returns the parameters yielded by `_valid_choices` as dictionary of arrays (in the same order)."""
+        new_ranges = self._fix_ranges_for_already_set_parameters()
+        n, k, w = self.problem.get_parameters()
+
+        p_values, p1_values, p2_values, l_values = [], [], [], []
+        for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"]), 2):
+            l_range = np.arange(new_ranges["l"]["min"], min(n - k - (w - 2 * p), new_ranges["l"]["max"]))
+            p2_range = np.arange(max(new_ranges["p2"]["min"], p // 2 + ((p // 2) % 2)), new_ranges["p2"]["max"], 2)
+            p1_range = np.arange(new_ranges["p1"]["min"], new_ranges["p1"]["max"])
+            l, p2, p1 = (i.ravel() for i in np.meshgrid(l_range, p2_range, p1_range, indexing="ij"))
+            in_range = p1 >= (p2 + 1) // 2
+            p_values.append(np.full(in_range.sum(), p))
+            p1_values.append(p1[in_range])
+            p2_values.append(p2[in_range])
+            l_values.append(l[in_range])
+
+        grid = {
+            "p": np.concatenate(p_values or [np.zeros(0, dtype=int)]),
+            "p1": np.concatenate(p1_values or [np.zeros(0, dtype=int)]),
+            "p2": np.concatenate(p2_values or [np.zeros(0, dtype=int)]),
+            "l": np.concatenate(l_values or [np.zeros(0, dtype=int)]),
+        }
+        p, p1, p2, l = grid["p"], grid["p1"], grid["p2"], grid["l"]
+        k1 = (k + l) // 2
+        invalid = (p > w // 2) | (k1 < p) | (l >= n - k) | (n - k - l < w - 2 * p) \
+            | (k1 - p < p2 - p / 2) | (p2 < p // 2) | (k1 - p2 < p1 - p2 / 2) | (p1 < p2 / 2) | (p % 2 == 1)
+        return {i: grid[i][~invalid] for i in grid}
+
+    def _vectorized_time_and_memory_complexity(self, grid: dict):
+        """Computes approximated time and memory complexity of the depth 3 version for all parameter sets in `grid`.
+
+        Tests:
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import BJMMd3
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> A = BJMMd3(SDProblem(n=100,k=50,w=10))
+            >>> B = BJMMd3(SDProblem(n=100,k=50,w=10), vectorized=0)
+            >>> A.get_optimal_parameters_dict() == B.get_optimal_parameters_dict()
+            True
+            >>> A = BJMMd3(SDProblem(n=1284,k=1028,w=24), hmap=0, memory_access=2, memory_bound=60)
+            >>> B = BJMMd3(SDProblem(n=1284,k=1028,w=24), hmap=0, memory_access=2, memory_bound=60, vectorized=0)
+            >>> A.time_complexity() == B.time_complexity() and A.optimal_parameters() == B.optimal_parameters()
+            True
+            >>> C = BJMMd3(SDProblem(n=200,k=100,w=20), hmap=0)
+            >>> r = C.r()
+            >>> grid = C._valid_grid()
+            >>> time, memory, ambiguous = C._vectorized_time_and_memory_complexity(grid)
+            >>> exact = [C._time_and_memory_complexity({"p": p, "p1": p1, "p2": p2, "l": l, "r": r})[0] for p, p1, p2, l in zip(*(i.tolist() for i in grid.values()))]
+            >>> bool(max(abs(t - e) for t, e, a in zip(time, exact, ambiguous) if e < inf and not a) < 1e-6)
+            True
+        """
+        n, k, w = self.problem.get_parameters()
+        p, p1, p2, l = grid["p"], grid["p1"], grid["p2"], grid["l"]
+        fac = self.problem.log2_binomial.log2_factorials(n)
+        k1 = (k + l) // 2
+        r = self._optimal_parameters["r"]
+
+        log2_L1 = log2_binom(fac, k1, p1)
+        log2_reps1 = 2 * (log2_binom(fac, p2, p2 // 2) + log2_binom(fac, k1 - p2, p1 - (p2 + 1) // 2))
+        l1 = np.trunc(log2_reps1)
+        log2_L12, ambiguous = log2_floor_pow2(2 * log2_L1 - l1)
+        log2_L12 = np.maximum(0, log2_L12)
+
+        log2_reps2 = 2 * (log2_binom(fac, p, p // 2) + log2_binom(fac, k1 - p, p2 - p // 2))
+        l2 = np.ceil(log2_reps2)
+        ambiguous |= near_integer(log2_reps1) | near_integer(log2_reps2)
+
+        log2_L1234, ambiguous_L1234 = log2_floor_pow2(2 * log2_L12 - (l2 - l1))
+        log2_L1234 = np.maximum(0, log2_L1234)
+        ambiguous |= ambiguous_L1234
+
+        memory = np.logaddexp2(np.logaddexp2(np.logaddexp2(1 + log2_L1, log2_L12), log2_L1234),
+                               log2(_mem_matrix(n, k, r)))
+        ambiguous |= np.abs(memory - self.problem.memory_bound) <= AMBIGUITY_TOLERANCE
+
+        Tp = np.maximum(
+            self.problem.log2_binomial(n, w)
+            - log2_binom(fac, n - k - l, w - 2 * p)
+            - 2 * log2_binom(fac, k1, p)
+            - self.problem.nsolutions,
+            0,
+        )
+        Tg = log2(_gaussian_elimination_complexity(n, k, r))
+        merge_1, ambiguous_1 = log2_list_merge_complexity(log2_L1, l1, self._hmap)
+        merge_12, ambiguous_12 = log2_list_merge_complexity(log2_L12, l2 - l1, self._hmap)
+        merge_1234, ambiguous_1234 = log2_list_merge_complexity(log2_L1234, l - l2, self._hmap)
+        T_tree = np.logaddexp2(np.logaddexp2(2 + merge_1, 1 + merge_12), merge_1234)
+        T_rep, ambiguous_rep = log2_ceil_pow2(
+            3 * np.maximum(0, l1 - log2_reps1) + np.maximum(0, l2 - log2_reps2))
+        ambiguous |= ambiguous_1 | ambiguous_12 | ambiguous_1234 | ambiguous_rep
+
+        time = Tp + np.logaddexp2(Tg, T_rep + T_tree)
+
+        invalid = memory > self.problem.memory_bound
+        time[invalid] = inf
+        memory[invalid] = inf
+        return time, memory, ambiguous
+
     def _time_and_memory_complexity(self, parameters: dict, verbose_information=None):
         """Computes the expected runtime and memory consumption for the depth 3 version."""
         n, k, w = self.problem.get_parameters()
@@ -480,7 +695,6 @@ class BJMMd3(SDAlgorithm):
 
         k1 = (k + par.l) // 2
 
-        solutions = self.problem.nsolutions
         memory_bound = self.problem.memory_bound
         L1 = binom(k1, par.p1)
         if self._is_early_abort_possible(log2(L1)):
@@ -498,13 +712,7 @@ class BJMMd3(SDAlgorithm):
         if memory > memory_bound:
             return inf, inf
 
-        Tp = max(
-            log2(binom(n, w))
-            - log2(binom(n - k - par.l, w - 2 * par.p))
-            - 2 * log2(binom((k + par.l) // 2, par.p))
-            - solutions,
-            0,
-        )
+        Tp = self._log2_permutations(par)
         Tg = _gaussian_elimination_complexity(n, k, par.r)
         T_tree = (
             4 * _list_merge_complexity(L1, l1, self._hmap)
@@ -534,6 +742,17 @@ class BJMMd3(SDAlgorithm):
 
         return time, memory
 
+    def _log2_permutations(self, par: SimpleNamespace):
+        n, k, w = self.problem.get_parameters()
+        solutions = self.problem.nsolutions
+        return max(
+            self.problem.log2_binomial(n, w)
+            - self.problem.log2_binomial(n - k - par.l, w - 2 * par.p)
+            - 2 * self.problem.log2_binomial((k + par.l) // 2, par.p)
+            - solutions,
+            0,
+        )
+
     def __repr__(self):
         rep = "BJMM estimator in depth 3 for " + str(self.problem)
         return rep
@@ -28,8 +28,6 @@ from ...SDEstimator.sd_helper import (
     ceil,
     inf,
 )
-from scipy.special import binom as binom_sp
-from scipy.optimize import fsolve
 from warnings import filterwarnings
 from types import SimpleNamespace
 from ..sd_constants import *
@@ -199,6 +197,9 @@ class BJMMdw(SDAlgorithm):
 
     def _choose_first_constraint_such_that_representations_cancel_out_exactly(self, parameters: dict):
         """Tries to find an l1 value fulfilling the constraints."""
+        from scipy.optimize import fsolve
+        from scipy.special import binom as binom_sp
+
         _, k, _ = self.problem.get_parameters()
         par = SimpleNamespace(**parameters)
 
@@ -234,6 +235,9 @@ class BJMMdw(SDAlgorithm):
 
     def _choose_second_constraint_such_that_list_size_remains_constant(self, parameters: dict, list_size: float):
         """Tries to find an L2 value which does not increase the list size."""
+        from scipy.optimize import fsolve
+        from scipy.special import binom as binom_sp
+
         par = SimpleNamespace(**parameters)
 
         try:
@@ -303,16 +307,16 @@ class BJMMdw(SDAlgorithm):
             ]
             for l2 in range(max(l2_min, l2_range[0]), max(1, min(l2_max, l2_range[1]))):
                 Tp = max(
-                    log2(binom(n, w))
+                    self.problem.log2_binomial(n, w)
                     - log2(
                         binom(
                             n - k - 2 * l1 - 2 * l2,
                             w - 2 * par.p - 2 * par.w1 - 2 * par.w2,
                         )
                     )
-                    - 2 * log2(binom(k1, par.p))
-                    - 2 * log2(binom(l1, par.w1))
-                    - 2 * log2(binom(l2, par.w2))
+                    - 2 * self.problem.log2_binomial(k1, par.p)
+                    - 2 * self.problem.log2_binomial(l1, par.w1)
+                    - 2 * self.problem.log2_binomial(l2, par.w2)
                     - solutions,
                     0,
                 )
@@ -340,7 +344,7 @@ class BJMMdw(SDAlgorithm):
                         verbose_information[VerboseInformation.LISTS.value] = [
                             log2(L1),
                             log2(L12),
-                            2 * log2(L12) + log2(binom(2 * l2, 2 * par.w2)) - 2 * l2,
+                            2 * log2(L12) + self.problem.log2_binomial(2 * l2, 2 * par.w2) - 2 * l2,
                         ]
 
         return local_time, local_mem
@@ -30,8 +30,6 @@ from ...SDEstimator.sd_helper import (
     inf,
     min_max,
 )
-from scipy.special import binom as binom_sp
-from scipy.optimize import fsolve
 from warnings import filterwarnings
 from types import SimpleNamespace
 from ..sd_constants import *
@@ -151,6 +149,9 @@ class BJMMpdw(SDAlgorithm):
 
     def _choose_first_constraint_such_that_representations_cancel_out_exactly(self, parameters: dict):
         """Tries to find an optimal l1 value fulfilling its constraints."""
+        from scipy.optimize import fsolve
+        from scipy.special import binom as binom_sp
+
         _, k, _ = self.problem.get_parameters()
         par = SimpleNamespace(**parameters)
 
@@ -175,6 +176,9 @@ class BJMMpdw(SDAlgorithm):
 
     def _choose_second_constraint_such_that_list_size_remains_constant(self, parameters: dict, list_size: float):
         """Tries to find an optimal l2 value fulfilling its constraints."""
+        from scipy.optimize import fsolve
+        from scipy.special import binom as binom_sp
+
         par = SimpleNamespace(**parameters)
 
         try:
@@ -242,10 +246,10 @@ class BJMMpdw(SDAlgorithm):
             ]
             for l2 in range(max(l2_min, l2_range[0]), min(l2_max, l2_range[1])):
                 Tp = max(
-                    log2(binom(n, w))
-                    - log2(binom(n - k - l1 - 2 * l2, w - 2 * par.p - 2 * par.w2))
-                    - 2 * log2(binom(k1, par.p))
-                    - 2 * log2(binom(l2, par.w2))
+                    self.problem.log2_binomial(n, w)
+                    - self.problem.log2_binomial(n - k - l1 - 2 * l2, w - 2 * par.p - 2 * par.w2)
+                    - 2 * self.problem.log2_binomial(k1, par.p)
+                    - 2 * self.problem.log2_binomial(l2, par.w2)
                     - solutions,
                     0,
                 )
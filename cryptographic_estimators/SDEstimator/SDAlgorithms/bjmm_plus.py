@@ -35,6 +35,8 @@ from ..sd_constants import *
 
 
 class BJMMplus(SDAlgorithm):
+    _lower_bound_parameters = ("r", "p", "l")
+
     def __init__(self, problem: SDProblem, **kwargs):
         """Complexity estimate of BJMM+ algorithm in depth 2.
 
@@ -159,7 +161,7 @@ class BJMMplus(SDAlgorithm):
         for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"]) + 1, 2):
             for l in range(new_ranges["l"]["min"], min(n - k - (w - 2 * p), new_ranges["l"]["max"]) + 1):
                 for p1 in range(max(new_ranges["p1"]["min"], (p + 1) // 2), new_ranges["p1"]["max"] + 1):
-                    L1 = log2(binom((k + l) // 2, p1))
+                    L1 = self.problem.log2_binomial((k + l) // 2, p1)
                     d1 = self._adjust_radius
                     lower = new_ranges["l1"]["min"] if new_ranges["l1"]["min"] == new_ranges["l1"]["max"] else max(
                         int(L1) - d1, 0)
@@ -182,8 +184,6 @@ class BJMMplus(SDAlgorithm):
         if self._are_parameters_invalid(parameters):
             return inf, inf
 
-        solutions = self.problem.nsolutions
-
         L1 = binom(k1, par.p1)
         if self._is_early_abort_possible(log2(L1)):
             return inf, inf
@@ -202,10 +202,8 @@ class BJMMplus(SDAlgorithm):
 
         L12 = max(1, L1**2 // 2**par.l1)
 
-        qc_advantage = 0
         if self.qc:
             L12b = max(1, L1 * L1b // 2**par.l1)
-            qc_advantage = log2(k)
 
         memory = (
             log2((2 * L1 + L12) + _mem_matrix(n, k, par.r))
@@ -215,15 +213,7 @@ class BJMMplus(SDAlgorithm):
         if self._is_early_abort_possible(memory):
             return inf, inf
 
-        Tp = max(
-            log2(binom(n, w))
-            - log2(binom(n - k - par.l, w - 2 * par.p + self.qc))
-            - log2(binom(k1, par.p))
-            - log2(binom(k1, par.p - self.qc))
-            - qc_advantage
-            - solutions,
-            0,
-        )
+        Tp = self._log2_permutations(par)
 
         Tg = _gaussian_elimination_complexity(n, k, par.r)
         if not self.qc:
@@ -256,6 +246,21 @@ class BJMMplus(SDAlgorithm):
 
         return time, memory
 
+    def _log2_permutations(self, par: SimpleNamespace):
+        n, k, w = self.problem.get_parameters()
+        k1 = (k + par.l) // 2
+        qc_advantage = log2(k) if self.qc else 0
+        solutions = self.problem.nsolutions
+        return max(
+            self.problem.log2_binomial(n, w)
+            - self.problem.log2_binomial(n - k - par.l, w - 2 * par.p + self.qc)
+            - self.problem.log2_binomial(k1, par.p)
+            - self.problem.log2_binomial(k1, par.p - self.qc)
+            - qc_advantage
+            - solutions,
+            0,
+        )
+
     def __repr__(self):
         rep = "BJMM+ estimator for " + str(self.problem)
         return rep
@@ -34,6 +34,8 @@ from ..SDWorkfactorModels import BothMayScipyModel
 
 
 class BothMay(SDAlgorithm):
+    _lower_bound_parameters = ("r", "p", "l", "w2")
+
     def __init__(self, problem: SDProblem, **kwargs):
         """Complexity estimate of Both-May algorithm in depth 2 using Indyk-Motwani and/or MitM for NN search.
 
@@ -185,7 +187,6 @@ class BothMay(SDAlgorithm):
         par = SimpleNamespace(**parameters)
         k1 = k // 2
 
-        solutions = self.problem.nsolutions
         memory_bound = self.problem.memory_bound
 
         reps = (
@@ -205,14 +206,7 @@ class BothMay(SDAlgorithm):
         if memory > memory_bound:
             return inf, inf
 
-        Tp = max(
-            log2(binom(n, w))
-            - log2(binom(n - k - par.l, w - par.w2 - 2 * par.p))
-            - 2 * log2(binom(k1, par.p))
-            - log2(binom(par.l, par.w2))
-            - solutions,
-            0,
-        )
+        Tp = self._log2_permutations(par)
         Tg = _gaussian_elimination_complexity(n, k, par.r)
 
         first_level_nn = _indyk_motwani_complexity(L1, par.l, par.w1, self._hmap)
@@ -231,6 +225,19 @@ class BothMay(SDAlgorithm):
 
         return time, memory
 
+    def _log2_permutations(self, par: SimpleNamespace):
+        n, k, w = self.problem.get_parameters()
+        k1 = k // 2
+        solutions = self.problem.nsolutions
+        return max(
+            self.problem.log2_binomial(n, w)
+            - self.problem.log2_binomial(n - k - par.l, w - par.w2 - 2 * par.p)
+            - 2 * self.problem.log2_binomial(k1, par.p)
+            - self.problem.log2_binomial(par.l, par.w2)
+            - solutions,
+            0,
+        )
+
     def __repr__(self):
         rep = "Both-May estimator in depth 2 for " + str(self.problem)
         return rep
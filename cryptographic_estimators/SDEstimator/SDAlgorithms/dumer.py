@@ -34,6 +34,8 @@ from ..SDWorkfactorModels.dumer import DumerScipyModel
 
 
 class Dumer(SDAlgorithm):
+    _lower_bound_parameters = ("r", "p", "l")
+
     def __init__(self, problem: SDProblem, **kwargs):
         """
         Complexity estimate of Dumer's ISD algorithm.
@@ -124,15 +126,11 @@ class Dumer(SDAlgorithm):
             return inf, inf
 
         memory = log2(2 * L1 + _mem_matrix(n, k, par.r))
-        solutions = self.problem.nsolutions
 
         if memory > memory_bound:
             return inf, memory_bound + 1
 
-        Tp = max(
-            log2(binom(n, w)) - log2(binom(n - k - par.l, w - 2 * par.p)) - log2(binom(k1, par.p) ** 2) - solutions,
-            0,
-        )
+        Tp = self._log2_permutations(par)
         Tg = _gaussian_elimination_complexity(n, k, par.r)
         time = Tp + log2(Tg + _list_merge_complexity(L1, par.l, self._hmap))
 
@@ -146,6 +144,15 @@ class Dumer(SDAlgorithm):
 
         return time, memory
 
+    def _log2_permutations(self, par: SimpleNamespace):
+        n, k, w = self.problem.get_parameters()
+        k1 = (k + par.l) // 2
+        solutions = self.problem.nsolutions
+        return max(
+            self.problem.log2_binomial(n, w) - self.problem.log2_binomial(n - k - par.l, w - 2 * par.p) - 2 * self.problem.log2_binomial(k1, par.p) - solutions,
+            0,
+        )
+
     def __repr__(self):
         rep = "Dumer estimator for " + str(self.problem)
         return rep
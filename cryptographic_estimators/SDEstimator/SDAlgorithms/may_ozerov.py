@@ -63,8 +63,8 @@ class MayOzerov(SDAlgorithm):
         self._name = "May-Ozerov"
         self.initialize_parameter_ranges()
         self.limit_depth = kwargs.get("limit_depth", False)
-        self.MayOzerov_depth_2 = MayOzerovD2(problem, **kwargs)
-        self.MayOzerov_depth_3 = MayOzerovD3(problem, **kwargs)
+        self.MayOzerov_depth_2 = MayOzerovD2(problem, **self._warm_start_of_depth(kwargs, 2, "MayOzerov_depth_2"))
+        self.MayOzerov_depth_3 = MayOzerovD3(problem, **self._warm_start_of_depth(kwargs, 3, "MayOzerov_depth_3"))
 
     def initialize_parameter_ranges(self):
         self.set_parameter_ranges("depth", 2, 3)
@@ -104,6 +104,17 @@ class MayOzerov(SDAlgorithm):
         self.MayOzerov_depth_2.reset()
         self.MayOzerov_depth_3.reset()
 
+    @property
+    def optimization_is_partial(self):
+        """Returns whether the optimization of depth 2 or 3 was stopped early."""
+        return self.MayOzerov_depth_2.optimization_is_partial or self.MayOzerov_depth_3.optimization_is_partial
+
+    @property
+    def optimization_statistics(self):
+        """Returns the sum of the optimization counters of depth 2 and 3."""
+        depth_2, depth_3 = self.MayOzerov_depth_2.optimization_statistics, self.MayOzerov_depth_3.optimization_statistics
+        return {i: depth_2[i] + depth_3[i] for i in depth_2}
+
     def _find_optimal_parameters(self):
         """Finds optimal parameters for depth 2 and 3."""
         self.MayOzerov_depth_2._find_optimal_parameters()
@@ -155,6 +166,8 @@ class MayOzerov(SDAlgorithm):
 
 
 class MayOzerovD2(SDAlgorithm):
+    _lower_bound_parameters = ("r", "p", "l")
+
     def __init__(self, problem: SDProblem, **kwargs):
         """Complexity estimate of May-Ozerov algorithm in depth 2.
 
@@ -272,7 +285,6 @@ class MayOzerovD2(SDAlgorithm):
         par = SimpleNamespace(**parameters)
         k1 = (k + par.l) // 2
 
-        solutions = self.problem.nsolutions
         memory_bound = self.problem.memory_bound
         L1 = binom(k1, par.p1)
 
@@ -290,10 +302,7 @@ class MayOzerovD2(SDAlgorithm):
         if memory > memory_bound:
             return inf, inf
 
-        Tp = max(
-            log2(binom(n, w)) - log2(binom(n - k - par.l, w - 2 * par.p)) - 2 * log2(binom(k1, par.p)) - solutions,
-            0,
-        )
+        Tp = self._log2_permutations(par)
         Tg = _gaussian_elimination_complexity(n, k, par.r)
         T_tree = 2 * _list_merge_complexity(L1, par.l, self._hmap) + _indyk_motwani_complexity(
             L12, n - k - par.l, w - 2 * par.p, self._hmap
@@ -311,17 +320,28 @@ class MayOzerovD2(SDAlgorithm):
             verbose_information[VerboseInformation.LISTS.value] = [
                 log2(L1),
                 log2(L12),
-                2 * log2(L12) + log2(binom(n - k - par.l, w - 2 * par.p)) - (n - par.l),
+                2 * log2(L12) + self.problem.log2_binomial(n - k - par.l, w - 2 * par.p) - (n - par.l),
             ]
 
         return time, memory
 
+    def _log2_permutations(self, par: SimpleNamespace):
+        n, k, w = self.problem.get_parameters()
+        k1 = (k + par.l) // 2
+        solutions = self.problem.nsolutions
+        return max(
+            self.problem.log2_binomial(n, w) - self.problem.log2_binomial(n - k - par.l, w - 2 * par.p) - 2 * self.problem.log2_binomial(k1, par.p) - solutions,
+            0,
+        )
+
     def __repr__(self):
         rep = "May-Ozerov estimator in depth 2 for " + str(self.problem)
         return rep
 
 
 class MayOzerovD3(SDAlgorithm):
+    _lower_bound_parameters = ("r", "p", "l")
+
     def __init__(self, problem: SDProblem, **kwargs):
         """Complexity estimate of May-Ozerov algorithm in depth 3.
 
@@ -473,7 +493,6 @@ class MayOzerovD3(SDAlgorithm):
         par = SimpleNamespace(**parameters)
         k1 = (k + par.l) // 2
 
-        solutions = self.problem.nsolutions
         memory_bound = self.problem.memory_bound
         L1 = binom(k1, par.p1)
 
@@ -495,10 +514,7 @@ class MayOzerovD3(SDAlgorithm):
         if memory > memory_bound:
             return inf, inf
 
-        Tp = max(
-            log2(binom(n, w)) - log2(binom(n - k - par.l, w - 2 * par.p)) - 2 * log2(binom(k1, par.p)) - solutions,
-            0,
-        )
+        Tp = self._log2_permutations(par)
         Tg = _gaussian_elimination_complexity(n, k, par.r)
         T_tree = (
             4 * _list_merge_complexity(L1, l1, self._hmap)
@@ -521,12 +537,21 @@ class MayOzerovD3(SDAlgorithm):
                 log2(L1),
                 log2(L12),
                 log2(L1234),
-                2 * log2(L1234) + log2(binom(n - k - par.l, w - 2 * par.p)) - (n - par.l),
+                2 * log2(L1234) + self.problem.log2_binomial(n - k - par.l, w - 2 * par.p) - (n - par.l),
             ]
             return verbose_information
 
         return time, memory
 
+    def _log2_permutations(self, par: SimpleNamespace):
+        n, k, w = self.problem.get_parameters()
+        k1 = (k + par.l) // 2
+        solutions = self.problem.nsolutions
+        return max(
+            self.problem.log2_binomial(n, w) - self.problem.log2_binomial(n - k - par.l, w - 2 * par.p) - 2 * self.problem.log2_binomial(k1, par.p) - solutions,
+            0,
+        )
+
     def __repr__(self):
         rep = "May-Ozerov estimator in depth 3 for " + str(self.problem)
         return rep
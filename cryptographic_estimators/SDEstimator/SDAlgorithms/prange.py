@@ -21,7 +21,6 @@ from ...SDEstimator.sd_problem import SDProblem
 from ...SDEstimator.sd_helper import (
     _gaussian_elimination_complexity,
     _mem_matrix,
-    binom,
     log2,
 )
 from ..sd_constants import *
@@ -69,7 +68,7 @@ class Prange(SDAlgorithm):
         r = parameters["r"]
         memory = log2(_mem_matrix(n, k, r))
 
-        Tp = max(log2(binom(n, w)) - log2(binom(n - k, w)) - solutions, 0)
+        Tp = max(self.problem.log2_binomial(n, w) - self.problem.log2_binomial(n - k, w) - solutions, 0)
         Tg = log2(_gaussian_elimination_complexity(n, k, r))
         time = Tp + Tg
 
@@ -34,6 +34,8 @@ from ..SDWorkfactorModels.stern import SternScipyModel
 
 
 class Stern(SDAlgorithm):
+    _lower_bound_parameters = ("r", "p")
+
     def __init__(self, problem: SDProblem, **kwargs):
         """
         Construct an instance of Stern's estimator [Ste88]_, [BLP08]_.
@@ -158,10 +160,7 @@ class Stern(SDAlgorithm):
         if memory > memory_bound:
             return inf, memory_bound + 1
 
-        Tp = max(
-            0,
-            log2(binom(n, w)) - log2(binom(n - k, w - 2 * par.p)) - log2(binom(k1, par.p) ** 2) - solutions,
-        )
+        Tp = self._log2_permutations(par)
 
         # We use Indyk-Motwani (IM) taking into account the possibility of multiple existing solutions
         # with correct weight distribution, decreasing the amount of necessary projections
@@ -188,6 +187,15 @@ class Stern(SDAlgorithm):
 
         return time, memory
 
+    def _log2_permutations(self, par: SimpleNamespace):
+        n, k, w = self.problem.get_parameters()
+        k1 = k // 2
+        solutions = self.problem.nsolutions
+        return max(
+            0,
+            self.problem.log2_binomial(n, w) - self.problem.log2_binomial(n - k, w - 2 * par.p) - 2 * self.problem.log2_binomial(k1, par.p) - solutions,
+        )
+
     def __repr__(self):
         rep = "Stern estimator for " + str(self.problem)
         return rep
@@ -22,9 +22,9 @@ from .workfactor_helper import binomial_approximation
 
 
 class BallCollisionScipyModel(ScipyModel):
-    def __init__(self, par_names: list, problem: SDProblem, iterations, accuracy):
+    def __init__(self, par_names: list, problem: SDProblem, iterations, accuracy, **kwargs):
         """Optimization model for workfactor computation of Ball-Collision algorithm."""
-        super().__init__(par_names, problem, iterations, accuracy)
+        super().__init__(par_names, problem, iterations, accuracy, **kwargs)
 
     def _build_model_and_set_constraints(self):
         self.L1 = lambda x: binomial_approximation(
@@ -24,10 +24,10 @@ from collections import namedtuple
 
 class BJMMScipyModel(ScipyModel):
     def __init__(
-        self, par_names: list, problem: SDProblem, iterations: int, accuracy: int
+        self, par_names: list, problem: SDProblem, iterations: int, accuracy: int, **kwargs
     ):
         """Optimization model for workfactor computation of BJMM algorithm in depth 3."""
-        super().__init__(par_names, problem, iterations, accuracy)
+        super().__init__(par_names, problem, iterations, accuracy, **kwargs)
 
     def _build_model_and_set_constraints(self):
         """Initializes the constraints for the scipy optimizer."""
@@ -26,9 +26,9 @@ from .workfactor_helper import (
 
 
 class BothMayScipyModel(ScipyModel):
-    def __init__(self, par_names: list, problem: SDProblem, iterations, accuracy):
+    def __init__(self, par_names: list, problem: SDProblem, iterations, accuracy, **kwargs):
         """Optimization model for workfactor computation of Both-May algorithm in depth 2 using May-Ozerov nearest neighbor search."""
-        super().__init__(par_names, problem, iterations, accuracy)
+        super().__init__(par_names, problem, iterations, accuracy, **kwargs)
 
     def _build_model_and_set_constraints(self):
         self.r1 = lambda x: representations_asymptotic(
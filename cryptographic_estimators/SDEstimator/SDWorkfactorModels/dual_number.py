@@ -0,0 +1,144 @@
+# ****************************************************************************
+# Copyright 2023 Technology Innovation Institute
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ****************************************************************************
+
+
+import numpy as np
+
+
+class DualNumber:
+    """Number carrying its gradient with respect to the variables of an optimization model (forward-mode automatic
+    differentiation).
+
+    Arithmetic and comparisons work like for floats (comparisons only consider the value), so that the model
+    functions written for floats also compute their gradient when called with `variables(x)`.
+
+    Args:
+        value (float): The value.
+        gradient (np.ndarray): The gradient of the value.
+
+    Examples:
+        >>> x, y = variables([2., 3.])
+        >>> z = x * y + y / x - 1
+        >>> z.value, z.gradient.tolist()
+        (6.5, [2.25, 2.5])
+        >>> max(0, x - y) == 0, max(x, y) is y
+        (True, True)
+    """
+
+    __slots__ = ("value", "gradient")
+
+    def __init__(self, value: float, gradient: np.ndarray):
+        self.value = value
+        self.gradient = gradient
+
+    def __add__(self, other):
+        if isinstance(other, DualNumber):
+            return DualNumber(self.value + other.value, self.gradient + other.gradient)
+        return DualNumber(self.value + other, self.gradient)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, DualNumber):
+            return DualNumber(self.value - other.value, self.gradient - other.gradient)
+        return DualNumber(self.value - other, self.gradient)
+
+    def __rsub__(self, other):
+        return DualNumber(other - self.value, -self.gradient)
+
+    def __neg__(self):
+        return DualNumber(-self.value, -self.gradient)
+
+    def __mul__(self, other):
+        if isinstance(other, DualNumber):
+            return DualNumber(self.value * other.value, self.gradient * other.value + other.gradient * self.value)
+        return DualNumber(self.value * other, self.gradient * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, DualNumber):
+            return DualNumber(self.value / other.value,
+                              (self.gradient * other.value - other.gradient * self.value) / other.value**2)
+        return DualNumber(self.value / other, self.gradient / other)
+
+    def __rtruediv__(self, other):
+        return DualNumber(other / self.value, self.gradient * (-other / self.value**2))
+
+    def __eq__(self, other):
+        return self.value == _value(other)
+
+    def __ne__(self, other):
+        return self.value != _value(other)
+
+    def __lt__(self, other):
+        return self.value < _value(other)
+
+    def __le__(self, other):
+        return self.value <= _value(other)
+
+    def __gt__(self, other):
+        return self.value > _value(other)
+
+    def __ge__(self, other):
+        return self.value >= _value(other)
+
+    __hash__ = None
+
+    def __float__(self):
+        return float(self.value)
+
+    def __repr__(self):
+        return f"DualNumber({self.value}, {self.gradient.tolist()})"
+
+
+def _value(x):
+    return x.value if isinstance(x, DualNumber) else x
+
+
+def variables(x) -> list:
+    """Returns the coordinates of `x` as dual numbers, whose gradients are the unit vectors."""
+    unit_vectors = np.eye(len(x))
+    return [DualNumber(float(value), unit_vectors[i]) for i, value in enumerate(x)]
+
+
+def value_and_gradient(f, x):
+    """Returns the value and the gradient of `f` at `x`.
+
+    Args:
+        f: Function of the list of coordinates of `x`, computing with `DualNumber` arithmetic.
+        x: The point.
+
+    Examples:
+        >>> value_and_gradient(lambda x: x[0] * x[1], [2., 3.])
+        (6.0, array([3., 2.]))
+        >>> value_and_gradient(lambda x: 5, [2., 3.])
+        (5.0, array([0., 0.]))
+    """
+    result = f(variables(x))
+    if isinstance(result, DualNumber):
+        return float(result.value), result.gradient
+    return float(result), np.zeros(len(x))
+
+
+def gradient(f):
+    """Returns the gradient function of `f`, see `value_and_gradient`."""
+
+    def jacobian(x):
+        return value_and_gradient(f, x)[1]
+
+    return jacobian
@@ -26,7 +26,7 @@ from .workfactor_helper import (
 
 
 class MayOzerovScipyModel(ScipyModel):
-    def __init__(self, par_names: list, problem: SDProblem, iterations, accuracy):
+    def __init__(self, par_names: list, problem: SDProblem, iterations, accuracy, **kwargs):
         """Optimization model for workfactor computation of May-Ozerov algorithm in depth 3 using May-Ozerov nearest neighbor search.
 
         Args:
@@ -34,8 +34,9 @@ class MayOzerovScipyModel(ScipyModel):
             problem (SDProblem): The problem instance.
             iterations (int): Number of iterations.
             accuracy (float): Desired accuracy.
+            **kwargs: Options of the multi-start optimization, see `ScipyModel`.
         """
-        super().__init__(par_names, problem, iterations, accuracy)
+        super().__init__(par_names, problem, iterations, accuracy, **kwargs)
 
     def _build_model_and_set_constraints(self):
         self.r1 = lambda x: representations_asymptotic(
@@ -22,10 +22,10 @@ from .workfactor_helper import binomial_approximation
 
 
 class PrangeScipyModel(ScipyModel):
-    def __init__(self, par_names: list, problem: SDProblem, iterations, accuracy):
+    def __init__(self, par_names: list, problem: SDProblem, iterations, accuracy, **kwargs):
         """Optimization model for workfactor computation of Prange's algorithm."""
         par_names += ["p"]
-        super().__init__(par_names, problem, iterations, accuracy)
+        super().__init__(par_names, problem, iterations, accuracy, **kwargs)
 
     def _build_model_and_set_constraints(self):
         self.constraints = [
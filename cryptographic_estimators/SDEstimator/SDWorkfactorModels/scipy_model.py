@@ -17,30 +17,102 @@
 
 
 import collections
+from collections import deque
+from contextlib import closing
+from itertools import islice
 from ..sd_estimator import SDProblem
 from .workfactor_helper import list_of_random_tuples, wrap, binomial_approximation
-import scipy.optimize as opt
-from math import log2, inf
+from .dual_number import gradient, value_and_gradient
+from math import log2, inf, ceil
+
+# interval of the coordinates of the starting points of the local optimizations
+START_INTERVAL = (0.001, 0.01)
+SAMPLING_METHODS = ("random", "sobol")
 
 
 class ScipyModel:
-    def __init__(self, var_names: list, problem: SDProblem, iterations, accuracy):
+    def __init__(self, var_names: list, problem: SDProblem, iterations, accuracy, workers=1, seed=None,
+                 agreement=None, sampling="random"):
+        """Base class of the optimization models for the asymptotic workfactor computation.
+
+        The workfactor is minimized by `iterations` local optimizations (SLSQP) from different starting points, the
+        best successful one is returned.
+
+        Args:
+            var_names (list): List of parameter names.
+            problem (SDProblem): The problem instance.
+            iterations (int): Number of local optimizations.
+            accuracy (float): Desired accuracy.
+            workers (int, optional): Number of processes running the local optimizations. Defaults to 1.
+            seed (int, optional): Seed of the starting points. Each local optimization derives its own starting point
+                from the seed and its index, so that the result does not depend on `workers`. Defaults to None
+                (not reproducible).
+            agreement (int, optional): Stop as soon as this many local optimizations found the minimum up to
+                `accuracy`. Defaults to None (run all `iterations`).
+            sampling (str, optional): Either "random" (uniformly distributed) or "sobol" (a scrambled Sobol sequence)
+                starting points. Defaults to "random".
+
+        Tests:
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> ScipyModel(["r", "p"], SDProblem(n=100, k=50, w=10), 10, 1e-7, sampling="halton")
+            Traceback (most recent call last):
+            ...
+            ValueError: sampling must be one of ('random', 'sobol')
+            >>> ScipyModel(["r", "p"], SDProblem(n=100, k=50, w=10), 10, 1e-7, workers=0)
+            Traceback (most recent call last):
+            ...
+            ValueError: workers must be at least 1
+        """
+        if sampling not in SAMPLING_METHODS:
+            raise ValueError(f"sampling must be one of {SAMPLING_METHODS}")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
         self.parameters_names = [i for i in var_names if i != "r"]
         self.number_of_variables = len(self.parameters_names)
         self.accuracy = accuracy
         self.iterations = iterations
+        self.workers = workers
+        self.seed = seed
+        self.agreement = agreement
+        self.sampling = sampling
 
         n, k, w = problem.get_parameters()
-        self.rate = lambda x: k / n
-        self.w = lambda x: w / n
-
-        self.set_vars = collections.namedtuple("SciOptModel", " ".join(self.parameters_names))
+        self._problem_parameters = (n, k, w)
+        self._set_problem_functions()
 
         if problem.nsolutions == max(0, problem.expected_number_solutions()):
             self.nsolutions = max(0, binomial_approximation(1, w / n) - (1 - k / n))
         else:
             self.nsolutions = log2(problem.nsolutions) / n
 
+    def _set_problem_functions(self):
+        n, k, w = self._problem_parameters
+        self.rate = lambda x: k / n
+        self.w = lambda x: w / n
+
+        self.set_vars = collections.namedtuple("SciOptModel", " ".join(self.parameters_names))
+
+    def __getstate__(self):
+        # the functions of the model are lambdas, which cannot be pickled, `__setstate__` rebuilds them
+        return {key: value for key, value in self.__dict__.items() if not callable(value) and key != "constraints"}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._set_problem_functions()
+        self._build_model()
+
+    def _build_model(self):
+        """Builds the model and adds the exact Jacobians of the constraints, which are computed by evaluating the
+        constraint functions on dual numbers."""
+        self._build_model_and_set_constraints()
+        for constraint in self.constraints:
+            constraint.setdefault("jac", gradient(constraint["fun"]))
+
+    def _time_gradient(self, x):
+        """Returns the exact gradient of the objective of the optimization."""
+        return value_and_gradient(self._time, x)[1]
+
     def _inject_vars(self, f):
         return wrap(f, self.set_vars)
 
@@ -67,13 +139,51 @@ class ScipyModel:
     def _memory(self, x):
         raise NotImplementedError
 
-    def _optimize(self, parameters):
-        start = list_of_random_tuples(0.001, 0.01, self.number_of_variables)
+    def _starting_points(self):
+        """Returns the starting points of all local optimizations.
+
+        Tests:
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> from cryptographic_estimators.SDEstimator.SDWorkfactorModels.stern import SternScipyModel
+            >>> M = SternScipyModel(["r", "p", "l"], SDProblem(n=100, k=50, w=10), 5, 1e-7, seed=1)
+            >>> S = M._starting_points()
+            >>> len(S), len(S[0]), S == M._starting_points()
+            (5, 2, True)
+            >>> M.seed, M.iterations = 1, 6
+            >>> M._starting_points()[:5] == S
+            True
+            >>> M.sampling = "sobol"
+            >>> S = M._starting_points()
+            >>> len(S), all(0.001 <= v <= 0.01 for x in S for v in x), S == M._starting_points()
+            (6, True, True)
+        """
+        low, high = START_INTERVAL
+        if self.sampling == "sobol" and self.number_of_variables > 0:
+            from scipy.stats import qmc
+
+            sobol = qmc.Sobol(self.number_of_variables, scramble=True, seed=self.seed)
+            points = sobol.random_base2(ceil(log2(max(self.iterations, 1))))[:self.iterations]
+            return qmc.scale(points, low, high).tolist()
+
+        if self.seed is None:
+            return [list_of_random_tuples(low, high, self.number_of_variables) for _ in range(self.iterations)]
+
+        from numpy.random import SeedSequence, default_rng
+
+        return [default_rng(seed).uniform(low, high, self.number_of_variables).tolist()
+                for seed in SeedSequence(self.seed).spawn(self.iterations)]
+
+    def _optimize(self, parameters, start=None):
+        import scipy.optimize as opt
+
+        if start is None:
+            start = list_of_random_tuples(*START_INTERVAL, self.number_of_variables)
         bounds = self._set_bounds(parameters)
 
         result = opt.minimize(
             self._time,
             start,
+            jac=self._time_gradient,
             bounds=bounds,
             tol=self.accuracy,
             constraints=self.constraints,
@@ -81,6 +191,32 @@ class ScipyModel:
         )
         return result
 
+    def _local_optimizations(self, parameters):
+        """Yields `(success, value, x)` of the local optimizations in the order of their starting points.
+
+        With several workers the optimizations run in a process pool, which is shut down when the generator is
+        closed.
+        """
+        starts = iter(self._starting_points())
+        if self.workers == 1:
+            for start in starts:
+                yield _local_optimization(self, parameters, start)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_set_worker_model, initargs=(self,))
+        try:
+            pending = deque(pool.submit(_worker_local_optimization, parameters, start)
+                            for start in islice(starts, 2 * self.workers))
+            while pending:
+                result = pending.popleft().result()
+                for start in islice(starts, 1):
+                    pending.append(pool.submit(_worker_local_optimization, parameters, start))
+                yield result
+        finally:
+            pool.shutdown(cancel_futures=True)
+
     def _get_parameters(self, x):
         par = {}
         par_index = 0
@@ -90,20 +226,61 @@ class ScipyModel:
         return par
 
     def get_time_memory_and_parameters(self, parameters=None):
-        self._build_model_and_set_constraints()
+        """Returns the asymptotic time and memory complexity and the optimal parameters.
+
+        Args:
+            parameters (dict, optional): Parameters fixed to the given values (up to `accuracy`). Defaults to None.
 
-        result = self._optimize(parameters)
+        Tests:
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> from cryptographic_estimators.SDEstimator.SDWorkfactorModels.stern import SternScipyModel
+            >>> P = SDProblem(n=100, k=50, w=10)
+            >>> A = SternScipyModel(["r", "p", "l"], P, 20, 1e-7, seed=3)
+            >>> B = SternScipyModel(["r", "p", "l"], P, 20, 1e-7, seed=3, workers=2)
+            >>> A.get_time_memory_and_parameters({}) == B.get_time_memory_and_parameters({})
+            True
+            >>> C = SternScipyModel(["r", "p", "l"], P, 20, 1e-7, seed=3, agreement=3, sampling="sobol")
+            >>> round(C.get_time_memory_and_parameters({})[0], 4) == round(A.get_time_memory_and_parameters({})[0], 4)
+            True
+        """
+        self._build_model()
 
-        for _ in range(self.iterations - 1):
-            tmp = self._optimize(parameters)
-            if tmp.success and (tmp.fun < result.fun or not result.success):
-                result = tmp
+        best, agreeing = None, 0
+        with closing(self._local_optimizations(parameters)) as results:
+            for success, value, x in results:
+                if not success:
+                    continue
+                if best is None or value < best[0]:
+                    agreeing = agreeing + 1 if best is not None and best[0] - value <= self.accuracy else 1
+                    best = (value, x)
+                elif value - best[0] <= self.accuracy:
+                    agreeing += 1
+                if self.agreement is not None and agreeing >= self.agreement:
+                    break
 
-        x = self.set_vars(*result.x)
-        if not result.success:
+        if best is None:
             return inf, inf, {}
 
+        x = self.set_vars(*best[1])
         return self._time(x), self._memory(x), self._get_parameters(x)
 
     def _build_model_and_set_constraints(self):
         raise NotImplementedError
+
+
+def _local_optimization(model: ScipyModel, parameters, start):
+    result = model._optimize(parameters, start)
+    return bool(result.success), float(result.fun), result.x.tolist()
+
+
+# model of a worker process of `ScipyModel._local_optimizations`
+_worker_model = None
+
+
+def _set_worker_model(model: ScipyModel):
+    global _worker_model
+    _worker_model = model
+
+
+def _worker_local_optimization(parameters, start):
+    return _local_optimization(_worker_model, parameters, start)
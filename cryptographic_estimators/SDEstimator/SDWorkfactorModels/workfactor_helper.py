@@ -18,7 +18,7 @@
 
 from random import uniform as ru
 from math import log2
-from scipy.optimize import fsolve
+from .dual_number import DualNumber
 
 
 def inverse_binary_entropy(v: float):
@@ -29,13 +29,35 @@ def inverse_binary_entropy(v: float):
 
     Returns:
         float: The unique value of x in the range [0, ..., 1/2] such that H^{-1}(x) = v.
+
+    Tests:
+        >>> from cryptographic_estimators.SDEstimator.SDWorkfactorModels.dual_number import variables
+        >>> all(abs(binary_entropy(inverse_binary_entropy(v / 100)) - v / 100) < 1e-12 for v in range(1, 100))
+        True
+        >>> inverse_binary_entropy(1), inverse_binary_entropy(0.000001)
+        (0.5, 0)
+        >>> y = inverse_binary_entropy(2 * variables([0.25])[0])
+        >>> y.value == inverse_binary_entropy(0.5), bool(abs(y.gradient[0] * log2((1 - y.value) / y.value) - 2) < 1e-12)
+        (True, True)
     """
     if v == 1:
         return 0.5
     if v < 0.00001:
         return 0
 
-    return fsolve(lambda x: v - (-x * log2(x) - (1 - x) * log2(1 - x)), 0.0000001)[0]
+    if isinstance(v, DualNumber):
+        x = inverse_binary_entropy(v.value)
+        # derivative of the inverse function, H'(x) = log2((1 - x) / x)
+        return DualNumber(x, v.gradient / log2((1 - x) / x))
+
+    # H is concave, so Newton's method started left of the root increases monotonically towards it
+    x = 1e-12
+    for _ in range(100):
+        step = (v + x * log2(x) + (1 - x) * log2(1 - x)) / log2((1 - x) / x)
+        x += step
+        if step <= 1e-15 * x:
+            break
+    return x
 
 
 def binary_entropy(c: float):
@@ -46,15 +68,46 @@ def binary_entropy(c: float):
     if c < 0. or c > 1.:
         return -1000
 
+    if isinstance(c, DualNumber):
+        # H'(c) = log2((1 - c) / c)
+        return DualNumber(binary_entropy(c.value), c.gradient * log2((1 - c.value) / c.value))
+
     return -(c * log2(c) + (1 - c) * log2(1 - c))
 
 
 def binomial_approximation(n: float, k: float):
-    """Computes the binomial coefficient (n over k) via Sterlings approximation."""
+    """Computes the binomial coefficient (n over k) via Sterlings approximation.
+
+    Tests:
+        >>> from cryptographic_estimators.SDEstimator.SDWorkfactorModels.dual_number import variables
+        >>> n, k = variables([0.7, 0.2])
+        >>> b = binomial_approximation(n, k)
+        >>> h = 1e-7
+        >>> b.value == binomial_approximation(0.7, 0.2)
+        True
+        >>> bool(abs(b.gradient[0] - (binomial_approximation(0.7 + h, 0.2) - b.value) / h) < 1e-5)
+        True
+        >>> bool(abs(b.gradient[1] - (binomial_approximation(0.7, 0.2 + h) - b.value) / h) < 1e-5)
+        True
+    """
     if k > n or n == 0:
         return 0
     if k == n:
         return 0
+
+    if isinstance(n, DualNumber) or isinstance(k, DualNumber):
+        n_value = n.value if isinstance(n, DualNumber) else n
+        k_value = k.value if isinstance(k, DualNumber) else k
+        t = k_value / n_value
+        if 0 < t < 1:
+            # the partial derivatives of n * H(k / n) are -log2(1 - t) and log2((1 - t) / t)
+            result = DualNumber(n_value * binary_entropy(t), 0)
+            if isinstance(n, DualNumber):
+                result.gradient = n.gradient * -log2(1 - t)
+            if isinstance(k, DualNumber):
+                result.gradient = result.gradient + k.gradient * log2((1 - t) / t)
+            return result
+
     return n * binary_entropy(k / n)
 
 
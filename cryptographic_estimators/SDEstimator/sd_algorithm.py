@@ -18,9 +18,13 @@
 
 from ..helper import ComplexityType
 from ..base_algorithm import BaseAlgorithm, optimal_parameter
-from ..SDEstimator.sd_helper import _optimize_m4ri
+from ..base_constants import BASE_WARM_START
+from ..SDEstimator.sd_helper import _optimize_m4ri, _gaussian_elimination_complexity
+from ..SDEstimator.sd_vectorized_helper import near_optimal_choices
 from .sd_problem import SDProblem
+from copy import deepcopy
 from math import log2, inf
+from types import SimpleNamespace
 
 
 class SDAlgorithm(BaseAlgorithm):
@@ -31,15 +35,48 @@ class SDAlgorithm(BaseAlgorithm):
             problem (SDProblem): SDProblem object including all necessary parameters.
             var_ranges (bool, optional): Allow parameter optimization to adapt ranges if necessary. Defaults to True.
             hmap (bool, optional): Indicates if hashmap is being used for linear time sorting. Defaults to True.
+            vectorized (bool, optional): Use the vectorized cost evaluation to preselect parameters, if the algorithm
+                supports it. Defaults to True.
+            workfactor_accuracy (int, optional): The asymptotic (TildeO) workfactor is the minimum of
+                `10 * workfactor_accuracy` local optimizations. Defaults to 1.
+            workfactor_workers (int, optional): Number of processes running these local optimizations. Defaults to 1.
+            workfactor_seed (int, optional): Seed of their starting points, which makes the TildeO complexities
+                reproducible (independently of `workfactor_workers`). Defaults to None.
+            workfactor_agreement (int, optional): Stop the local optimizations as soon as this many agree on the
+                minimum. Defaults to None (no early stop).
+            workfactor_sampling (str, optional): Either "random" or "sobol" starting points. Defaults to "random".
+            warm_start (Union[SDAlgorithm, dict], optional): Previously optimized instance of the algorithm (e.g. for
+                neighbouring parameters of a sweep) or its `get_optimal_parameters_dict()`. The parameter ranges of
+                the optimization are narrowed according to these parameters, and widened again if the optimum hits
+                the narrowed bounds. Only used if `var_ranges` is set. Defaults to None.
+
+        Examples:
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import Stern
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> A = Stern(SDProblem(n=3488, k=2720, w=64))
+            >>> B = Stern(SDProblem(n=3488, k=2720, w=65), warm_start=A.get_optimal_parameters_dict())
+            >>> B.optimal_parameters() == Stern(SDProblem(n=3488, k=2720, w=65)).optimal_parameters()
+            True
         """
         super(SDAlgorithm, self).__init__(problem, **kwargs)
         self._variable_parameter_ranges = kwargs.get("var_ranges", 1)
         self._hmap = kwargs.get("hmap", 1)
+        self._vectorized = kwargs.get("vectorized", 1)
         self._adjust_radius = kwargs.get("adjust_radius", 10)
         self.workfactor_accuracy = kwargs.get("workfactor_accuracy", 1)
+        self._workfactor_options = {
+            "workers": kwargs.get("workfactor_workers", 1),
+            "seed": kwargs.get("workfactor_seed", None),
+            "agreement": kwargs.get("workfactor_agreement", None),
+            "sampling": kwargs.get("workfactor_sampling", "random"),
+        }
         self.scipy_model = None
         self.full_domain = kwargs.get("full_domain", False)
         self._current_minimum_for_early_abort = inf
+        warm_start = kwargs.get(BASE_WARM_START, None)
+        if isinstance(warm_start, BaseAlgorithm):
+            warm_start = warm_start.get_optimal_parameters_dict()
+        self._warm_start = dict(warm_start) if warm_start else {}
         n, k, _ = self.problem.get_parameters()
         self.set_parameter_ranges("r", 0, n - k)
 
@@ -68,12 +105,19 @@ class SDAlgorithm(BaseAlgorithm):
     def _find_optimal_parameters(self):
         """Enumerates over all valid parameter configurations within the ranges of the optimization and saves the best result in `self._optimal_parameter`."""
         _ = self.r()
+        if self._warm_start and self._variable_parameter_ranges:
+            self._find_optimal_parameters_near_warm_start()
+            return
+
+        self._start_optimization()
         time = inf
         while True:
             stop = True
-            for params in self._valid_choices():
-                if self._are_parameters_invalid(params):
+            for params in self._optimization_candidates():
+                if self._are_parameters_invalid(params) or self._is_pruned(params, time):
                     continue
+                if not self._continue_optimization():
+                    break
                 tmp_time, tmp_memory = self._time_and_memory_complexity(params)
 
                 if self.bit_complexities:
@@ -88,12 +132,106 @@ class SDAlgorithm(BaseAlgorithm):
                     for i in params:
                         self._optimal_parameters[i] = params[i]
 
+                self._register_evaluation(time)
+
+            if self._partial_optimization:
+                break
+
             if self._variable_parameter_ranges and len(self._optimal_parameters) > 1:
                 stop = self._adjust_parameter_ranges()
+                if not stop:
+                    self._adjustment_rounds += 1
+                    self._statistics["rounds"] += 1
+                    if self._progress_callback is not None:
+                        self._report_progress(time)
 
             if stop:
                 break
         self._current_minimum_for_early_abort = inf
+        self._time_lower_bounds = dict()
+
+    def _find_optimal_parameters_near_warm_start(self):
+        """Optimizes the parameters with their upper bounds lowered according to the warm start parameters.
+
+        The upper bound of each parameter is set to four times its warm start value plus `4 * adjust_radius`, which
+        leaves room for coupled parameters (e.g. `p` and `l`) to move together. Whenever the optimum comes closer than
+        `adjust_radius` to such a lowered bound, the bounds are recomputed from the new optimum and the optimization is
+        repeated.
+        """
+        initial_parameters = dict(self._optimal_parameters)
+        initial_ranges = deepcopy(self._parameter_ranges)
+        bound, self._warm_start = self._warm_start, {}
+        variable_parameter_ranges, self._variable_parameter_ranges = self._variable_parameter_ranges, 0
+        r = self._adjust_radius
+
+        while True:
+            self._optimal_parameters = dict(initial_parameters)
+            self._parameter_ranges = deepcopy(initial_ranges)
+            free = [i for i in self.parameter_names() if i in bound and i not in initial_parameters]
+            for i in free:
+                self._parameter_ranges[i]["max"] = min(initial_ranges[i]["max"], 4 * (bound[i] + r))
+            self._find_optimal_parameters()
+
+            optimum = self._optimal_parameters
+            if self._partial_optimization or not any(optimum.get(i, -inf) > self._parameter_ranges[i]["max"] - r
+                       and self._parameter_ranges[i]["max"] < initial_ranges[i]["max"] for i in free):
+                break
+            bound = dict(optimum)
+
+        self._variable_parameter_ranges = variable_parameter_ranges
+        self._parameter_ranges = initial_ranges
+
+    def _warm_start_of_depth(self, kwargs: dict, depth: int, attribute: str):
+        """Returns `kwargs` for the sub-algorithm of the given depth, with the warm start restricted to it.
+
+        Args:
+            kwargs (dict): Keyword arguments of the algorithm.
+            depth (int): Depth of the sub-algorithm.
+            attribute (str): Name of the attribute holding the sub-algorithm.
+        """
+        warm_start = kwargs.get(BASE_WARM_START, None)
+        if isinstance(warm_start, BaseAlgorithm):
+            warm_start = getattr(warm_start, attribute, None)
+        elif warm_start is not None and warm_start.get("depth", depth) != depth:
+            warm_start = None
+        return {**kwargs, BASE_WARM_START: warm_start}
+
+    def _optimization_candidates(self):
+        """Returns an iterable of the parameter sets evaluated by `_find_optimal_parameters`.
+
+        If the algorithm implements `_vectorized_time_and_memory_complexity`, the whole grid of valid choices is
+        evaluated at once in floating point and only those parameter sets are returned that might be optimal.
+        """
+        if not self._vectorized or callable(self.memory_access):
+            return self._count_candidates(self._valid_choices())
+
+        try:
+            grid = self._valid_grid()
+        except NotImplementedError:
+            return self._count_candidates(self._valid_choices())
+
+        size = len(next(iter(grid.values())))
+        self._statistics["candidates"] += size
+        if size == 0:
+            return iter(())
+
+        time, memory, ambiguous = self._vectorized_time_and_memory_complexity(grid)
+        return near_optimal_choices(self, grid, time, memory, ambiguous, {"r": self._optimal_parameters["r"]})
+
+    def _valid_grid(self):
+        """Returns a dictionary mapping each parameter (except `r`) to the array of its values in `_valid_choices`."""
+        raise NotImplementedError
+
+    def _vectorized_time_and_memory_complexity(self, grid: dict):
+        """Computes approximated time and memory complexity for all parameter sets in `grid`.
+
+        Args:
+            grid (dict): Dictionary of parameter arrays, see `_valid_grid`.
+
+        Returns:
+            Arrays of the time and memory complexities and the mask of points whose approximation is not reliable.
+        """
+        raise NotImplementedError
 
     def _find_optimal_tilde_o_parameters(self):
         """Enumerates all valid parameters within the given ranges to find the optimal one asymptotically. Calls the C interface."""
@@ -128,6 +266,24 @@ class SDAlgorithm(BaseAlgorithm):
         """Computes time and memory complexity for given parameters."""
         raise NotImplementedError
 
+    def _log2_permutations(self, par: SimpleNamespace):
+        """Returns the logarithm of the expected number of permutations (depending only on `_lower_bound_parameters`).
+
+        Args:
+            par (SimpleNamespace): Parameters of the algorithm.
+        """
+        raise NotImplementedError
+
+    def _time_lower_bound(self, parameters: dict):
+        """Returns the cost of the permutations and Gaussian eliminations, which is part of every time complexity.
+
+        Args:
+            parameters (dict): Dictionary including the parameters.
+        """
+        n, k, _ = self.problem.get_parameters()
+        par = SimpleNamespace(**parameters)
+        return self._log2_permutations(par) + log2(_gaussian_elimination_complexity(n, k, par.r))
+
     def _compute_time_complexity(self, parameters: dict):
         """Compute and return the time complexity either in the asymptotic case or for real parameters.
 
@@ -166,8 +322,18 @@ class SDAlgorithm(BaseAlgorithm):
 
         Args:
             parameters (dict): Dictionary of parameters used for the time complexity computation.
+
+        Tests:
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import Stern
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> from cryptographic_estimators.helper import ComplexityType
+            >>> A = Stern(SDProblem(n=100, k=50, w=10), complexity_type=ComplexityType.TILDEO.value,
+            ...           workfactor_seed=5, workfactor_accuracy=3)
+            >>> B = Stern(SDProblem(n=100, k=50, w=10), complexity_type=ComplexityType.TILDEO.value,
+            ...           workfactor_seed=5, workfactor_accuracy=3, workfactor_workers=2)
+            >>> A.time_complexity() == B.time_complexity() and A.memory_complexity() == B.memory_complexity()
+            True
         """
-        pass
         if self.scipy_model is None:
             raise NotImplementedError("For " + self._name + " TildeO complexity is not yet implemented")
         model = self.scipy_model(
@@ -175,6 +341,7 @@ class SDAlgorithm(BaseAlgorithm):
             self.problem,
             iterations=self.workfactor_accuracy * 10,
             accuracy=1e-7,
+            **self._workfactor_options,
         )
         wf_time, wf_memory, par = model.get_time_memory_and_parameters(parameters=parameters)
         self._optimal_parameters.update(par)
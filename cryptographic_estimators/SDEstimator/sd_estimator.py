@@ -15,7 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ****************************************************************************
 
-import pytest
 from math import inf
 from ..SDEstimator.sd_algorithm import SDAlgorithm
 from ..SDEstimator.sd_problem import SDProblem
@@ -41,7 +40,7 @@ class SDEstimator(BaseEstimator):
         if not kwargs.get("excluded_algorithms"):
             kwargs["excluded_algorithms"] = []
 
-        kwargs["excluded_algorithms"] += self.excluded_algorithms_by_default
+        kwargs["excluded_algorithms"] = list(kwargs["excluded_algorithms"]) + self.excluded_algorithms_by_default
 
         super(SDEstimator, self).__init__(
             SDAlgorithm, SDProblem(n, k, w, memory_bound=memory_bound, **kwargs), **kwargs
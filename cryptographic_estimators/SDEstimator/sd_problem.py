@@ -17,7 +17,8 @@
 
 
 from ..base_problem import BaseProblem
-from math import comb, log2
+from ..helper import LogBinomialTable
+from math import log2
 from .sd_constants import *
 
 
@@ -43,6 +44,7 @@ class SDProblem(BaseProblem):
         self.parameters[SD_CODE_LENGTH] = n
         self.parameters[SD_CODE_DIMENSION] = k
         self.parameters[SD_ERROR_WEIGHT] = w
+        self.log2_binomial = LogBinomialTable()
 
         self.nsolutions = kwargs.get("nsolutions", max(self.expected_number_solutions(), 0))
 
@@ -74,7 +76,7 @@ class SDProblem(BaseProblem):
     def expected_number_solutions(self):
         """Returns the logarithm of the expected number of existing solutions to the problem."""
         n, k, w = self.get_parameters()
-        return log2(comb(n, w)) - (n - k)
+        return self.log2_binomial(n, w) - (n - k)
 
     def __repr__(self):
         n, k, w = self.get_parameters()
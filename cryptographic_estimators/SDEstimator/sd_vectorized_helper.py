@@ -0,0 +1,177 @@
+# ****************************************************************************
+# Copyright 2023 Technology Innovation Institute
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ****************************************************************************
+
+"""Log-domain NumPy versions of the SD cost functions, evaluated over whole parameter grids.
+
+All functions mirror the exact integer arithmetic of `sd_helper` and the algorithms' `_time_and_memory_complexity`,
+including the floor and ceil operations. Whenever a rounding step cannot be decided reliably in floating point, the
+corresponding grid point is flagged as ambiguous. Callers re-evaluate the ambiguous and the near-optimal points with
+the exact scalar code, so that the vectorized engine never changes the optimization result.
+"""
+
+import numpy as np
+
+# maximal deviation from an integer (relative to the value) for which a rounding step is considered undecidable
+AMBIGUITY_TOLERANCE = 1e-9
+# points whose approximated time is at most this far (in bits) above the approximated minimum are re-evaluated
+OPTIMALITY_TOLERANCE = 1e-5
+# above 2**FLOOR_BOUND the effect of a floor/ceil on the logarithm (< 2**-FLOOR_BOUND bits) is neglected
+FLOOR_BOUND = 26
+
+
+def log2_binom(log2_fac: np.ndarray, n: np.ndarray, k: np.ndarray):
+    """Returns log2 of the binomial coefficients `n` over `k` (element-wise, 0 <= k <= n).
+
+    Args:
+        log2_fac (np.ndarray): Table of log2 factorials, see `LogBinomialTable.log2_factorials`.
+        n (np.ndarray): Upper arguments.
+        k (np.ndarray): Lower arguments.
+
+    Examples:
+        >>> import numpy as np
+        >>> from cryptographic_estimators.helper import LogBinomialTable
+        >>> from cryptographic_estimators.SDEstimator.sd_vectorized_helper import log2_binom
+        >>> fac = LogBinomialTable().log2_factorials(10)
+        >>> [round(float(i), 6) for i in log2_binom(fac, np.array([10, 10, 4]), np.array([0, 5, 2]))]
+        [0.0, 7.97728, 2.584963]
+    """
+    return log2_fac[n] - log2_fac[k] - log2_fac[n - k]
+
+
+def near_integer(x: np.ndarray, scale=1):
+    """Returns a mask of the entries of `x` for which rounding to an integer cannot be decided reliably.
+
+    Args:
+        x (np.ndarray): Approximated values.
+        scale (np.ndarray, optional): Magnitude of the approximation error relative to AMBIGUITY_TOLERANCE. Defaults to 1.
+    """
+    return np.abs(x - np.rint(x)) <= AMBIGUITY_TOLERANCE * np.maximum(scale, 1)
+
+
+def log2_floor_pow2(x: np.ndarray):
+    """Returns log2(floor(2**x)) and the mask of ambiguous entries.
+
+    Entries with floor(2**x) = 0 are -inf. Values close to zero are never ambiguous, as their floor is certainly zero.
+
+    Args:
+        x (np.ndarray): Logarithms of the values to round.
+    """
+    small = x < FLOOR_BOUND
+    value = np.exp2(np.minimum(x, FLOOR_BOUND))
+    ambiguous = small & (value >= 0.5) & near_integer(value, value)
+    with np.errstate(divide="ignore"):
+        floored = np.log2(np.floor(value))
+    return np.where(small, floored, x), ambiguous
+
+
+def log2_ceil_pow2(x: np.ndarray):
+    """Returns log2(ceil(2**x)) and the mask of ambiguous entries.
+
+    Args:
+        x (np.ndarray): Logarithms of the values to round.
+    """
+    small = x < FLOOR_BOUND
+    value = np.exp2(np.minimum(x, FLOOR_BOUND))
+    ambiguous = small & (value >= 0.5) & near_integer(value, value)
+    return np.where(small, np.log2(np.ceil(value)), x), ambiguous
+
+
+def log2_list_merge_complexity(log2_L: np.ndarray, l: np.ndarray, hmap: bool):
+    """Vectorized log2 of `sd_helper._list_merge_complexity` and the mask of ambiguous entries.
+
+    Args:
+        log2_L (np.ndarray): Logarithms of the sizes of the lists to be merged (exactly 0 for lists of size one).
+        l (np.ndarray): Amount of bits used for matching.
+        hmap (bool): Indicates if a hash map is being used.
+    """
+    collisions, ambiguous = log2_floor_pow2(2 * log2_L - l)
+    if hmap:
+        result = np.logaddexp2(1 + log2_L, collisions)
+    else:
+        integral_log = np.trunc(log2_L)
+        ambiguous |= near_integer(log2_L)
+        with np.errstate(divide="ignore"):
+            result = np.maximum(0, np.logaddexp2(1 + np.log2(integral_log) + log2_L, collisions))
+
+    is_one = log2_L == 0
+    return np.where(is_one, 0, result), ambiguous & ~is_one
+
+
+def log2_memory_access_cost(memory_access: int, memory: np.ndarray):
+    """Vectorized version of `BaseAlgorithm.memory_access_cost` for the predefined cost models.
+
+    Args:
+        memory_access (int): Memory access cost model (0 - constant, 1 - logarithmic, 2 - square-root, 3 - cube-root).
+        memory (np.ndarray): Memory consumption (logarithmic).
+    """
+    if memory_access == 1:
+        return np.log2(memory)
+    elif memory_access == 2:
+        return memory / 2
+    elif memory_access == 3:
+        return memory / 3
+    return np.zeros_like(memory)
+
+
+def near_optimal_mask(algorithm, time: np.ndarray, memory: np.ndarray, ambiguous: np.ndarray):
+    """Returns the mask of the points that have to be evaluated exactly to find the optimum.
+
+    These are all ambiguous points and all points whose approximated time is within OPTIMALITY_TOLERANCE of the
+    approximated minimum. The time and memory are converted and compared in the same way as in the exact optimization
+    loops (`BaseAlgorithm` and `SDAlgorithm`).
+
+    Args:
+        algorithm (BaseAlgorithm): Algorithm whose parameters are optimized.
+        time (np.ndarray): Approximated time complexities (logarithmic, inf for invalid points).
+        memory (np.ndarray): Approximated memory complexities (logarithmic, inf for invalid points).
+        ambiguous (np.ndarray): Mask of the points whose approximation is not reliable.
+    """
+    memory_bound = algorithm.problem.memory_bound
+    if algorithm.bit_complexities:
+        memory = algorithm.problem.to_bitcomplexity_memory(memory)
+
+    with np.errstate(invalid="ignore"):
+        time = time + log2_memory_access_cost(algorithm.memory_access, memory)
+        ambiguous = ambiguous | (np.abs(memory - memory_bound) <= AMBIGUITY_TOLERANCE)
+        feasible = (memory < memory_bound) & np.isfinite(time) & ~ambiguous
+
+    selected = ambiguous.copy()
+    if feasible.any():
+        selected |= feasible & (time <= time[feasible].min() + OPTIMALITY_TOLERANCE)
+    return selected
+
+
+def near_optimal_choices(algorithm, grid: dict, time: np.ndarray, memory: np.ndarray, ambiguous: np.ndarray,
+                         fixed_parameters: dict = None):
+    """Yields the parameter sets of `grid` selected by `near_optimal_mask`, in the order of `grid`.
+
+    Args:
+        algorithm (BaseAlgorithm): Algorithm whose parameters are optimized.
+        grid (dict): Dictionary mapping parameter names to arrays of the same length.
+        time (np.ndarray): Approximated time complexities (logarithmic, inf for invalid points).
+        memory (np.ndarray): Approximated memory complexities (logarithmic, inf for invalid points).
+        ambiguous (np.ndarray): Mask of the points whose approximation is not reliable.
+        fixed_parameters (dict, optional): Parameters added to every yielded parameter set. Defaults to None.
+    """
+    selected = near_optimal_mask(algorithm, time, memory, ambiguous)
+    names = list(grid.keys())
+    columns = [grid[i][selected].tolist() for i in names]
+    for values in zip(*columns):
+        indices = dict(zip(names, values))
+        if fixed_parameters:
+            indices.update(fixed_parameters)
+        yield indices
@@ -111,7 +111,7 @@ class LeeBrickell(SDFqAlgorithm):
         #enum = k**par.p * q**(max(0, par.p-self.is_syndrome_zero))
         memory = log2(k * n)
 
-        Tp = max(log2(binom(n, w)) - log2(binom(n - k, w - par.p)) - log2(binom(k, par.p)) - solutions, 0)
+        Tp = max(self.problem.log2_binomial(n, w) - self.problem.log2_binomial(n - k, w - par.p) - self.problem.log2_binomial(k, par.p) - solutions, 0)
         Tg = k*k
         time = Tp + log2(Tg + enum) + log2(n)
         if verbose_information is not None:
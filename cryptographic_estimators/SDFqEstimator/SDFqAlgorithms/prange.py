@@ -17,7 +17,7 @@
 
 from ...SDFqEstimator.sdfq_algorithm import SDFqAlgorithm
 from ...SDFqEstimator.sdfq_problem import SDFqProblem
-from ...SDFqEstimator.sdfq_helper import _mem_matrix, binom, log2
+from ...SDFqEstimator.sdfq_helper import _mem_matrix, log2
 from ..sdfq_constants import *
 
 
@@ -57,7 +57,7 @@ class Prange(SDFqAlgorithm):
 
         memory = log2(_mem_matrix(n, k, 0)) + log2(n)
 
-        Tp = max(log2(binom(n, w)) - log2(binom(n - k, w)) - solutions, 0)
+        Tp = max(self.problem.log2_binomial(n, w) - self.problem.log2_binomial(n - k, w) - solutions, 0)
         Tg = log2(k*k)
         time = Tp + Tg + log2(n)
 
@@ -24,6 +24,8 @@ from ..sdfq_constants import *
 
 
 class Stern(SDFqAlgorithm):
+    _lower_bound_parameters = ("p",)
+
     def __init__(self, problem: SDFqProblem, **kwargs):
         """Construct an instance of Stern's estimator [Pet11]_, [Ste88]_, [BLP08]_.
 
@@ -104,7 +106,7 @@ class Stern(SDFqAlgorithm):
         _, k, _, q = self.problem.get_parameters()
         k1 = k//2
         for p in range(new_ranges["p"]["min"], min(k1, new_ranges["p"]["max"])):
-            l_val = int(log2(binom(k1, p)) - log2(q-1)*p)
+            l_val = int(self.problem.log2_binomial(k1, p) - log2(q-1)*p)
             l_search_radius = self._adjust_radius
             for l in range(max(new_ranges["l"]["min"], l_val-l_search_radius), min(new_ranges["l"]["max"], l_val+l_search_radius)):
                 indices = {"p": p, "l": l}
@@ -133,13 +135,11 @@ class Stern(SDFqAlgorithm):
             return inf, inf
 
         memory = log2((L1 + L2) * par.l + _mem_matrix(n, k, 0)) + log2(n)
-        solutions = self.problem.nsolutions
 
         if memory > memory_bound:
             return inf, inf
 
-        Tp = max(0,
-                 log2(binom(n, w)) - log2(binom(n - k - par.l, w - 2 * par.p)) - log2(binom(k1, par.p)**2) - solutions)
+        Tp = self._log2_permutations(par)
 
         Tg = (n-k)**2 * (n+k) // 2
         
@@ -156,6 +156,28 @@ class Stern(SDFqAlgorithm):
 
         return time, memory
 
+    def _log2_permutations(self, par: SimpleNamespace):
+        """Returns the logarithm of the expected number of permutations, which is non-decreasing in `l`.
+
+        Args:
+            par (SimpleNamespace): Parameters of the algorithm.
+        """
+        n, k, w, _ = self.problem.get_parameters()
+        k1 = k // 2
+        solutions = self.problem.nsolutions
+        return max(0,
+                   self.problem.log2_binomial(n, w) - self.problem.log2_binomial(n - k - par.l, w - 2 * par.p) - 2 * self.problem.log2_binomial(k1, par.p) - solutions)
+
+    def _time_lower_bound(self, parameters: dict):
+        """Returns the cost of the permutations and Gaussian eliminations for `l = 0`, which bounds the time for every `l`.
+
+        Args:
+            parameters (dict): Dictionary including the parameters.
+        """
+        n, k, _, _ = self.problem.get_parameters()
+        Tg = (n-k)**2 * (n+k) // 2
+        return log2(Tg) + self._log2_permutations(SimpleNamespace(p=parameters["p"], l=0))
+
     def __repr__(self):
         rep = "Stern estimator for " + str(self.problem)
         return rep
@@ -38,7 +38,7 @@ class SDFqEstimator(BaseEstimator):
         if not kwargs.get("excluded_algorithms"):
             kwargs["excluded_algorithms"] = []
 
-        kwargs["excluded_algorithms"] += self.excluded_algorithms_by_default
+        kwargs["excluded_algorithms"] = list(kwargs["excluded_algorithms"]) + self.excluded_algorithms_by_default
         super(SDFqEstimator, self).__init__(SDFqAlgorithm, SDFqProblem(
             n, k, w, q, memory_bound=memory_bound, **kwargs), **kwargs)
 
@@ -16,7 +16,8 @@
 # ****************************************************************************
 
 from ..base_problem import BaseProblem
-from math import log2, comb
+from ..helper import LogBinomialTable
+from math import log2
 from .sdfq_constants import *
 
 
@@ -45,6 +46,7 @@ class SDFqProblem(BaseProblem):
         self.parameters[SDFQ_CODE_DIMENSION] = k
         self.parameters[SDFQ_ERROR_WEIGHT] = w
         self.parameters[SDFQ_ERROR_FIELD_SIZE] = q
+        self.log2_binomial = LogBinomialTable()
 
         self.nsolutions = kwargs.get("nsolutions", max(self.expected_number_solutions(), 0))
         self.is_syndrome_zero = kwargs.get("is_syndrome_zero", True)
@@ -69,7 +71,7 @@ class SDFqProblem(BaseProblem):
     def expected_number_solutions(self):
         """Returns the logarithm of the expected number of existing solutions to the problem."""
         n, k, w, q = self.get_parameters()
-        Nw = log2(comb(n, w)) + log2(q-1)*w + log2(q)*(k - n)
+        Nw = self.log2_binomial(n, w) + log2(q-1)*w + log2(q)*(k - n)
         return max(Nw, 0)
 
     def __repr__(self):
@@ -50,13 +50,13 @@ class DirectAttack(UOVAlgorithm):
         h = self._h
         excluded_algorithms = kwargs.get(BASE_EXCLUDED_ALGORITHMS, [Lokshtanov])
         complexity_type = self.complexity_type
-        self._MQEstimator = MQEstimator(n=n, m=m, q=q,
-                                        w=w,
-                                        h=h,
-                                        excluded_algorithms=excluded_algorithms,
-                                        memory_access=0,
-                                        complexity_type=complexity_type,
-                                        bit_complexities=0)
+        self._MQEstimator = self._sub_estimators.get(MQEstimator, n=n, m=m, q=q,
+                                                     w=w,
+                                                     h=h,
+                                                     excluded_algorithms=excluded_algorithms,
+                                                     memory_access=0,
+                                                     complexity_type=complexity_type,
+                                                     bit_complexities=0)
         self._fastest_algorithm = None
         self._attack_type = BASE_FORGERY_ATTACK
 
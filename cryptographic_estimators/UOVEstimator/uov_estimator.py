@@ -16,7 +16,6 @@
 # ****************************************************************************
 
 
-import pytest
 from .uov_algorithm import UOVAlgorithm
 from .uov_problem import UOVProblem
 from ..base_estimator import BaseEstimator
@@ -2,18 +2,39 @@ from .base_algorithm import BaseAlgorithm
 from .base_estimator import BaseEstimator
 from .base_problem import BaseProblem
 from .helper import ComplexityType, concat_pretty_tables, _truncate, round_or_truncate
-from . import SDEstimator
-from . import MQEstimator
-from . import SDFqEstimator
-from . import RegSDEstimator
-from . import PKEstimator
-from . import LEEstimator
-from . import PEEstimator
-from . import DummyEstimator
-from . import MREstimator
-from . import UOVEstimator
-from . import MAYOEstimator
-from . import RankSDEstimator
+from .estimation_sweep import sweep, sweep_to_jsonl
+from .estimate_cache import EstimateCache
+from .sub_estimator_registry import SubEstimatorRegistry
+
+# The estimator subpackages are imported on first access (PEP 562), so that
+# importing the package, or a single estimator, does not load all of them.
+_SUBPACKAGES = (
+    "SDEstimator",
+    "MQEstimator",
+    "SDFqEstimator",
+    "RegSDEstimator",
+    "PKEstimator",
+    "LEEstimator",
+    "PEEstimator",
+    "DummyEstimator",
+    "MREstimator",
+    "UOVEstimator",
+    "MAYOEstimator",
+    "RankSDEstimator",
+    "BIKEEstimator",
+)
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        from importlib import import_module
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBPACKAGES))
+
 
 # WARNING:
 # This sets the MAXIMUM number of coefficients that can be calculated for any
@@ -19,11 +19,25 @@
 from typing import Union, Callable
 from .helper import ComplexityType
 import functools
+import threading
+from collections import Counter
 from math import inf, log2
-from .base_constants import BASE_BIT_COMPLEXITIES, BASE_COMPLEXITY_TYPE, BASE_ESTIMATE, BASE_MEMORY_ACCESS, BASE_TILDEO, BASE_ATTACK_TYPE
+from time import monotonic
+from .base_constants import BASE_BIT_COMPLEXITIES, BASE_COMPLEXITY_TYPE, BASE_ESTIMATE, BASE_MEMORY_ACCESS, BASE_TILDEO, BASE_ATTACK_TYPE, \
+    BASE_PRUNING, BASE_SUB_ESTIMATORS, BASE_PROGRESS_CALLBACK, BASE_CANCEL_TOKEN, BASE_MAX_EVALUATIONS, BASE_TIME_BUDGET
+from .sub_estimator_registry import SubEstimatorRegistry
 
 
 class BaseAlgorithm:
+    # parameters which determine the value of `_time_lower_bound`, an empty tuple disables the pruning
+    _lower_bound_parameters = ()
+    # names of the methods decorated with @optimal_parameter, set for every subclass by `__init_subclass__`
+    _optimal_parameter_method_names = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._optimal_parameter_method_names = cls._find_optimal_parameter_method_names()
+
     def __init__(self, problem, **kwargs):
         """Base class for algorithms complexity estimator.
 
@@ -36,12 +50,33 @@ class BaseAlgorithm:
                 0: estimate, 1: tilde O complexity
             bit_complexities (int, optional): Determines if complexity is given in bit operations
                 or basic operations. Defaults to 1 (in bit).
+            pruning (bool, optional): Skip parameter sets whose time lower bound exceeds the best time found so far
+                during the optimization (see `pruned_points`). Defaults to True.
+            sub_estimators (SubEstimatorRegistry, optional): Registry providing the estimators used as subroutines.
+                Defaults to a new registry owned by the algorithm.
+            progress_callback (callable, optional): Called during the optimization with a dictionary holding the
+                `algorithm` name, the number of `evaluations`, the `best_time` found so far, the number of parameter
+                range adjustment `rounds` and the `elapsed` seconds. Defaults to None.
+            cancel_token (optional): Object with an `is_set()` method, e.g. a `threading.Event`. Once it is set, the
+                optimization stops and keeps the best parameters found so far. Defaults to None.
+            max_evaluations (int, optional): Maximal number of parameter sets evaluated per optimization, the best
+                parameters found so far are kept. Defaults to no limit.
+            time_budget (float, optional): Maximal wall-clock time in seconds per optimization, the best parameters
+                found so far are kept. Defaults to no limit.
         """
 
         self.bit_complexities = kwargs.get(BASE_BIT_COMPLEXITIES, 1)
         self._complexity_type = kwargs.get(
             BASE_COMPLEXITY_TYPE, ComplexityType.ESTIMATE.value)
         self._memory_access = kwargs.get(BASE_MEMORY_ACCESS, 0)
+        self._pruning = kwargs.get(BASE_PRUNING, True)
+        self._sub_estimators = kwargs.get(BASE_SUB_ESTIMATORS)
+        if self._sub_estimators is None:
+            self._sub_estimators = SubEstimatorRegistry()
+        self._progress_callback = kwargs.get(BASE_PROGRESS_CALLBACK, None)
+        self._cancel_token = kwargs.get(BASE_CANCEL_TOKEN, None)
+        self._max_evaluations = kwargs.get(BASE_MAX_EVALUATIONS, inf)
+        self._time_budget = kwargs.get(BASE_TIME_BUDGET, inf)
 
         if not callable(self._memory_access) and self._memory_access not in [0, 1, 2, 3]:
             raise ValueError("memory_access must either 0, 1, 2, 3 or a sage function")
@@ -58,15 +93,108 @@ class BaseAlgorithm:
         self.problem = problem
         self._time_complexity = None
         self._memory_complexity = None
+        # held while the state of the algorithm is computed or reset, as inner algorithms shared through the
+        # registry of sub-estimators may be used by several threads
+        self._lock = threading.RLock()
         self._parameter_ranges = dict()
         self._optimal_parameters_methods = self._get_optimal_parameter_methods_()
         self._current_minimum_for_early_abort = inf
+        self._time_lower_bounds = dict()
+        self._pruned_points = 0
+        self._evaluations = 0
+        self._adjustment_rounds = 0
+        self._optimization_start = None
+        self._partial_optimization = False
+        self._statistics = Counter()
         for i in self._optimal_parameters_methods:
             self._parameter_ranges[i.__name__] = {}
 
         self._attack_type = BASE_ATTACK_TYPE
         self._time_complexity_is_convex = False
 
+    def __getstate__(self):
+        """Drops the lock and the options stopping or monitoring the optimization, so that the algorithm can be sent
+        to worker processes.
+
+        Callbacks and cancel tokens are in general not picklable and would not reach the worker anyway, so an
+        unpickled algorithm is always optimized completely.
+
+        Tests:
+            >>> import pickle, threading
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import Prange
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> A = Prange(SDProblem(n=100, k=50, w=10), cancel_token=threading.Event(), max_evaluations=1,
+            ...            progress_callback=lambda progress: None, time_budget=1)
+            >>> B = pickle.loads(pickle.dumps(A))
+            >>> B._progress_callback, B._cancel_token, B._max_evaluations, B._time_budget
+            (None, None, inf, inf)
+        """
+        state = self.__dict__.copy()
+        del state["_lock"]
+        for i in ["_progress_callback", "_cancel_token", "_max_evaluations", "_time_budget"]:
+            state.pop(i, None)
+        return state
+
+    def __setstate__(self, state):
+        self._progress_callback = None
+        self._cancel_token = None
+        self._max_evaluations = inf
+        self._time_budget = inf
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def _optimization_results(self):
+        """Returns the results of the parameter optimization, keyed by attribute name.
+
+        The results of the algorithms used internally (e.g. `BJMM_depth_2` of `BJMM`) are included under the key
+        `algorithms`, by the name of the attribute holding them. Estimators used as subroutines are not included, see
+        `_restore_optimization_results`.
+
+        Tests:
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import BJMM
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> A = BJMM(SDProblem(n=100, k=50, w=10))
+            >>> _ = A.time_complexity()
+            >>> sorted(A._optimization_results())
+            ['_memory_complexity', '_optimal_parameters', '_partial_optimization', '_statistics', '_time_complexity', '_verbose_information', 'algorithms']
+            >>> sorted(A._optimization_results()["algorithms"])
+            ['BJMM_depth_2', 'BJMM_depth_3']
+        """
+        results = {i: self.__dict__[i] for i in ["_time_complexity", "_memory_complexity", "_optimal_parameters",
+                                                 "_verbose_information", "_statistics", "_partial_optimization"]}
+        results["algorithms"] = {key: value._optimization_results() for key, value in self.__dict__.items()
+                                 if isinstance(value, BaseAlgorithm)}
+        return results
+
+    def _restore_optimization_results(self, results: dict):
+        """Takes over the results of an optimization of an equal algorithm, see `_optimization_results`.
+
+        The algorithm keeps its problem and its references to inner estimators, which may be shared with other
+        algorithms through the registry of sub-estimators. Internal algorithms which are constructed on first use
+        and not constructed yet are skipped.
+
+        Args:
+            results (dict): Results as returned by `_optimization_results`.
+
+        Tests:
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import BJMM
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> A = BJMM(SDProblem(n=100, k=50, w=10))
+            >>> B = BJMM(SDProblem(n=100, k=50, w=10))
+            >>> _ = A.time_complexity()
+            >>> B._restore_optimization_results(A._optimization_results())
+            >>> B.get_optimal_parameters_dict() == A.get_optimal_parameters_dict()
+            True
+        """
+        results = results.copy()
+        algorithms = results.pop("algorithms")
+        with self._lock:
+            self.__dict__.update(results)
+            for key, value in algorithms.items():
+                algorithm = self.__dict__.get(key)
+                if isinstance(algorithm, BaseAlgorithm):
+                    algorithm._restore_optimization_results(value)
+
     @property
     def parameter_ranges(self):
         """Returns the set ranges for optimal parameter search.
@@ -168,11 +296,14 @@ class BaseAlgorithm:
 
     def reset(self):
         """Resets internal state of the algorithm."""
-        self._complexity_type = ComplexityType.ESTIMATE.value
-        self._optimal_parameters = {}
-        self._time_complexity = None
-        self._memory_complexity = None
-        self._verbose_information = None
+        with self._lock:
+            self._complexity_type = ComplexityType.ESTIMATE.value
+            self._optimal_parameters = {}
+            self._time_complexity = None
+            self._memory_complexity = None
+            self._verbose_information = None
+            self._pruned_points = 0
+            self._partial_optimization = False
 
     def set_parameter_ranges(self, parameter: str, min_value: float, max_value: float):
         """Set range of specific parameter.
@@ -237,38 +368,245 @@ class BaseAlgorithm:
     def _find_optimal_tilde_o_parameters(self):
         raise NotImplementedError
 
-    def _get_optimal_parameter_methods_(self):
-        """Return a list of methods decorated with @optimal_parameter ordered by linenumber of appearance."""
+    @classmethod
+    def _find_optimal_parameter_method_names(cls):
+        """Return the names of the methods decorated with @optimal_parameter in order of their definition.
 
-        def sort_operator(v):
-            return v[1]
+        The methods introduced by a base class come first, the methods of a class are ordered by linenumber. Line numbers
+        of different files are not comparable, ordering by line number alone lets the layout of the files decide whether
+        e.g. `r` of `SDAlgorithm` is optimized before the parameters of `BJMM` which depend on it.
 
+        Tests:
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import BJMM
+            >>> BJMM._optimal_parameter_method_names
+            ('r', 'depth')
+            >>> from cryptographic_estimators.base_algorithm import BaseAlgorithm, optimal_parameter
+            >>> namespace = {"BaseAlgorithm": BaseAlgorithm, "optimal_parameter": optimal_parameter}
+            >>> base = "\\n" * 9 + "class A(BaseAlgorithm):\\n    @optimal_parameter\\n    def b(self):\\n        pass\\n"
+            >>> exec(compile(base, "a.py", "exec"), namespace)
+            >>> derived = "class B(A):\\n    @optimal_parameter\\n    def a(self):\\n        pass\\n"
+            >>> exec(compile(derived, "b.py", "exec"), namespace)
+            >>> namespace["B"]._optimal_parameter_method_names  # b is defined on line 12 of a.py, a on line 3 of b.py
+            ('b', 'a')
+        """
         import inspect
 
-        def is_optimal_parameter_method(object):
-            return inspect.ismethod(object) and hasattr(object, "__wrapped__")
-
+        mro = cls.__mro__[::-1]
         members = []
-        for _, f in inspect.getmembers(self, predicate=is_optimal_parameter_method):
-            _, start_line = inspect.getsourcelines(f)
-            members.append([f, start_line])
-        members.sort(key=sort_operator)
+        for name in dir(cls):
+            f = inspect.getattr_static(cls, name)
+            if inspect.isfunction(f) and hasattr(f, "__wrapped__"):
+                index = next(i for i, c in enumerate(mro) if name in c.__dict__)
+                line = inspect.unwrap(mro[index].__dict__[name]).__code__.co_firstlineno
+                members.append((index, line, name))
+        members.sort()
 
-        return [f[0] for f in members]
+        return tuple(name for _, _, name in members)
+
+    def _get_optimal_parameter_methods_(self):
+        """Return a list of methods decorated with @optimal_parameter ordered by linenumber of appearance."""
+        return [getattr(self, name) for name in self._optimal_parameter_method_names]
 
     def _is_early_abort_possible(self, time_lower_bound: float):
         """Checks whether the current time lower bound is below the early exit limit."""
         if time_lower_bound > self._current_minimum_for_early_abort:
+            self._statistics["early_aborts"] += 1
+            return True
+        return False
+
+    @property
+    def pruned_points(self):
+        """Returns the number of parameter sets skipped by the optimization without computing their complexity.
+
+        A parameter set is skipped, if the lower bound `_time_lower_bound` on its time complexity already exceeds the
+        best time complexity found so far. The bounds are memoized per value of the `_lower_bound_parameters`, such
+        that whole branches of the enumeration are skipped at the cost of a single bound.
+
+        Examples:
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import Stern
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> A = Stern(SDProblem(n=200,k=100,w=20))
+            >>> B = Stern(SDProblem(n=200,k=100,w=20), pruning=False)
+            >>> A.time_complexity() == B.time_complexity() and A.optimal_parameters() == B.optimal_parameters()
+            True
+            >>> A.pruned_points > 0, B.pruned_points
+            (True, 0)
+        """
+        return self._pruned_points
+
+    def _time_lower_bound(self, parameters: dict):
+        """Returns a lower bound on the time complexity of all parameter sets which coincide with `parameters` on `_lower_bound_parameters`.
+
+        The bound must not exceed the value of `_compute_time_complexity` (before adding the memory access cost),
+        which is ensured by computing it with the same floating point operations.
+
+        Args:
+            parameters (dict): Dictionary including the parameters.
+        """
+        return -inf
+
+    def _is_pruned(self, parameters: dict, time: float):
+        """Returns whether `parameters` can be skipped, as their time complexity is certainly larger than `time`.
+
+        Pruning is disabled for the logarithmic and custom memory access cost models, which may be negative.
+
+        Args:
+            parameters (dict): Dictionary including the parameters.
+            time (float): Best time complexity found so far.
+        """
+        if not self._pruning or not self._lower_bound_parameters or time == inf \
+                or callable(self._memory_access) or self._memory_access == 1:
+            return False
+
+        key = tuple(parameters[i] for i in self._lower_bound_parameters)
+        if key not in self._time_lower_bounds:
+            self._time_lower_bounds[key] = self._time_lower_bound(parameters)
+        if self._time_lower_bounds[key] > time:
+            self._pruned_points += 1
+            self._statistics["pruned"] += 1
             return True
         return False
 
+    @property
+    def optimization_is_partial(self):
+        """Returns whether the last optimization was stopped early by the `cancel_token` or by a budget.
+
+        In this case the optimal parameters are the best ones found before stopping.
+
+        Examples:
+            >>> import threading
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import Stern
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> A = Stern(SDProblem(n=200,k=100,w=20), max_evaluations=3, vectorized=False)
+            >>> A.time_complexity() >= Stern(SDProblem(n=200,k=100,w=20)).time_complexity()
+            True
+            >>> A.optimization_is_partial
+            True
+            >>> token = threading.Event()
+            >>> progress = []
+            >>> B = Stern(SDProblem(n=200,k=100,w=20), cancel_token=token, progress_callback=progress.append)
+            >>> B.time_complexity() == Stern(SDProblem(n=200,k=100,w=20)).time_complexity()
+            True
+            >>> B.optimization_is_partial, sorted(progress[-1])
+            (False, ['algorithm', 'best_time', 'elapsed', 'evaluations', 'rounds'])
+            >>> B.reset()
+            >>> token.set()
+            >>> B.time_complexity() == inf, B.optimization_is_partial, progress[-1]["evaluations"]
+            (False, True, 1)
+        """
+        return self._partial_optimization
+
+    @property
+    def optimization_statistics(self):
+        """Returns the counters accumulated over all parameter optimizations of the algorithm.
+
+        The dictionary holds the number of `optimizations`, the parameter sets generated by the enumeration
+        (`candidates`, including the points of vectorized grids), the exact time and memory `evaluations`, the
+        parameter sets skipped by the lower bound (`pruned`), the complexity computations stopped by an `early_aborts`
+        check and the parameter range adjustment `rounds`. The counters are not cleared by `reset`.
+
+        Examples:
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import Stern
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> A = Stern(SDProblem(n=200,k=100,w=20), vectorized=False)
+            >>> _ = A.time_complexity()
+            >>> S = A.optimization_statistics
+            >>> S["optimizations"], S["candidates"] >= S["evaluations"] + S["pruned"] > 0
+            (1, True)
+        """
+        return {i: self._statistics[i]
+                for i in ["optimizations", "candidates", "evaluations", "pruned", "early_aborts", "rounds"]}
+
+    def _count_candidates(self, choices):
+        """Yields the parameter sets of `choices`, counting them as generated candidates.
+
+        Args:
+            choices (iterable): Parameter sets of the enumeration.
+        """
+        for params in choices:
+            self._statistics["candidates"] += 1
+            yield params
+
+    def _optimization_candidates(self):
+        """Returns an iterable of the parameter sets evaluated by `_find_optimal_parameters`."""
+        return self._count_candidates(self._valid_choices())
+
+    def _start_optimization(self):
+        """Resets the progress counters, see `_register_evaluation`."""
+        self._statistics["optimizations"] += 1
+        self._evaluations = 0
+        self._adjustment_rounds = 0
+        self._optimization_start = monotonic()
+        self._partial_optimization = False
+
+    def _report_progress(self, time: float):
+        """Passes the state of the optimization to the `progress_callback`.
+
+        Args:
+            time (float): Best time complexity found so far.
+        """
+        self._progress_callback({"algorithm": self.__class__.__name__, "evaluations": self._evaluations,
+                                 "best_time": time, "rounds": self._adjustment_rounds,
+                                 "elapsed": monotonic() - self._optimization_start})
+
+    def _continue_optimization(self):
+        """Returns whether the next parameter set may be evaluated.
+
+        Returns False if the `cancel_token` is set or a budget is exhausted, in which case the optimization is marked
+        as partial. The budgets are checked before evaluating a parameter set, so an optimization finishing within
+        its budget is never marked as partial. The first parameter set is always evaluated.
+
+        Tests:
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import Stern
+            >>> from cryptographic_estimators.SDEstimator import SDProblem
+            >>> A = Stern(SDProblem(n=100, k=50, w=10), vectorized=False)
+            >>> _ = A.time_complexity()
+            >>> evaluations = A.optimization_statistics["evaluations"]
+            >>> B = Stern(SDProblem(n=100, k=50, w=10), vectorized=False, max_evaluations=evaluations)
+            >>> B.time_complexity() == A.time_complexity(), B.optimization_is_partial
+            (True, False)
+            >>> C = Stern(SDProblem(n=100, k=50, w=10), vectorized=False, max_evaluations=evaluations - 1)
+            >>> _ = C.time_complexity()
+            >>> C.optimization_is_partial, C.optimization_statistics["evaluations"] == evaluations - 1
+            (True, True)
+        """
+        if self._evaluations == 0:
+            return True
+
+        if (self._cancel_token is not None and self._cancel_token.is_set()) \
+                or self._evaluations >= self._max_evaluations \
+                or (self._time_budget != inf and monotonic() - self._optimization_start >= self._time_budget):
+            self._partial_optimization = True
+            return False
+        return True
+
+    def _register_evaluation(self, time: float):
+        """Counts an evaluated parameter set and reports the progress, see `_continue_optimization`.
+
+        Args:
+            time (float): Best time complexity found so far.
+        """
+        self._evaluations += 1
+        self._statistics["evaluations"] += 1
+        if self._progress_callback is not None:
+            self._report_progress(time)
+
     def _find_optimal_parameters(self):
         """Enumerates all valid parameter configurations within the _parameter_ranges.
     
         Saves the best result (according to time complexity) in `_optimal_parameters`.
         """
+        self._start_optimization()
         time = inf
-        for params in self._valid_choices():
+        for params in self._optimization_candidates():
+            if self._is_pruned(params, time):
+                if self._time_complexity_is_convex:
+                    break
+                continue
+
+            if not self._continue_optimization():
+                break
+
             tmp_time = self._compute_time_complexity(params)
             tmp_memory = self._compute_memory_complexity(params)
             if self.bit_complexities:
@@ -282,9 +620,12 @@ class BaseAlgorithm:
                 for i in params:
                     self._optimal_parameters[i] = params[i]
 
+            self._register_evaluation(time)
+
             if self._time_complexity_is_convex and tmp_time > time:
                 break
         self._current_minimum_for_early_abort = inf
+        self._time_lower_bounds = dict()
 
     def _get_optimal_parameter(self, key: str):
         """Returns the optimal value for the parameter `key`.
@@ -293,16 +634,17 @@ class BaseAlgorithm:
         function is meant for fetching optimization parameters which need to be
         optimized together.
         """
-        if key not in self._optimal_parameters:
-            if self.complexity_type == ComplexityType.ESTIMATE.value:
-                self._call_all_preceeding_optimal_parameter_functions(key)
-                self._find_optimal_parameters()
-            elif self.complexity_type == ComplexityType.TILDEO.value:
-                self._find_optimal_tilde_o_parameters()
-            else:
-                assert False
+        with self._lock:
+            if key not in self._optimal_parameters:
+                if self.complexity_type == ComplexityType.ESTIMATE.value:
+                    self._call_all_preceeding_optimal_parameter_functions(key)
+                    self._find_optimal_parameters()
+                elif self.complexity_type == ComplexityType.TILDEO.value:
+                    self._find_optimal_tilde_o_parameters()
+                else:
+                    assert False
 
-        return self._optimal_parameters.get(key)
+            return self._optimal_parameters.get(key)
 
     def get_optimal_parameters_dict(self):
         """Returns the optimal parameters dictionary."""
@@ -415,26 +757,27 @@ class BaseAlgorithm:
                     a value is provided, the computation is done based on those
                     parameters.
         """
-        if kwargs == {}:
-            if self._time_complexity is not None:
-                return self._time_complexity
+        with self._lock:
+            if kwargs == {}:
+                if self._time_complexity is not None:
+                    return self._time_complexity
+                else:
+                    params = self.optimal_parameters()
+                    if not self._do_valid_parameters_in_current_ranges_exist():
+                        self._time_complexity = inf
+                        self._memory_complexity = inf
+                        return inf
             else:
-                params = self.optimal_parameters()
-                if not self._do_valid_parameters_in_current_ranges_exist():
-                    self._time_complexity = inf
-                    self._memory_complexity = inf
-                    return inf
-        else:
-            params = self.__set_dict(**kwargs)
+                params = self.__set_dict(**kwargs)
 
-        if self._complexity_type == ComplexityType.ESTIMATE.value:
-            temp_time_complexity = self._compute_estimate_time_complexity(params)
-        else:
-            temp_time_complexity = self._compute_tilde_o_time_complexity(params)
+            if self._complexity_type == ComplexityType.ESTIMATE.value:
+                temp_time_complexity = self._compute_estimate_time_complexity(params)
+            else:
+                temp_time_complexity = self._compute_tilde_o_time_complexity(params)
 
-        if kwargs == {}:
-            self._time_complexity = temp_time_complexity
-        return temp_time_complexity
+            if kwargs == {}:
+                self._time_complexity = temp_time_complexity
+            return temp_time_complexity
 
     def memory_complexity(self, **kwargs):
         """Return the memory complexity of the algorithm.
@@ -445,30 +788,31 @@ class BaseAlgorithm:
                     a value is provided, the computation is done based on those
                     parameters.
         """
-        if kwargs == {}:
-            if self._memory_complexity is not None:
-                return self._memory_complexity
-            else:
-                params = self.optimal_parameters()
-                if not self._do_valid_parameters_in_current_ranges_exist():
-                    self._time_complexity = inf
-                    self._memory_complexity = inf
-                    return inf
+        with self._lock:
+            if kwargs == {}:
+                if self._memory_complexity is not None:
+                    return self._memory_complexity
+                else:
+                    params = self.optimal_parameters()
+                    if not self._do_valid_parameters_in_current_ranges_exist():
+                        self._time_complexity = inf
+                        self._memory_complexity = inf
+                        return inf
 
-        else:
-            params = self.__set_dict(**kwargs)
+            else:
+                params = self.__set_dict(**kwargs)
 
-        if self._complexity_type == ComplexityType.ESTIMATE.value:
-            temp_memory_complexity = self._compute_memory_complexity(params)
-            if self.bit_complexities:
-                temp_memory_complexity = self.problem.to_bitcomplexity_memory(
-                    temp_memory_complexity)
-        else:
-            temp_memory_complexity = self._compute_tilde_o_memory_complexity(
-                params)
-        if kwargs == {}:
-            self._memory_complexity = temp_memory_complexity
-        return temp_memory_complexity
+            if self._complexity_type == ComplexityType.ESTIMATE.value:
+                temp_memory_complexity = self._compute_memory_complexity(params)
+                if self.bit_complexities:
+                    temp_memory_complexity = self.problem.to_bitcomplexity_memory(
+                        temp_memory_complexity)
+            else:
+                temp_memory_complexity = self._compute_tilde_o_memory_complexity(
+                    params)
+            if kwargs == {}:
+                self._memory_complexity = temp_memory_complexity
+            return temp_memory_complexity
 
     def optimal_parameters(self):
         """Return a dictionary of optimal parameters.
@@ -478,10 +822,11 @@ class BaseAlgorithm:
             >>> BaseAlgorithm(BaseProblem()).optimal_parameters()
             {}
         """
-        if self.has_optimal_parameter():
-            for f in self._optimal_parameters_methods:
-                _ = f()
-        return self._optimal_parameters
+        with self._lock:
+            if self.has_optimal_parameter():
+                for f in self._optimal_parameters_methods:
+                    _ = f()
+            return self._optimal_parameters
 
     def _call_all_preceeding_optimal_parameter_functions(self, key: str):
         """Call the decorator function for each parameter, if they are optimal."""
@@ -529,10 +874,11 @@ def optimal_parameter(func):
     def optimal_parameter(*args, **kwargs):
         name = func.__name__
         self = args[0]
-        if name not in self._optimal_parameters:
-            temp = func(*args, **kwargs)
-            if temp is not None:
-                self._optimal_parameters[name] = temp
-        return self._optimal_parameters.get(name)
+        with self._lock:
+            if name not in self._optimal_parameters:
+                temp = func(*args, **kwargs)
+                if temp is not None:
+                    self._optimal_parameters[name] = temp
+            return self._optimal_parameters.get(name)
 
     return optimal_parameter
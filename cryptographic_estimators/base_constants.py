@@ -36,6 +36,25 @@ BASE_PARAMETERS = "parameters"
 BASE_ALGORITHM = "algorithm"
 BASE_NSOLUTIONS = "nsolutions"
 
+BASE_WORKERS = "workers"
+BASE_EXECUTOR = "executor"
+BASE_EXECUTOR_PROCESS = "process"
+BASE_EXECUTOR_THREAD = "thread"
+BASE_ESTIMATE_CACHE = "estimate_cache"
+BASE_WARM_START = "warm_start"
+BASE_PRUNING = "pruning"
+BASE_SUB_ESTIMATORS = "sub_estimators"
+BASE_PROGRESS_CALLBACK = "progress_callback"
+BASE_CANCEL_TOKEN = "cancel_token"
+BASE_MAX_EVALUATIONS = "max_evaluations"
+BASE_TIME_BUDGET = "time_budget"
+# options monitoring or stopping the parameter optimization, they are never sent to worker processes
+BASE_OPTIMIZATION_CONTROLS = [BASE_PROGRESS_CALLBACK, BASE_CANCEL_TOKEN, BASE_MAX_EVALUATIONS, BASE_TIME_BUDGET]
+BASE_PARTIAL = "partial"
+BASE_PROFILE = "profile"
+# number of functions with the largest own running time listed in a profile
+BASE_PROFILE_HOTSPOTS = 10
+
 
 BASE_ATTACK_TYPE_FORGERY = "forgery"
 BASE_ATTACK_TYPE_KEY_RECOVERY = "key-recovery"
@@ -16,14 +16,38 @@
 # ****************************************************************************
 
 
+import cProfile
+import json
+import os
+import pstats
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
+from time import perf_counter
 from math import isinf, inf
 from typing import Union, Callable
 from .helper import ComplexityType
 from .base_constants import BASE_TILDEO_ESTIMATE, BASE_ADDITIONALO, BASE_BIT_COMPLEXITIES, BASE_ESTIMATEO, BASE_EXCLUDED_ALGORITHMS, BASE_MEMORY, BASE_PARAMETERS, BASE_QUANTUMO, BASE_TIME, BASE_ESTIMATOR_TYPE
+from .base_constants import BASE_WORKERS, BASE_EXECUTOR, BASE_EXECUTOR_PROCESS, BASE_EXECUTOR_THREAD, BASE_ESTIMATE_CACHE, BASE_WARM_START
+from .base_constants import BASE_SUB_ESTIMATORS, BASE_PARTIAL, BASE_OPTIMIZATION_CONTROLS, BASE_PROFILE, \
+    BASE_PROFILE_HOTSPOTS
 from .base_algorithm import BaseAlgorithm
+from .estimate_cache import EstimateCache
+from .sub_estimator_registry import SubEstimatorRegistry
 from .estimation_renderer import EstimationRenderer
 
 
+def _hotspots(profiler: cProfile.Profile):
+    """Returns the functions with the largest own running time recorded by `profiler`.
+
+    Args:
+        profiler (cProfile.Profile): Disabled profiler.
+    """
+    statistics = pstats.Stats(profiler).stats
+    functions = sorted(statistics.items(), key=lambda item: item[1][2], reverse=True)[:BASE_PROFILE_HOTSPOTS]
+    return [{"function": f"{os.path.basename(file)}:{line}({function})", "calls": calls, "time": own_time}
+            for (file, line, function), (_, calls, own_time, _, _) in functions]
+
+
 class BaseEstimator(object):
     excluded_algorithms_by_default = []
     def __init__(self, alg, prob, **kwargs):
@@ -45,6 +69,19 @@ class BaseEstimator(object):
                     0: no tildeO estimation.
                 include_quantum (int): Specifies if quantum estimation should be included in the outputs. Default: 0.
                     0: no quantum estimation.
+                estimate_cache (EstimateCache): Persistent cache of the results of `estimate()`. Default: None.
+                    Results are keyed on the estimator, the problem, the algorithm and all keyword arguments, algorithms
+                    using a custom memory_access function are never cached.
+                warm_start (BaseEstimator): Estimator of the same type for neighbouring parameters. Each algorithm
+                    supporting warm starts (see `SDAlgorithm`) starts its optimization around the optimal parameters
+                    of the corresponding algorithm of `warm_start`. Default: None.
+                sub_estimators (SubEstimatorRegistry): Registry of the estimators used as subroutines by the
+                    algorithms, identical inner problems are optimized only once. Default: a new registry owned by
+                    this estimator.
+                progress_callback, cancel_token, max_evaluations, time_budget: Passed to every algorithm to monitor
+                    or stop its parameter optimization, see `BaseAlgorithm`. Estimates of algorithms stopped early are
+                    flagged with `"partial": True` and never stored in the estimate cache. Estimators used as
+                    subroutines by the algorithms are always optimized completely.
         """
 
         excluded_algorithms = kwargs.get(BASE_EXCLUDED_ALGORITHMS, tuple())
@@ -54,8 +91,23 @@ class BaseEstimator(object):
                     f"all excluded algorithms must be a subclass of {alg.__name__}")
             del kwargs[BASE_EXCLUDED_ALGORITHMS]
 
-        self._algorithms = []
+        self.estimate_cache = kwargs.pop(BASE_ESTIMATE_CACHE, None)
+        warm_start = kwargs.pop(BASE_WARM_START, None)
+        self.sub_estimators = kwargs.pop(BASE_SUB_ESTIMATORS, None)
+        if self.sub_estimators is None:
+            self.sub_estimators = SubEstimatorRegistry()
+        self._cache_kwargs = {i: kwargs[i] for i in kwargs
+                              if i not in ["include_tildeo", "include_quantum"] + BASE_OPTIMIZATION_CONTROLS}
+
+        self._algorithm_classes = [Algorithm for Algorithm in alg.__subclasses__()
+                                   if Algorithm not in excluded_algorithms]
+        # constructed algorithms, None for algorithms not applicable to the problem
+        self._algorithm_instances = {}
+        kwargs[BASE_SUB_ESTIMATORS] = self.sub_estimators
+        self._algorithm_kwargs = kwargs
+        self._warm_start = warm_start
         self.estimates = {}
+        self._profiling = False
 
         self.problem = prob
         self._bit_complexities = kwargs.get(BASE_BIT_COMPLEXITIES, 1)
@@ -64,23 +116,102 @@ class BaseEstimator(object):
         self.include_quantum = kwargs.get("include_quantum", False)
         self._estimator_type = BASE_ESTIMATOR_TYPE
 
-        included_algorithms = (Algorithm for Algorithm in alg.__subclasses__(
-        ) if Algorithm not in excluded_algorithms)
+    def _algorithm(self, Algorithm: type):
+        """Returns the instance of `Algorithm` of this estimator, or None if it is not applicable to the problem.
 
-        for Algorithm in included_algorithms:
+        Algorithms are constructed on first use, as some constructors already do expensive work (e.g. construct
+        nested estimators).
+
+        Args:
+            Algorithm (type): One of the algorithm classes considered by the estimator.
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator import MQEstimator
+            >>> E = MQEstimator(n=10, m=12, q=3)
+            >>> E._algorithm_instances
+            {}
+            >>> E.f5
+            F5 estimator for the MQ problem with 10 variables and 12 polynomials
+            >>> [Algorithm.__name__ for Algorithm in E._algorithm_instances]
+            ['F5']
+            >>> E.bjorklund
+            Traceback (most recent call last):
+            ...
+            AttributeError: 'MQEstimator' object has no attribute 'bjorklund'
+            >>> E.algorithm_names()
+            ['BooleanSolveFXL', 'Crossbred', 'ExhaustiveSearch', 'F5', 'HybridF5', 'Lokshtanov']
+        """
+        if Algorithm not in self._algorithm_instances:
+            kwargs = self._algorithm_kwargs
+            if self._warm_start is not None:
+                kwargs = {**kwargs, BASE_WARM_START: self._warm_start._algorithm(Algorithm)
+                          if Algorithm in self._warm_start._algorithm_classes else None}
             try:
-                algorithm = Algorithm(prob, **kwargs)
+                algorithm = Algorithm(self.problem, **kwargs)
+                setattr(self, Algorithm.__module__.split('.')[-1], algorithm)
             except (ValueError, TypeError):
-                continue
-
-            self._algorithms.append(algorithm)
+                algorithm = None
+            self._algorithm_instances[Algorithm] = algorithm
+
+            if len(self._algorithm_instances) == len(self._algorithm_classes):
+                # nothing left to construct, release the warm start estimator
+                self._warm_start = None
+
+        return self._algorithm_instances[Algorithm]
+
+    def __getattr__(self, name: str):
+        """Constructs the algorithm accessed as attribute named after its module, e.g. `SDEstimator(...).bjmm`.
+
+        An AttributeError raised while constructing the algorithm is re-raised as RuntimeError, otherwise it would
+        be reported as a missing attribute of the estimator.
+
+        Tests:
+            >>> from cryptographic_estimators.SDEstimator import SDEstimator
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import Stern
+            >>> E = SDEstimator(n=100, k=50, w=10)
+            >>> E._warm_start = Stern(E.problem)  # not an estimator
+            >>> E.stern
+            Traceback (most recent call last):
+            ...
+            RuntimeError: constructing Stern failed
+        """
+        if not name.startswith("_"):
+            # the last algorithm of a module takes precedence, as in the order of construction
+            for Algorithm in reversed(self.__dict__.get("_algorithm_classes", [])):
+                if Algorithm.__module__.split('.')[-1] != name:
+                    continue
+                try:
+                    algorithm = self._algorithm(Algorithm)
+                except AttributeError as e:
+                    raise RuntimeError(f"constructing {Algorithm.__name__} failed") from e
+                if algorithm is not None:
+                    return algorithm
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @classmethod
+    def _estimate_parameter_sets(cls, parameter_sets: list, warm_start: bool = False, **kwargs):
+        """Constructs an estimator for each parameter set and returns the list of their estimates.
+
+        Used as the unit of work of `cryptographic_estimators.sweep`.
 
-            setattr(self, algorithm.__module__.split('.')[-1], algorithm)
+        Args:
+            parameter_sets (list): List of dictionaries holding the problem parameters of the estimator.
+            warm_start (bool, optional): Warm start each estimator from the previous one. Defaults to False.
+            **kwargs: Additional keyword arguments passed to each estimator.
+        """
+        estimates = []
+        previous = None
+        for parameters in parameter_sets:
+            estimator = cls(**parameters, **kwargs, warm_start=previous)
+            estimates.append(estimator.estimate())
+            previous = estimator if warm_start else None
+        return estimates
 
     @property
     def memory_access(self):
         """Returns a list of memory_access attributes of included algorithms."""
-        return [i.memory_access for i in self._algorithms]
+        return [i.memory_access for i in self.algorithms()]
 
     @memory_access.setter
     def memory_access(self, new_memory_access: Union[int, Callable[[float], float]]):
@@ -91,13 +222,13 @@ class BaseEstimator(object):
                 (0 - constant, 1 - logarithmic, 2 - square-root, 3 - cube-root or deploy custom
                 function which takes as input the logarithm of the total memory usage)
         """
-        for i in self._algorithms:
+        for i in self.algorithms():
             i.memory_access = new_memory_access
 
     @property
     def complexity_type(self):
         """Returns a list of complexity_type attributes of included algorithms."""
-        return [i.complexity_type for i in self._algorithms]
+        return [i.complexity_type for i in self.algorithms()]
 
     @complexity_type.setter
     def complexity_type(self, new_complexity_type: ComplexityType):
@@ -106,13 +237,13 @@ class BaseEstimator(object):
         Args:
             new_complexity_type (ComplexityType): New complexity_type value. Either (0: estimate, 1: tilde O complexity)
         """
-        for i in self._algorithms:
+        for i in self.algorithms():
             i.complexity_type = new_complexity_type
 
     @property
     def bit_complexities(self):
         """Returns a list of bit_complexities attributes of included algorithms."""
-        return [i.bit_complexities for i in self._algorithms]
+        return [i.bit_complexities for i in self.algorithms()]
 
     @bit_complexities.setter
     def bit_complexities(self, new_bit_complexities: int):
@@ -124,7 +255,7 @@ class BaseEstimator(object):
         if self._bit_complexities != new_bit_complexities:
             self._bit_complexities = new_bit_complexities
             self.reset()
-            for i in self._algorithms:
+            for i in self.algorithms():
                 i.bit_complexities = new_bit_complexities
 
     @property
@@ -137,7 +268,8 @@ class BaseEstimator(object):
 
     def algorithms(self):
         """Return a list of considered algorithms."""
-        return self._algorithms
+        algorithms = (self._algorithm(Algorithm) for Algorithm in self._algorithm_classes)
+        return [algorithm for algorithm in algorithms if algorithm is not None]
 
     def algorithm_names(self):
         """Return a list of the name of considered algorithms."""
@@ -205,39 +337,379 @@ class BaseEstimator(object):
             memory)) else '--'
 
         est[name][BASE_ESTIMATEO][BASE_PARAMETERS] = algorithm.get_optimal_parameters_dict()
+        if algorithm.optimization_is_partial:
+            est[name][BASE_ESTIMATEO][BASE_PARTIAL] = True
 
         est[name][BASE_ADDITIONALO] = algorithm._get_verbose_information() if (time is not None and not isinf(time)) else {}
 
+    def _estimate_cache_key(self, algorithm: BaseAlgorithm, section: str):
+        """Returns the key of the given section of the estimates of `algorithm` in the estimate cache, or None.
+
+        Args:
+            algorithm (BaseAlgorithm): Algorithm to run.
+            section (str): Key of the section in the estimates of the algorithm.
+        """
+        if self.estimate_cache is None or callable(algorithm.memory_access):
+            return None
+
+        return EstimateCache.key(
+            estimator=self.__class__,
+            problem=self.problem.parameters,
+            nsolutions=self.problem.nsolutions,
+            memory_bound=self.problem.memory_bound,
+            algorithm=algorithm.__class__,
+            section=section,
+            memory_access=algorithm.memory_access,
+            bit_complexities=algorithm.bit_complexities,
+            parameter_ranges=algorithm._parameter_ranges,
+            kwargs=self._cache_kwargs,
+        )
+
+    def _add_cached(self, algorithm: BaseAlgorithm, section: str, add_function: Callable[[BaseAlgorithm], None]):
+        """Runs `add_function` for the given algorithm, unless its results are found in the estimate cache.
+
+        Args:
+            algorithm (BaseAlgorithm): Algorithm to run.
+            section (str): Key of the section in the estimates added by `add_function`.
+            add_function (Callable[[BaseAlgorithm], None]): One of the `_add_*` methods.
+
+        Returns:
+            bool: True if the results were found in the estimate cache.
+        """
+        est = self.estimates[algorithm.__class__.__name__]
+        key = self._estimate_cache_key(algorithm, section)
+        if key is None:
+            add_function(algorithm)
+            return False
+
+        cached = self.estimate_cache.get(key)
+        if cached is not None:
+            est.update(cached)
+            if section == BASE_ESTIMATEO:
+                self._restore_estimate(algorithm, cached[BASE_ESTIMATEO])
+            return True
+
+        existing = set(est)
+        add_function(algorithm)
+        if not algorithm.optimization_is_partial:
+            self.estimate_cache.put(key, {i: est[i] for i in est if i not in existing})
+        return False
+
+    def _restore_estimate(self, algorithm: BaseAlgorithm, estimate: dict):
+        """Sets the time and memory complexity and the optimal parameters found in the estimate cache on `algorithm`.
+
+        Later calls like `fastest_algorithm()` or `time_complexity()` therefore do not optimize the algorithm again.
+        The optimal parameters are only restored if `get_optimal_parameters_dict` returns the parameters of the
+        algorithm itself, and not e.g. those of an inner estimator.
+
+        Args:
+            algorithm (BaseAlgorithm): Algorithm whose estimate was found in the cache.
+            estimate (dict): Cached estimate, holding the time, memory and parameters.
+        """
+        algorithm.complexity_type = ComplexityType.ESTIMATE.value
+        with algorithm._lock:
+            if algorithm._time_complexity is not None:
+                return
+
+            time, memory = estimate[BASE_TIME], estimate[BASE_MEMORY]
+            algorithm._time_complexity = inf if time == "--" else time
+            algorithm._memory_complexity = inf if memory == "--" else memory
+            if type(algorithm).get_optimal_parameters_dict is BaseAlgorithm.get_optimal_parameters_dict:
+                algorithm._optimal_parameters = dict(estimate[BASE_PARAMETERS])
+
+    def _run_analyses(self, algorithm: BaseAlgorithm):
+        """Runs all pending analyses for the given algorithm and returns the number of estimate cache hits.
+
+        Args:
+            algorithm (BaseAlgorithm): Algorithm to run.
+        """
+        name = algorithm.__class__.__name__
+        cache_hits = 0
+        if self.include_tildeo and BASE_TILDEO_ESTIMATE not in self.estimates[name]:
+            cache_hits += self._add_cached(algorithm, BASE_TILDEO_ESTIMATE, self._add_tilde_o_complexity)
+
+        if self.include_quantum and BASE_QUANTUMO not in self.estimates[name]:
+            cache_hits += self._add_cached(algorithm, BASE_QUANTUMO, self._add_quantum_complexity)
+
+        if BASE_ESTIMATEO not in self.estimates[name]:
+            cache_hits += self._add_cached(algorithm, BASE_ESTIMATEO, self._add_estimate)
+
+        if self.estimator_type != BASE_ESTIMATOR_TYPE:
+            if "attack_type" not in self.estimates[name]:
+                self.estimates[name][" "] ={}
+                self.estimates[name][" "]["attack_type"] = algorithm.attack_type
+
+        return cache_hits
+
+    def _profile_analyses(self, algorithm: BaseAlgorithm):
+        """Runs all pending analyses for the given algorithm under `cProfile` and returns the profile of the run.
+
+        The profile holds the `wall_time` in seconds (including the overhead of the profiler), the increase of the
+        `optimization_statistics` of the algorithm, the number of `estimate_cache_hits`, the calls of the registry of
+        sub-estimators served by a registered estimator (`sub_estimator_hits`) or by constructing a new one
+        (`sub_estimator_misses`), and the `hotspots`, i.e. the functions with the largest own running time. The
+        hotspots are empty if another profiler is active.
+
+        Args:
+            algorithm (BaseAlgorithm): Algorithm to run.
+        """
+        statistics = algorithm.optimization_statistics
+        registry_hits, registry_misses = self.sub_estimators.hits, self.sub_estimators.misses
+        profiler = cProfile.Profile()
+        start = perf_counter()
+        try:
+            profiler.enable()
+            profiled = True
+        except ValueError:
+            profiled = False
+
+        try:
+            cache_hits = self._run_analyses(algorithm)
+        finally:
+            if profiled:
+                profiler.disable()
+
+        profile = {"wall_time": perf_counter() - start}
+        profile.update({i: value - statistics[i] for i, value in algorithm.optimization_statistics.items()})
+        profile["estimate_cache_hits"] = cache_hits
+        profile["sub_estimator_hits"] = self.sub_estimators.hits - registry_hits
+        profile["sub_estimator_misses"] = self.sub_estimators.misses - registry_misses
+        profile["hotspots"] = _hotspots(profiler) if profiled else []
+        return profile
+
+    def _estimate_algorithm(self, algorithm: BaseAlgorithm):
+        """Runs all pending analyses for the given algorithm and returns its entry of `estimates`.
+
+        In profiling mode the profile of the run is added to the entry, see `_profile_analyses`.
+
+        Args:
+            algorithm (BaseAlgorithm): Algorithm to run.
+        """
+        name = algorithm.__class__.__name__
+        if name not in self.estimates:
+            self.estimates[name] = {}
+
+        if self._profiling and BASE_PROFILE not in self.estimates[name]:
+            self.estimates[name][BASE_PROFILE] = self._profile_analyses(algorithm)
+        else:
+            self._run_analyses(algorithm)
+
+        return self.estimates[name]
+
+    def _single_algorithm_view(self, algorithm: BaseAlgorithm):
+        """Returns a shallow copy of the estimator restricted to `algorithm`.
+
+        The copy does not reference any other algorithm of the estimator, so it can be sent to a worker process
+        without serializing the whole estimator.
+
+        Args:
+            algorithm (BaseAlgorithm): Algorithm to keep.
+        """
+        view = copy(self)
+        view.__dict__ = {key: value for key, value in self.__dict__.items() if not isinstance(value, BaseAlgorithm)}
+        view._algorithm_classes = [type(algorithm)]
+        view._algorithm_instances = {type(algorithm): algorithm}
+        view._warm_start = None
+        view._algorithm_kwargs = {key: value for key, value in self._algorithm_kwargs.items()
+                                  if key not in BASE_OPTIMIZATION_CONTROLS}
+        view.estimates = {algorithm.__class__.__name__: self.estimates[algorithm.__class__.__name__]}
+        return view
+
+    def _estimate_in_worker(self):
+        """Runs the analyses of the single algorithm of a restricted estimator inside a worker process.
+
+        Returns the resulting entry of `estimates` together with the results of the optimization of the algorithm,
+        see `_single_algorithm_view` and `BaseAlgorithm._optimization_results`.
+        """
+        algorithm = self.algorithms()[0]
+        estimate = self._estimate_algorithm(algorithm)
+        return estimate, algorithm._optimization_results()
+
+    def _parallel_estimate(self, algorithms: list, workers: int, executor: str, logger=None):
+        """Runs the analyses of the given algorithms concurrently and merges the results into `estimates`.
+
+        Args:
+            algorithms (list): Algorithms to run.
+            workers (int): Maximal number of workers.
+            executor (str): Either "process" or "thread". A thread pool is used instead of a process pool if any of
+                progress_callback, cancel_token, max_evaluations or time_budget is set, as they cannot be shared with
+                worker processes (see `BaseAlgorithm.__getstate__`).
+            logger (callable, optional): Progress callback. Defaults to None.
+
+        Tests:
+            >>> import threading
+            >>> from cryptographic_estimators.SDEstimator import SDEstimator
+            >>> cancel_token = threading.Event()
+            >>> cancel_token.set()
+            >>> E = SDEstimator(n=100, k=50, w=10, cancel_token=cancel_token, progress_callback=lambda progress: None)
+            >>> E.estimate(workers=2)["Stern"]["estimate"]["partial"]
+            True
+        """
+        if executor == BASE_EXECUTOR_PROCESS:
+            if any(self._algorithm_kwargs.get(i) is not None for i in BASE_OPTIMIZATION_CONTROLS):
+                executor = BASE_EXECUTOR_THREAD
+                pool_class = ThreadPoolExecutor
+            else:
+                pool_class = ProcessPoolExecutor
+        elif executor == BASE_EXECUTOR_THREAD:
+            pool_class = ThreadPoolExecutor
+        else:
+            raise ValueError(f"executor must be either '{BASE_EXECUTOR_PROCESS}' or '{BASE_EXECUTOR_THREAD}'")
+
+        for algorithm in algorithms:
+            self.estimates.setdefault(algorithm.__class__.__name__, {})
+
+        with pool_class(max_workers=workers) as pool:
+            futures = []
+            for index, algorithm in enumerate(algorithms):
+                name = algorithm.__class__.__name__
+                if logger:
+                    logger(
+                        f"[{str(index + 1)}/{str(len(algorithms))}] - Processing algorithm: '{name}'")
+
+                if executor == BASE_EXECUTOR_PROCESS:
+                    futures.append(pool.submit(self._single_algorithm_view(algorithm)._estimate_in_worker))
+                else:
+                    futures.append(pool.submit(self._estimate_algorithm, algorithm))
+
+            for algorithm, future in zip(algorithms, futures):
+                if executor == BASE_EXECUTOR_PROCESS:
+                    estimate, results = future.result()
+                    # the algorithm keeps its problem and inner estimators, which may be shared through the registry
+                    algorithm._restore_optimization_results(results)
+                    self.estimates[algorithm.__class__.__name__] = estimate
+                else:
+                    future.result()
+
     def estimate(self, **kwargs):
-        """Returns dictionary describing the complexity of each algorithm and its optimal parameters."""
+        """Returns dictionary describing the complexity of each algorithm and its optimal parameters.
+
+        Args:
+            **kwargs: Additional keyword arguments.
+                logger (callable): Called with a progress message before each algorithm is processed. Default: None.
+                workers (int): Number of algorithms evaluated concurrently. Default: 1 (serial evaluation).
+                executor (str): Either "process" or "thread", the pool used if `workers` > 1. Default: "process".
+                    With a process pool a custom `memory_access` function must be picklable. Estimators constructed
+                    with progress_callback, cancel_token, max_evaluations or time_budget always use a thread pool.
+                profile (bool): Add the profile of the analyses under the key "profile" to the entry of each
+                    algorithm, see `profile_json`. Analyses already done by an earlier call are not repeated and
+                    profiles already recorded are kept. Default: False.
+                algorithms (list): Names or classes of the algorithms to estimate. Only these algorithms are
+                    constructed and analysed, and only their entries are returned; algorithms not applicable to the
+                    problem are omitted. Default: None (all algorithms).
+
+        Examples:
+            >>> from cryptographic_estimators.SDEstimator import SDEstimator
+            >>> A = SDEstimator(n=100, k=50, w=10)
+            >>> B = SDEstimator(n=100, k=50, w=10)
+            >>> A.estimate(workers=2) == B.estimate()
+            True
+            >>> A.bjmm.get_optimal_parameters_dict() == B.bjmm.get_optimal_parameters_dict()
+            True
+
+        Tests:
+            >>> A = SDEstimator(n=100, k=50, w=10)
+            >>> list(A.estimate(workers=2, executor="thread")) == A.algorithm_names()
+            True
+            >>> A.estimate(workers=2, executor="gpu")
+            Traceback (most recent call last):
+            ...
+            ValueError: executor must be either 'process' or 'thread'
+            >>> E = SDEstimator(n=100, k=50, w=10, max_evaluations=1).estimate()
+            >>> E["Stern"]["estimate"]["partial"], "partial" in A.estimate()["Stern"]["estimate"]
+            (True, False)
+            >>> P = SDEstimator(n=100, k=50, w=10).estimate(profile=True, workers=2)
+            >>> all(P[i]["profile"]["wall_time"] > 0 for i in P)
+            True
+            >>> from cryptographic_estimators.SDEstimator.SDAlgorithms import Stern
+            >>> A = SDEstimator(n=100, k=50, w=10)
+            >>> list(A.estimate(algorithms=["Prange", Stern])), list(A._algorithm_instances)
+            (['Prange', 'Stern'], [<class 'cryptographic_estimators.SDEstimator.SDAlgorithms.prange.Prange'>, <class 'cryptographic_estimators.SDEstimator.SDAlgorithms.stern.Stern'>])
+            >>> A.estimate(algorithms=["Stern"])["Stern"] == B.estimate()["Stern"]
+            True
+            >>> A.estimate(algorithms=["Stern"], workers=2)["Stern"] == B.estimate()["Stern"]
+            True
+            >>> A.estimate(algorithms=["Kirchner"])
+            Traceback (most recent call last):
+            ...
+            ValueError: unknown algorithm 'Kirchner'
+        """
         logger = kwargs.get("logger", None)
+        workers = kwargs.get(BASE_WORKERS, 1)
+        executor = kwargs.get(BASE_EXECUTOR, BASE_EXECUTOR_PROCESS)
+        self._profiling = kwargs.get(BASE_PROFILE, False)
+
+        selected = kwargs.get("algorithms", None)
 
         if not self.estimates:
             self.estimates = dict()
-        for index, algorithm in enumerate(self.algorithms()):
-            name = algorithm.__class__.__name__
-            if name not in self.estimates:
-                self.estimates[name] = {}
 
-            # used only in the GUI
-            if logger:
-                logger(
-                    f"[{str(index + 1)}/{str(self.nalgorithms())}] - Processing algorithm: '{name}'")
+        if selected is None:
+            algorithms = self.algorithms()
+        else:
+            algorithms = self._selected_algorithms(selected)
+
+        if workers > 1:
+            self._parallel_estimate(algorithms, workers, executor, logger)
+        else:
+            for index, algorithm in enumerate(algorithms):
+                name = algorithm.__class__.__name__
+
+                # used only in the GUI
+                if logger:
+                    logger(
+                        f"[{str(index + 1)}/{str(len(algorithms))}] - Processing algorithm: '{name}'")
 
-            if self.include_tildeo and BASE_TILDEO_ESTIMATE not in self.estimates[name]:
-                self._add_tilde_o_complexity(algorithm)
+                self._estimate_algorithm(algorithm)
 
-            if self.include_quantum and BASE_QUANTUMO not in self.estimates[name]:
-                self._add_quantum_complexity(algorithm)
+        if selected is None:
+            return self.estimates
+        return {algorithm.__class__.__name__: self.estimates[algorithm.__class__.__name__] for algorithm in algorithms}
 
-            if BASE_ESTIMATEO not in self.estimates[name]:
-                self._add_estimate(algorithm)
+    def _selected_algorithms(self, selected: list):
+        """Returns the applicable algorithms among `selected`, in the order of `algorithms()`.
 
-            if self.estimator_type != BASE_ESTIMATOR_TYPE:
-                if "attack_type" not in self.estimates[name]:
-                    self.estimates[name][" "] ={}
-                    self.estimates[name][" "]["attack_type"] = algorithm.attack_type
-        return self.estimates
+        Only the selected algorithms are constructed.
+
+        Args:
+            selected (list): Names or classes of algorithms considered by the estimator.
+        """
+        names = {Algorithm.__name__: Algorithm for Algorithm in self._algorithm_classes}
+        classes = set()
+        for i in selected:
+            name = i if isinstance(i, str) else i.__name__
+            if name not in names or not isinstance(i, str) and names[name] is not i:
+                raise ValueError(f"unknown algorithm '{name}'")
+            classes.add(names[name])
+
+        algorithms = (self._algorithm(Algorithm) for Algorithm in self._algorithm_classes if Algorithm in classes)
+        return [algorithm for algorithm in algorithms if algorithm is not None]
+
+    def profile_json(self, **kwargs):
+        """Returns the recorded profiles as JSON string mapping the algorithm names to their profiles.
+
+        The profiles are recorded by `estimate(profile=True)`, algorithms without profile are omitted.
+
+        Args:
+            **kwargs: Keyword arguments passed to `json.dumps`, e.g. `indent`.
+
+        Examples:
+            >>> import json
+            >>> from cryptographic_estimators.SDEstimator import SDEstimator
+            >>> A = SDEstimator(n=100, k=50, w=10)
+            >>> A.profile_json()
+            '{}'
+            >>> E = A.estimate(profile=True)
+            >>> P = json.loads(A.profile_json())
+            >>> list(P) == A.algorithm_names() and P["Stern"] == E["Stern"]["profile"]
+            True
+            >>> sorted(P["Stern"])
+            ['candidates', 'early_aborts', 'estimate_cache_hits', 'evaluations', 'hotspots', 'optimizations', 'pruned', 'rounds', 'sub_estimator_hits', 'sub_estimator_misses', 'wall_time']
+            >>> P["Stern"]["optimizations"], P["Stern"]["evaluations"] > 0, len(P["Stern"]["hotspots"]) > 0
+            (1, True, True)
+        """
+        profiles = {name: estimate[BASE_PROFILE] for name, estimate in self.estimates.items() if BASE_PROFILE in estimate}
+        return json.dumps(profiles, **kwargs)
 
     def table(self, show_quantum_complexity=False, show_tilde_o_time=False, show_all_parameters=False, precision=1, truncate=False):
         """Print table describing the complexity of each algorithm and its optimal parameters.
@@ -287,5 +759,6 @@ class BaseEstimator(object):
     def reset(self):
         """Resets the internal states of the estimator and all included algorithms."""
         self.estimates = {}
-        for i in self.algorithms():
-            i.reset()
+        for i in self._algorithm_instances.values():
+            if i is not None:
+                i.reset()
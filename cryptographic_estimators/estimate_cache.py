@@ -0,0 +1,211 @@
+# ****************************************************************************
+# Copyright 2023 Technology Innovation Institute
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ****************************************************************************
+
+
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from hashlib import sha256
+from importlib import metadata
+from typing import Optional
+
+ESTIMATE_CACHE_DEFAULT_MAX_SIZE = 256 * 2**20
+
+
+@lru_cache(maxsize=None)
+def _package_version():
+    """Returns the installed version of the package, which is part of every cache key."""
+    try:
+        return metadata.version("cryptographic_estimators")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _default_cache_path():
+    """Returns the default location of the cache database (inside `$XDG_CACHE_HOME` or `~/.cache`)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache_home, "cryptographic_estimators", "estimates.sqlite")
+
+
+def _key_default(value):
+    """Serializes classes by their qualified name, every other non-JSON value makes the key unavailable."""
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    if hasattr(value, "item") and not callable(value):
+        return value.item()
+    raise TypeError(f"{value!r} cannot be part of a cache key")
+
+
+class EstimateCache(object):
+    def __init__(self, path: Optional[str] = None, max_size: int = ESTIMATE_CACHE_DEFAULT_MAX_SIZE):
+        """Persistent, content-addressed store of estimation results backed by SQLite.
+
+        Entries are keyed on everything that influences the result of an algorithm (see `key`) and the least recently
+        used entries are evicted once the stored results exceed `max_size` bytes. The database can be shared between
+        processes.
+
+        Args:
+            path (str, optional): Location of the SQLite database. Defaults to
+                `$XDG_CACHE_HOME/cryptographic_estimators/estimates.sqlite`.
+            max_size (int, optional): Maximal total size of the stored results in bytes. Defaults to 256 MiB.
+
+        Examples:
+            >>> import os, tempfile
+            >>> from cryptographic_estimators import EstimateCache
+            >>> C = EstimateCache(os.path.join(tempfile.mkdtemp(), "cache.sqlite"))
+            >>> C.put("a", {"time": 10.0})
+            >>> C.get("a")
+            {'time': 10.0}
+            >>> C.get("b") is None
+            True
+
+            >>> from cryptographic_estimators.SDEstimator import SDEstimator
+            >>> A = SDEstimator(n=100, k=50, w=10, estimate_cache=C)
+            >>> B = SDEstimator(n=100, k=50, w=10, estimate_cache=C)
+            >>> A.estimate() == B.estimate()
+            True
+            >>> B.stern.get_optimal_parameters_dict(), B.stern.optimization_statistics["optimizations"]  # restored
+            ({'r': 4, 'p': 2, 'l': 9}, 0)
+            >>> SDEstimator(n=100, k=50, w=10, memory_access=2, estimate_cache=C).estimate() == A.estimate()
+            False
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.path = path if path is not None else _default_cache_path()
+        self.max_size = max_size
+        self._connection = None
+        self._connection_pid = None
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS estimates "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)")
+
+    def __getstate__(self):
+        """Drops the open connection and the lock, so that the cache can be sent to worker processes."""
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_connection_pid"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self):
+        """Runs a single transaction on the connection of the current process.
+
+        The connection is kept open, as closing the last connection to the database forces a checkpoint of the
+        write-ahead log, and reopened after a fork.
+        """
+        with self._lock:
+            if self._connection is None or self._connection_pid != os.getpid():
+                self._connection = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+                self._connection.execute("PRAGMA synchronous = NORMAL")
+                self._connection_pid = os.getpid()
+            with self._connection:
+                yield self._connection
+
+    @staticmethod
+    def key(**components) -> Optional[str]:
+        """Returns the content address of an entry described by `components`, or None if it cannot be cached.
+
+        The package version is always part of the key. Components which are neither JSON serializable nor classes
+        (e.g. a custom `memory_access` function) make the entry uncacheable.
+
+        Args:
+            **components: Everything the cached value depends on.
+
+        Tests:
+            >>> from cryptographic_estimators import EstimateCache
+            >>> EstimateCache.key(n=10, memory_access=0) == EstimateCache.key(memory_access=0, n=10)
+            True
+            >>> EstimateCache.key(n=10, memory_access=0) == EstimateCache.key(n=11, memory_access=0)
+            False
+            >>> EstimateCache.key(n=10, memory_access=lambda x: x) is None
+            True
+        """
+        components["version"] = _package_version()
+        try:
+            serialized = json.dumps(components, sort_keys=True, default=_key_default)
+        except (TypeError, ValueError):
+            return None
+        return sha256(serialized.encode()).hexdigest()
+
+    def get(self, key: str):
+        """Returns the value stored under `key` or None.
+
+        Args:
+            key (str): Key of the entry.
+        """
+        with self._connect() as connection:
+            row = connection.execute("SELECT value FROM estimates WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE estimates SET last_access = ? WHERE key = ?", (time.time(), key))
+        return pickle.loads(row[0])
+
+    def put(self, key: str, value):
+        """Stores `value` under `key` and evicts the least recently used entries if the cache exceeds `max_size`.
+
+        Args:
+            key (str): Key of the entry.
+            value: Any picklable value.
+
+        Tests:
+            >>> import os, tempfile
+            >>> from cryptographic_estimators import EstimateCache
+            >>> C = EstimateCache(os.path.join(tempfile.mkdtemp(), "cache.sqlite"), max_size=200)
+            >>> for i in range(3):
+            ...     C.put(str(i), "x" * 80)
+            >>> [C.get(str(i)) is None for i in range(3)]
+            [True, False, False]
+        """
+        blob = pickle.dumps(value)
+        with self._connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO estimates VALUES (?, ?, ?, ?)",
+                               (key, blob, len(blob), time.time()))
+            total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM estimates").fetchone()[0]
+            if total > self.max_size:
+                rows = connection.execute(
+                    "SELECT key, size FROM estimates ORDER BY last_access ASC, rowid ASC").fetchall()
+                for old_key, size in rows:
+                    if total <= self.max_size:
+                        break
+                    connection.execute("DELETE FROM estimates WHERE key = ?", (old_key,))
+                    total -= size
+
+    def size(self):
+        """Returns the total size of the stored results in bytes."""
+        with self._connect() as connection:
+            return connection.execute("SELECT COALESCE(SUM(size), 0) FROM estimates").fetchone()[0]
+
+    def clear(self):
+        """Removes all entries."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM estimates")
@@ -16,7 +16,7 @@
 # ****************************************************************************
 
 
-from .base_constants import BASE_ALGORITHM, BASE_PARAMETERS, BASE_TIME, BASE_MEMORY, BASE_ADDITIONALO, BASE_QUANTUMO, BASE_TILDEO_ESTIMATE
+from .base_constants import BASE_ALGORITHM, BASE_PARAMETERS, BASE_TIME, BASE_MEMORY, BASE_ADDITIONALO, BASE_QUANTUMO, BASE_TILDEO_ESTIMATE, BASE_PROFILE
 from .helper import concat_all_tables, round_or_truncate
 from copy import deepcopy
 from prettytable import PrettyTable
@@ -57,7 +57,7 @@ class EstimationRenderer():
                 continue
             if j == BASE_TILDEO_ESTIMATE and not self._show_tilde_o_time:
                 continue
-            if j == BASE_ADDITIONALO:
+            if j in (BASE_ADDITIONALO, BASE_PROFILE):
                 continue
 
             tbl = self._create_subtable_containing_all_columns(j, estimation)
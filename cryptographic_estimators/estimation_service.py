@@ -0,0 +1,541 @@
+# ****************************************************************************
+# Copyright 2023 Technology Innovation Institute
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ****************************************************************************
+
+"""Local JSON-over-HTTP estimation service.
+
+Requests are validated against `input_dictionary.json`, the description of the estimators used by the web front end,
+and estimated in a pool of worker processes. The service is started with
+
+    python -m cryptographic_estimators.estimation_service --input-dictionary input_dictionary.json --port 8000
+
+and offers the endpoints
+
+    GET  /estimators        identifiers of the available estimators
+    POST /estimate          JSON result of `BaseEstimator.estimate()`
+    POST /estimate/stream   server-sent events: one `progress` event per algorithm, then a `result` or `error` event
+
+The body of a POST request is a JSON object `{"estimator_id": "SDEstimator", "parameters": {"n": 100, ...}}`, where
+`parameters` maps the ids of the problem, optional and estimator parameters of the dictionary to their values.
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import multiprocessing
+import os
+import queue
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from math import isfinite
+from typing import Optional
+from .base_constants import BASE_EXCLUDED_ALGORITHMS, BASE_EXECUTOR_PROCESS, BASE_EXECUTOR_THREAD, BASE_ESTIMATEO
+from .base_constants import BASE_ESTIMATE_CACHE, BASE_PARAMETERS
+from .estimate_cache import EstimateCache
+
+SERVICE_DEFAULT_CACHE_SIZE = 1024
+SERVICE_MAX_BODY_SIZE = 2**20
+# parameters of the dictionary which only affect the rendering in the front end
+SERVICE_DISPLAY_PARAMETERS = ("precision",)
+SERVICE_PARAMETER_GROUPS = ("problem_parameters", "optional_parameters", "estimator_parameters")
+# parameters of type "number" taking real values, all others are integers
+SERVICE_REAL_PARAMETERS = ("memory_bound", "nsolutions", "theta", "cost_for_list_operation", "memory_for_list_element")
+
+_HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+def _json_safe(value):
+    """Converts numpy scalars and tuples to JSON types, non-finite numbers are stored as strings (e.g. "inf")."""
+    if isinstance(value, dict):
+        return {str(key): _json_safe(i) for key, i in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(i) for i in value]
+    if hasattr(value, "item") and not callable(value):
+        value = value.item()
+    if isinstance(value, float) and not isfinite(value):
+        return str(value)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer_parameter(description: dict):
+    """Returns whether a parameter of type "number" or "slider" only takes integral values."""
+    if description["type"] == "slider":
+        return description.get("number_of_decimals", 0) == 0
+    return description["id"] not in SERVICE_REAL_PARAMETERS
+
+
+def _run_estimate(Estimator: type, kwargs: dict, progress):
+    """Estimates `Estimator(**kwargs)` inside a worker and returns the JSON compatible result.
+
+    Args:
+        Estimator (type): Estimator class.
+        kwargs (dict): Keyword arguments of the estimator.
+        progress: Queue receiving the progress messages of `estimate()`, followed by None.
+    """
+    try:
+        return _json_safe(Estimator(**kwargs).estimate(logger=progress.put))
+    finally:
+        progress.put(None)
+
+
+class _HTTPError(Exception):
+    """Error answered with the given HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _Job(object):
+    """A running estimation, shared by all identical requests."""
+
+    def __init__(self):
+        self.messages = []
+        self.listeners = []
+        self.future = asyncio.get_running_loop().create_future()
+
+    def publish(self, message: str):
+        self.messages.append(message)
+        for listener in self.listeners:
+            listener(message)
+
+
+class EstimationService(object):
+    def __init__(self, input_dictionary, workers: int = 1, executor: str = BASE_EXECUTOR_PROCESS,
+                 cache_size: int = SERVICE_DEFAULT_CACHE_SIZE, estimate_cache: Optional[EstimateCache] = None):
+        """Estimation service validating requests against the front-end description of the estimators.
+
+        Identical requests running at the same time are estimated only once, and the results of the last
+        `cache_size` distinct requests are kept in memory.
+
+        Args:
+            input_dictionary (dict or str): Content or path of `input_dictionary.json`, which is not installed with
+                the package.
+            workers (int, optional): Number of concurrent estimations. Defaults to 1.
+            executor (str, optional): Either "process" or "thread", the pool running the estimations. Defaults to
+                "process".
+            cache_size (int, optional): Number of results kept in memory. Defaults to 1024.
+            estimate_cache (EstimateCache, optional): Persistent cache passed to every estimator. Defaults to None.
+
+        Examples:
+            >>> import asyncio
+            >>> from cryptographic_estimators.estimation_service import EstimationService
+            >>> S = EstimationService("input_dictionary.json")
+            >>> request = {"estimator_id": "SDEstimator", "parameters": {"n": 100, "k": 50, "w": 10,
+            ...            "included_algorithms": ["Prange", "Stern"], "bit_complexities": False}}
+            >>> result = asyncio.run(S.estimate(request))
+            >>> sorted(result["estimate"]), round(result["estimate"]["Stern"]["estimate"]["time"], 1)
+            (['Prange', 'Stern'], 15.7)
+            >>> S.close()
+
+        Tests:
+            >>> EstimationService({"estimators": []}, workers=0)
+            Traceback (most recent call last):
+            ...
+            ValueError: workers must be at least 1
+            >>> EstimationService({"estimators": []}, executor="gpu")
+            Traceback (most recent call last):
+            ...
+            ValueError: executor must be either 'process' or 'thread'
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if executor not in (BASE_EXECUTOR_PROCESS, BASE_EXECUTOR_THREAD):
+            raise ValueError(f"executor must be either '{BASE_EXECUTOR_PROCESS}' or '{BASE_EXECUTOR_THREAD}'")
+        if cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+
+        if isinstance(input_dictionary, str):
+            with open(input_dictionary, encoding="utf-8") as f:
+                input_dictionary = json.load(f)
+        self.estimators = {i["estimator_id"]: i for i in input_dictionary["estimators"]}
+
+        self.workers = workers
+        self.executor = executor
+        self.cache_size = cache_size
+        self.estimate_cache = estimate_cache
+        self.results = OrderedDict()
+        self._running = {}
+        self._pool = None
+        self._manager = None
+
+    def close(self):
+        """Shuts down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    def _estimator_classes(self, estimator_id: str):
+        """Returns the estimator class and a dictionary mapping the names of its algorithms to their classes."""
+        module = importlib.import_module(f"{__package__}.{estimator_id}")
+        Algorithm = getattr(module, self.estimators[estimator_id]["algorithm_id"])
+        return getattr(module, estimator_id), {i.__name__: i for i in Algorithm.__subclasses__()}
+
+    def _validate_parameter(self, description: dict, value):
+        """Returns `value`, with integral numbers converted to int, or raises a ValueError if it does not match the
+        description of a parameter in the dictionary."""
+        name, kind = description["id"], description["type"]
+        if kind in ("number", "slider"):
+            if not _is_number(value):
+                raise ValueError(f"parameter '{name}' must be a number")
+            if _is_integer_parameter(description):
+                if not float(value).is_integer():
+                    raise ValueError(f"parameter '{name}' must be an integer")
+                value = int(value)
+            if kind == "slider" and not description["min"] <= value <= description["max"]:
+                raise ValueError(f"parameter '{name}' must be between {description['min']} and {description['max']}")
+        elif kind == "switch":
+            if not isinstance(value, bool):
+                raise ValueError(f"parameter '{name}' must be a boolean")
+        elif kind == "selector":
+            if not isinstance(value, int) or isinstance(value, bool) or not 0 <= value < len(description["options"]):
+                raise ValueError(f"parameter '{name}' must be the index of one of {description['options']}")
+        elif kind == "multiple_selector":
+            if not isinstance(value, list) or not all(isinstance(i, str) for i in value):
+                raise ValueError(f"parameter '{name}' must be a list of names")
+        return value
+
+    def parse_request(self, request: dict):
+        """Validates a request and returns the estimator id together with the normalized parameters.
+
+        Parameters set to None are dropped, missing required problem parameters, unknown parameters and values not
+        matching their type in the dictionary raise a ValueError.
+
+        Args:
+            request (dict): Request of the form `{"estimator_id": ..., "parameters": {...}}`.
+
+        Tests:
+            >>> from cryptographic_estimators.estimation_service import EstimationService
+            >>> S = EstimationService("input_dictionary.json")
+            >>> S.parse_request({"estimator_id": "SDEstimator", "parameters": {"n": 100, "k": 50, "w": 10,
+            ...                  "memory_bound": None, "precision": 2}})
+            ('SDEstimator', {'k': 50, 'n': 100, 'w': 10})
+            >>> S.parse_request({"estimator_id": "XEstimator", "parameters": {}})
+            Traceback (most recent call last):
+            ...
+            ValueError: unknown estimator 'XEstimator'
+            >>> S.parse_request({"estimator_id": "SDEstimator", "parameters": {"n": 100, "k": 50}})
+            Traceback (most recent call last):
+            ...
+            ValueError: missing problem parameter 'w'
+            >>> S.parse_request({"estimator_id": "SDEstimator", "parameters": {"n": 100, "k": 50, "w": 10, "x": 1}})
+            Traceback (most recent call last):
+            ...
+            ValueError: unknown parameter 'x' of SDEstimator
+            >>> S.parse_request({"estimator_id": "SDEstimator", "parameters": {"n": 100, "k": 50, "w": "10"}})
+            Traceback (most recent call last):
+            ...
+            ValueError: parameter 'w' must be a number
+            >>> S.parse_request({"estimator_id": "SDEstimator", "parameters": {"n": 100.5, "k": 50, "w": 10}})
+            Traceback (most recent call last):
+            ...
+            ValueError: parameter 'n' must be an integer
+            >>> S.parse_request({"estimator_id": "SDEstimator", "parameters": {"n": 100.0, "k": 50, "w": 10,
+            ...                  "nsolutions": 0.5}})
+            ('SDEstimator', {'k': 50, 'n': 100, 'nsolutions': 0.5, 'w': 10})
+            >>> S.parse_request({"estimator_id": "SDEstimator", "parameters": {"n": 100, "k": 50, "w": 10,
+            ...                  "memory_access": 4}})
+            Traceback (most recent call last):
+            ...
+            ValueError: parameter 'memory_access' must be the index of one of ['Constant', 'Logaritmic', 'Square root', 'Cube root']
+            >>> S.parse_request({"estimator_id": "SDEstimator", "parameters": {"n": 100, "k": 50, "w": 10,
+            ...                  "included_algorithms": ["BJMMdw"]}})
+            Traceback (most recent call last):
+            ...
+            ValueError: unknown algorithm 'BJMMdw' of SDEstimator
+        """
+        if not isinstance(request, dict) or not isinstance(request.get(BASE_PARAMETERS, {}), dict):
+            raise ValueError("request must be an object with the keys 'estimator_id' and 'parameters'")
+        estimator_id = request.get("estimator_id")
+        if estimator_id not in self.estimators:
+            raise ValueError(f"unknown estimator '{estimator_id}'")
+
+        description = self.estimators[estimator_id]
+        parameters = {key: value for key, value in request.get(BASE_PARAMETERS, {}).items() if value is not None}
+        descriptions = {i["id"]: i for group in SERVICE_PARAMETER_GROUPS for i in description[group]}
+
+        for name in parameters:
+            if name not in descriptions:
+                raise ValueError(f"unknown parameter '{name}' of {estimator_id}")
+            parameters[name] = self._validate_parameter(descriptions[name], parameters[name])
+
+        for i in description["problem_parameters"]:
+            if i["id"] not in parameters and i.get("required", True) and "default_value" not in i:
+                raise ValueError(f"missing problem parameter '{i['id']}'")
+
+        for i in description["estimator_parameters"]:
+            if i["type"] == "multiple_selector" and i["id"] in parameters:
+                _, algorithms = self._estimator_classes(estimator_id)
+                for name in parameters[i["id"]]:
+                    if name not in algorithms or name in i.get(BASE_EXCLUDED_ALGORITHMS, []):
+                        raise ValueError(f"unknown algorithm '{name}' of {estimator_id}")
+
+        for name in SERVICE_DISPLAY_PARAMETERS:
+            parameters.pop(name, None)
+        return estimator_id, dict(sorted(parameters.items()))
+
+    def _estimator_kwargs(self, estimator_id: str, parameters: dict):
+        """Translates validated parameters into the estimator class and its keyword arguments."""
+        Estimator, algorithms = self._estimator_classes(estimator_id)
+        kwargs = dict(parameters)
+        included = kwargs.pop("included_algorithms", [])
+        if included:
+            kwargs[BASE_EXCLUDED_ALGORITHMS] = [algorithms[i] for i in algorithms if i not in included]
+        if self.estimate_cache is not None:
+            kwargs[BASE_ESTIMATE_CACHE] = self.estimate_cache
+        return Estimator, kwargs
+
+    def _submit(self, job: _Job, estimator_id: str, parameters: dict):
+        """Runs the estimation of `job` in the pool and forwards its progress messages."""
+        loop = asyncio.get_running_loop()
+        if self._pool is None:
+            if self.executor == BASE_EXECUTOR_PROCESS:
+                # forked workers would inherit the sockets of the open connections and keep them from closing
+                context = multiprocessing.get_context("spawn")
+                self._manager = context.Manager()
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        progress = self._manager.Queue() if self._manager is not None else queue.Queue()
+        Estimator, kwargs = self._estimator_kwargs(estimator_id, parameters)
+
+        async def forward_progress():
+            # a dedicated thread per job, as the (possibly remote) queue can only be read blocking
+            with ThreadPoolExecutor(max_workers=1) as reader:
+                while (message := await loop.run_in_executor(reader, progress.get)) is not None:
+                    job.publish(message)
+
+        async def run():
+            forwarding = asyncio.ensure_future(forward_progress())
+            try:
+                result = await loop.run_in_executor(self._pool, _run_estimate, Estimator, kwargs, progress)
+                await forwarding
+                job.future.set_result(result)
+            except Exception as e:
+                progress.put(None)
+                await forwarding
+                job.future.set_exception(e)
+
+        return asyncio.ensure_future(run())
+
+    async def estimate(self, request: dict, listener=None):
+        """Validates and estimates a request and returns `{"estimator_id": ..., "parameters": ..., "estimate": ...}`.
+
+        Args:
+            request (dict): Request of the form `{"estimator_id": ..., "parameters": {...}}`.
+            listener (callable, optional): Called with every progress message, including the messages emitted before
+                an identical running request was joined. Cached results do not emit progress messages.
+
+        Tests:
+            >>> import asyncio
+            >>> from cryptographic_estimators.estimation_service import EstimationService
+            >>> S = EstimationService("input_dictionary.json", executor="thread", workers=2)
+            >>> request = {"estimator_id": "SDEstimator", "parameters": {"n": 100, "k": 50, "w": 10,
+            ...            "included_algorithms": ["Prange", "Stern"]}}
+            >>> messages = []
+            >>> async def concurrent():
+            ...     return await asyncio.gather(S.estimate(request, messages.append), S.estimate(request))
+            >>> A, B = asyncio.run(concurrent())
+            >>> A == B, len(S.results), messages
+            (True, 1, ["[1/2] - Processing algorithm: 'Prange'", "[2/2] - Processing algorithm: 'Stern'"])
+            >>> asyncio.run(S.estimate(request)) == A
+            True
+            >>> S.close()
+        """
+        estimator_id, parameters = self.parse_request(request)
+        key = json.dumps([estimator_id, parameters], sort_keys=True)
+        if key in self.results:
+            self.results.move_to_end(key)
+            return self.results[key]
+
+        job = self._running.get(key)
+        if job is None:
+            job = _Job()
+            self._running[key] = job
+            task = self._submit(job, estimator_id, parameters)
+            task.add_done_callback(lambda _: self._running.pop(key, None))
+
+        if listener is not None:
+            for message in job.messages:
+                listener(message)
+            job.listeners.append(listener)
+
+        try:
+            estimate = await asyncio.shield(job.future)
+        finally:
+            if listener is not None:
+                job.listeners.remove(listener)
+
+        result = {"estimator_id": estimator_id, BASE_PARAMETERS: parameters, BASE_ESTIMATEO: estimate}
+        if self.cache_size:
+            self.results[key] = result
+            self.results.move_to_end(key)
+            while len(self.results) > self.cache_size:
+                self.results.popitem(last=False)
+        return result
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """Returns method, path and body of an HTTP request."""
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) != 3:
+            raise _HTTPError(400, "malformed request line")
+        headers = {}
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", 0) or 0)
+        if length > SERVICE_MAX_BODY_SIZE:
+            raise _HTTPError(413, "request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return request_line[0].upper(), request_line[1], body
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, body: dict):
+        content = json.dumps(body).encode()
+        writer.write(f"HTTP/1.1 {status} {_HTTP_REASONS[status]}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(content)}\r\nConnection: close\r\n\r\n".encode() + content)
+
+    @staticmethod
+    def _write_event(writer: asyncio.StreamWriter, event: str, data):
+        writer.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode())
+
+    async def _stream(self, writer: asyncio.StreamWriter, request: dict):
+        """Answers a request with server-sent events."""
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                     b"Connection: close\r\n\r\n")
+        try:
+            result = await self.estimate(request, lambda message: self._write_event(writer, "progress", message))
+            self._write_event(writer, "result", result)
+        except Exception as e:
+            self._write_event(writer, "error", {"error": str(e)})
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answers a single HTTP request and closes the connection."""
+        try:
+            try:
+                method, path, body = await self._read_request(reader)
+                path = path.split("?")[0].rstrip("/")
+                if path == "/estimators":
+                    if method != "GET":
+                        raise _HTTPError(405, "use GET")
+                    self._write_response(writer, 200, {"estimators": list(self.estimators)})
+                elif path in ("/estimate", "/estimate/stream"):
+                    if method != "POST":
+                        raise _HTTPError(405, "use POST")
+                    try:
+                        request = json.loads(body)
+                        self.parse_request(request)
+                    except ValueError as e:
+                        raise _HTTPError(400, str(e))
+                    if path == "/estimate":
+                        self._write_response(writer, 200, await self.estimate(request))
+                    else:
+                        await self._stream(writer, request)
+                else:
+                    raise _HTTPError(404, f"unknown path '{path}'")
+            except _HTTPError as e:
+                self._write_response(writer, e.status, {"error": str(e)})
+            except ValueError as e:
+                self._write_response(writer, 400, {"error": str(e)})
+            except Exception as e:
+                self._write_response(writer, 500, {"error": str(e)})
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        """Starts listening for HTTP requests and returns the `asyncio.Server`.
+
+        Args:
+            host (str, optional): Interface to bind. Defaults to "127.0.0.1".
+            port (int, optional): Port to bind, 0 picks a free port. Defaults to 0.
+
+        Examples:
+            >>> import asyncio, json
+            >>> from cryptographic_estimators.estimation_service import EstimationService
+            >>> async def post(port, path, request):
+            ...     reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            ...     body = json.dumps(request).encode()
+            ...     writer.write(f"POST {path} HTTP/1.1\\r\\nContent-Length: {len(body)}\\r\\n\\r\\n".encode() + body)
+            ...     response = await reader.read()
+            ...     writer.close()
+            ...     return response.decode()
+            >>> async def main():
+            ...     S = EstimationService("input_dictionary.json")
+            ...     server = await S.start()
+            ...     port = server.sockets[0].getsockname()[1]
+            ...     request = {"estimator_id": "SDEstimator", "parameters": {"n": 100, "k": 50, "w": 10,
+            ...                "included_algorithms": ["Prange"]}}
+            ...     responses = [await post(port, "/estimate/stream", request),
+            ...                  await post(port, "/estimate", {"estimator_id": "SDEstimator", "parameters": {}})]
+            ...     server.close()
+            ...     await server.wait_closed()
+            ...     S.close()
+            ...     return responses
+            >>> stream, invalid = asyncio.run(main())
+            >>> print(stream.split("\\r\\n\\r\\n")[1].split("\\n\\n")[0])
+            event: progress
+            data: "[1/1] - Processing algorithm: 'Prange'"
+            >>> json.loads(stream.split("event: result\\ndata: ")[1])["estimate"]["Prange"]["estimate"]["time"] > 0
+            True
+            >>> invalid.splitlines()[0], invalid.splitlines()[-1]
+            ('HTTP/1.1 400 Bad Request', '{"error": "missing problem parameter \\'n\\'"}')
+        """
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+
+def main(arguments=None):
+    """Command line entry point, serves estimation requests until interrupted."""
+    parser = argparse.ArgumentParser(description="Local JSON-over-HTTP estimation service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--input-dictionary", required=True, help="path of input_dictionary.json")
+    parser.add_argument("--cache", default=None, help="path of a persistent EstimateCache database")
+    args = parser.parse_args(arguments)
+
+    estimate_cache = EstimateCache(args.cache) if args.cache else None
+    service = EstimationService(args.input_dictionary, workers=args.workers, estimate_cache=estimate_cache)
+
+    async def serve():
+        server = await service.start(args.host, args.port)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# ****************************************************************************
+# Copyright 2023 Technology Innovation Institute
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ****************************************************************************
+
+
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Type
+from .base_estimator import BaseEstimator
+from .base_constants import BASE_PARAMETERS, BASE_ESTIMATEO
+
+
+def _chunks(grid: Iterable[dict], chunksize: int) -> Iterator[list]:
+    """Splits `grid` into lists of at most `chunksize` parameter sets."""
+    iterator = iter(grid)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _to_json(value):
+    """Converts values not natively supported by `json` (e.g. numpy scalars)."""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def sweep(estimator: Type[BaseEstimator], grid: Iterable[dict], workers: int = 1, chunksize: int = 1, logger=None,
+          warm_start: bool = False, **kwargs):
+    """Estimates every parameter set of `grid` and yields the results in the order of `grid`.
+
+    Each result is a dictionary with the keys `parameters`, holding the parameter set, and `estimate`, holding the
+    dictionary returned by `BaseEstimator.estimate()` for `estimator(**parameters, **kwargs)`.
+
+    Args:
+        estimator (Type[BaseEstimator]): Estimator class, e.g. `SDEstimator`.
+        grid (Iterable[dict]): Iterable of dictionaries holding the problem parameters, e.g. `{"n": 100, "k": 50, "w": 10}`.
+        workers (int, optional): Number of worker processes. Defaults to 1 (no process pool).
+        chunksize (int, optional): Number of parameter sets sent to a worker at once. Defaults to 1.
+        logger (callable, optional): Called with a progress message after each finished parameter set. Defaults to None.
+        warm_start (bool, optional): Warm start the optimization of each parameter set from the optimum of the
+            previous one in the same chunk, see `BaseEstimator`. Intended for dense grids, where neighbouring parameter
+            sets have close optima. Defaults to False.
+        **kwargs: Additional keyword arguments passed to each estimator, e.g. `memory_access` or `excluded_algorithms`.
+
+    Examples:
+        >>> from cryptographic_estimators import sweep
+        >>> from cryptographic_estimators.SDEstimator import SDEstimator, BJMM, BJMMdw, BJMMpdw, BJMMplus, BothMay, MayOzerov
+        >>> e = [BJMM, BJMMdw, BJMMpdw, BJMMplus, BothMay, MayOzerov]
+        >>> grid = [{"n": 100, "k": 50, "w": w} for w in range(8, 11)]
+        >>> results = list(sweep(SDEstimator, grid, workers=2, excluded_algorithms=e))
+        >>> [round(r["estimate"]["Stern"]["estimate"]["time"], 1) for r in results]
+        [21.5, 21.7, 22.3]
+
+    Tests:
+        >>> results == list(sweep(SDEstimator, grid, chunksize=2, excluded_algorithms=e))
+        True
+        >>> results[0]["estimate"] == SDEstimator(n=100, k=50, w=8, excluded_algorithms=e).estimate()
+        True
+        >>> messages = []
+        >>> _ = list(sweep(SDEstimator, grid[:1], logger=messages.append, excluded_algorithms=e))
+        >>> messages
+        ['[1/1] - Processed parameters: {"n": 100, "k": 50, "w": 8}']
+        >>> results == list(sweep(SDEstimator, grid, chunksize=3, warm_start=True, excluded_algorithms=e))
+        True
+    """
+    if workers < 1 or chunksize < 1:
+        raise ValueError("workers and chunksize must be at least 1")
+
+    total = f"/{len(grid)}" if hasattr(grid, "__len__") else ""
+    processed = 0
+
+    def report(parameters: dict, estimate: dict):
+        nonlocal processed
+        processed += 1
+        if logger:
+            logger(f"[{processed}{total}] - Processed parameters: {json.dumps(parameters, default=_to_json)}")
+        return {BASE_PARAMETERS: parameters, BASE_ESTIMATEO: estimate}
+
+    if workers == 1:
+        for chunk in _chunks(grid, chunksize):
+            for parameters, estimate in zip(chunk, estimator._estimate_parameter_sets(chunk, warm_start, **kwargs)):
+                yield report(parameters, estimate)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        chunks = _chunks(grid, chunksize)
+        # keep a bounded number of chunks in flight, so that arbitrarily large grids are streamed
+        for chunk in islice(chunks, 2 * workers):
+            pending.append((chunk, pool.submit(estimator._estimate_parameter_sets, chunk, warm_start, **kwargs)))
+
+        while pending:
+            chunk, future = pending.popleft()
+            for next_chunk in islice(chunks, 1):
+                pending.append((next_chunk, pool.submit(estimator._estimate_parameter_sets, next_chunk, warm_start, **kwargs)))
+
+            for parameters, estimate in zip(chunk, future.result()):
+                yield report(parameters, estimate)
+
+
+def sweep_to_jsonl(path: str, estimator: Type[BaseEstimator], grid: Iterable[dict], **kwargs):
+    """Writes the results of `sweep` to the file `path` in JSON Lines format and returns the number of written lines.
+
+    Every line is a JSON object with the keys `parameters` and `estimate`, see `sweep`. Results are written as soon
+    as they are available, so an interrupted sweep keeps all finished parameter sets.
+
+    Args:
+        path (str): Path of the output file.
+        estimator (Type[BaseEstimator]): Estimator class, e.g. `SDEstimator`.
+        grid (Iterable[dict]): Iterable of dictionaries holding the problem parameters.
+        **kwargs: Additional keyword arguments passed to `sweep`.
+
+    Examples:
+        >>> import json, os, tempfile
+        >>> from cryptographic_estimators import sweep_to_jsonl
+        >>> from cryptographic_estimators.SDEstimator import SDEstimator, Prange
+        >>> path = os.path.join(tempfile.mkdtemp(), "sd.jsonl")
+        >>> grid = [{"n": 100, "k": 50, "w": w} for w in range(8, 11)]
+        >>> sweep_to_jsonl(path, SDEstimator, grid)
+        3
+        >>> with open(path) as f:
+        ...     line = json.loads(f.readline())
+        >>> line["parameters"], round(line["estimate"]["Prange"]["estimate"]["time"], 1)
+        ({'n': 100, 'k': 50, 'w': 8}, 26.0)
+    """
+    lines = 0
+    with open(path, "w") as f:
+        for result in sweep(estimator, grid, **kwargs):
+            f.write(json.dumps(result, default=_to_json) + "\n")
+            f.flush()
+            lines += 1
+    return lines
@@ -17,7 +17,8 @@
 
 from enum import Enum
 from bisect import bisect_left
-from math import log2
+from math import comb, lgamma, log, log2
+import numpy as np
 
 
 class ComplexityType(Enum):
@@ -298,3 +299,74 @@ def ngates(q, n, theta=2):
         return n + log2(2 * log2(q) ** 2 + log2(q))
     else:
         return n + log2(log2(q)) * theta
+
+
+class LogBinomialTable(object):
+    def __init__(self):
+        """Memoized table of the logarithms of binomial coefficients.
+
+        `T(n, k)` returns `log2(comb(n, k))`. Every row is extended on demand via the exact integer recurrence
+        C(n, k + 1) = C(n, k) * (n - k) / (k + 1), so that the values are identical to `log2(comb(n, k))` while each
+        binomial coefficient is computed only once per table. Arguments are converted to integers as in `binom`.
+
+        Examples:
+            >>> from math import comb, log2
+            >>> from cryptographic_estimators.helper import LogBinomialTable
+            >>> T = LogBinomialTable()
+            >>> T(10, 5)
+            7.977279923499917
+            >>> all(T(n, k) == log2(comb(n, k)) for n in range(200) for k in range(n + 1))
+            True
+
+        Tests:
+            >>> T(3488, 64) == log2(comb(3488, 64)) and T(3488, 3424) == T(3488, 64)
+            True
+            >>> T(10, 11)
+            Traceback (most recent call last):
+            ...
+            ValueError: math domain error
+        """
+        self._logs = {}
+        self._last = {}
+        self._factorials = np.zeros(1)
+
+    def __call__(self, n: int, k: int):
+        """Returns log2 of the binomial coefficient `n` over `k`.
+
+        Args:
+            n (int): The total number of items.
+            k (int): The number of items to be selected.
+        """
+        n, k = int(n), int(k)
+        j = min(k, n - k)
+        logs = self._logs.get(n)
+        if logs is not None and 0 <= j < len(logs):
+            return logs[j]
+        if j < 0:
+            return log2(comb(n, k))
+        return self._extend(n, j)
+
+    def _extend(self, n: int, k: int):
+        """Extends the row `n` up to the binomial coefficient `n` over `k` and returns its logarithm."""
+        logs = self._logs.setdefault(n, [0.0])
+        value = self._last.get(n, 1)
+        for i in range(len(logs) - 1, k):
+            value = value * (n - i) // (i + 1)
+            logs.append(log2(value))
+        self._last[n] = value
+        return logs[k]
+
+    def log2_factorials(self, n: int):
+        """Returns the array of (floating point) log2(i!) for 0 <= i <= n, used by the vectorized cost models.
+
+        Args:
+            n (int): Largest argument.
+
+        Examples:
+            >>> from cryptographic_estimators.helper import LogBinomialTable
+            >>> [round(float(i), 6) for i in LogBinomialTable().log2_factorials(4)]
+            [0.0, 0.0, 1.0, 2.584963, 4.584963]
+        """
+        if len(self._factorials) <= n:
+            self._factorials = np.array([lgamma(i + 1) for i in range(n + 1)]) / log(2)
+        return self._factorials[:n + 1]
@@ -0,0 +1,164 @@
+# ****************************************************************************
+# Copyright 2023 Technology Innovation Institute
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ****************************************************************************
+
+
+import threading
+from .base_constants import BASE_SUB_ESTIMATORS, BASE_WARM_START, BASE_CANCEL_TOKEN, BASE_MAX_EVALUATIONS, BASE_TIME_BUDGET
+
+
+def _freeze(value):
+    """Returns a hashable representation of `value`, converting lists, tuples, sets and dictionaries recursively."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(i) for i in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(i) for i in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(value[key])) for key in value))
+    return value
+
+
+class SubEstimatorRegistry(object):
+    def __init__(self):
+        """Registry of the estimators used as subroutines by the algorithms of an estimator.
+
+        The registry is owned by the top-level estimator and handed to all its algorithms, which request their inner
+        estimators via `get`. Identical inner problems are therefore optimized only once and reused across
+        algorithms and parameter candidates.
+
+        Registered estimators are shared, so their owners never change them: an algorithm needing different settings
+        (e.g. another complexity type) requests the estimator with these settings instead, see `SDKeyAttack`. Several
+        threads may use a registered estimator at once, each algorithm serializes the computation of its state.
+
+        Examples:
+            >>> from cryptographic_estimators import SubEstimatorRegistry
+            >>> from cryptographic_estimators.SDEstimator import SDEstimator
+            >>> R = SubEstimatorRegistry()
+            >>> A = R.get(SDEstimator, n=100, k=50, w=10, excluded_algorithms=[])
+            >>> A is R.get(SDEstimator, w=10, k=50, n=100, excluded_algorithms=())
+            True
+            >>> A is R.get(SDEstimator, n=100, k=50, w=11, excluded_algorithms=[])
+            False
+            >>> len(R), R.hits, R.misses
+            (2, 1, 2)
+
+            >>> from cryptographic_estimators.PEEstimator import PEEstimator
+            >>> E = PEEstimator(n=60, k=30, q=31)
+            >>> _ = E.estimate()
+            >>> E.beullens.SDFqEstimator is E.sub_estimators.get(E.beullens.SDFqEstimator.__class__,
+            ...     n=60, k=30, w=E.beullens.w(), q=31, bit_complexities=0, nsolutions=0, memory_bound=E.problem.memory_bound)
+            True
+        """
+        self._estimators = dict()
+        self._lock = threading.RLock()
+        # number of calls of `get` answered by a registered estimator and by constructing a new one
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        """Drops the lock, so that the registry can be sent to worker processes."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._estimators)
+
+    @staticmethod
+    def key(Estimator, **kwargs):
+        """Returns the registry key of the estimator `Estimator(**kwargs)`, or None if it cannot be shared.
+
+        Args:
+            Estimator: Class of the estimator.
+            **kwargs: Problem parameters and keyword arguments of the estimator.
+
+        Tests:
+            >>> from cryptographic_estimators import SubEstimatorRegistry
+            >>> from cryptographic_estimators.SDEstimator import SDEstimator
+            >>> SubEstimatorRegistry.key(SDEstimator, n=10, sd_parameters={"a": [1]}) is None
+            False
+            >>> SubEstimatorRegistry.key(SDEstimator, n=10, problem=bytearray(1)) is None
+            True
+        """
+        kwargs.pop(BASE_SUB_ESTIMATORS, None)
+        key = (Estimator, _freeze(kwargs))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, Estimator, **kwargs):
+        """Returns the registered estimator `Estimator(**kwargs)`, constructing and registering it if necessary.
+
+        The constructed estimator receives this registry, so that its own inner estimators are shared as well.
+        Estimators whose arguments are not hashable are constructed on every call. Options forwarded by the calling
+        algorithm which only apply to its own optimization are dropped: a `warm_start` refers to an algorithm of the
+        outer estimator, and inner estimators are not stopped by the `cancel_token`, `max_evaluations` or
+        `time_budget` of the caller, as the caller could not report a partial inner optimization.
+
+        Tests:
+            >>> from cryptographic_estimators import SubEstimatorRegistry
+            >>> from cryptographic_estimators.SDEstimator import SDEstimator
+            >>> R = SubEstimatorRegistry()
+            >>> A = R.get(SDEstimator, n=100, k=50, w=10, max_evaluations=1, time_budget=1)
+            >>> A is R.get(SDEstimator, n=100, k=50, w=10), A.stern._max_evaluations
+            (True, inf)
+
+        Args:
+            Estimator: Class of the estimator.
+            **kwargs: Problem parameters and keyword arguments of the estimator.
+        """
+        for i in [BASE_WARM_START, BASE_CANCEL_TOKEN, BASE_MAX_EVALUATIONS, BASE_TIME_BUDGET]:
+            kwargs.pop(i, None)
+        key = self.key(Estimator, **kwargs)
+        kwargs[BASE_SUB_ESTIMATORS] = self
+        if key is None:
+            self.misses += 1
+            return Estimator(**kwargs)
+
+        with self._lock:
+            estimator = self._estimators.get(key)
+            if estimator is None:
+                self.misses += 1
+                estimator = Estimator(**kwargs)
+                self._estimators[key] = estimator
+            else:
+                self.hits += 1
+        return estimator
+
+    def estimators(self):
+        """Returns the registered estimators.
+
+        Tests:
+            >>> from cryptographic_estimators import SubEstimatorRegistry
+            >>> from cryptographic_estimators.SDEstimator import SDEstimator
+            >>> R = SubEstimatorRegistry()
+            >>> A = R.get(SDEstimator, n=100, k=50, w=10)
+            >>> R.estimators() == [A]
+            True
+        """
+        with self._lock:
+            return list(self._estimators.values())
+
+    def clear(self):
+        """Removes all registered estimators."""
+        with self._lock:
+            self._estimators.clear()
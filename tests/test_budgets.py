@@ -0,0 +1,44 @@
+import threading
+
+from cryptographic_estimators import EstimateCache
+from cryptographic_estimators.RegSDEstimator import RegSDEstimator
+from cryptographic_estimators.SDEstimator import SDEstimator, SDProblem
+from cryptographic_estimators.SDEstimator.SDAlgorithms import Stern
+
+
+def test_budget_equal_to_the_number_of_evaluations_is_not_partial():
+    complete = Stern(SDProblem(n=200, k=100, w=20), vectorized=False)
+    complete.time_complexity()
+    evaluations = complete.optimization_statistics["evaluations"]
+
+    algorithm = Stern(SDProblem(n=200, k=100, w=20), vectorized=False, max_evaluations=evaluations)
+    assert algorithm.time_complexity() == complete.time_complexity()
+    assert not algorithm.optimization_is_partial
+
+
+def test_budgets_do_not_apply_to_inner_estimators(tmp_path):
+    # SDAttack has a single parameter set, its cost is the optimum of an inner SDEstimator
+    cache = EstimateCache(str(tmp_path / "cache.sqlite"))
+    budgeted = RegSDEstimator(n=954, k=582, w=106, max_evaluations=2, estimate_cache=cache).estimate()
+    complete = RegSDEstimator(n=954, k=582, w=106).estimate()
+
+    assert budgeted["SDAttack"] == complete["SDAttack"]
+    cached = RegSDEstimator(n=954, k=582, w=106, estimate_cache=cache).estimate()
+    assert cached["SDAttack"] == complete["SDAttack"]
+
+
+def test_cancel_token_stops_the_optimization_with_several_workers():
+    cancel_token = threading.Event()
+    progress = []
+
+    def cancel_after_first_evaluation(information):
+        progress.append(information["algorithm"])
+        cancel_token.set()
+
+    estimator = SDEstimator(n=100, k=50, w=10, cancel_token=cancel_token,
+                            progress_callback=cancel_after_first_evaluation)
+    estimates = estimator.estimate(workers=2)
+
+    assert progress
+    assert list(estimates) == estimator.algorithm_names()
+    assert any(estimate["estimate"].get("partial", False) for estimate in estimates.values())
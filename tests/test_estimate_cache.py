@@ -0,0 +1,17 @@
+from cryptographic_estimators import EstimateCache
+from cryptographic_estimators.SDEstimator import SDEstimator
+
+
+def test_cache_hit_restores_the_state_of_the_algorithms(tmp_path):
+    cache = EstimateCache(str(tmp_path / "cache.sqlite"))
+    A = SDEstimator(n=100, k=50, w=10, estimate_cache=cache)
+    B = SDEstimator(n=100, k=50, w=10, estimate_cache=cache)
+    assert A.estimate() == B.estimate()
+
+    assert B.stern.get_optimal_parameters_dict() == A.stern.get_optimal_parameters_dict()
+    assert B.stern.optimal_parameters() == A.stern.optimal_parameters()
+    assert B.fastest_algorithm().__class__ is A.fastest_algorithm().__class__
+    assert [i.time_complexity() for i in B.algorithms()] == [i.time_complexity() for i in A.algorithms()]
+    assert [i.memory_complexity() for i in B.algorithms()] == [i.memory_complexity() for i in A.algorithms()]
+    # nothing was optimized again
+    assert all(i.optimization_statistics["optimizations"] == 0 for i in B.algorithms())
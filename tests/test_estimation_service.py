@@ -0,0 +1,148 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from cryptographic_estimators import estimation_service
+from cryptographic_estimators.estimation_service import EstimationService, SERVICE_MAX_BODY_SIZE
+
+INPUT_DICTIONARY = str(Path(__file__).parent.parent / "input_dictionary.json")
+REQUEST = {"estimator_id": "SDEstimator", "parameters": {"n": 100, "k": 50, "w": 10,
+                                                         "included_algorithms": ["Prange", "Stern"]}}
+
+
+async def http(port, method, path, body=b"", length=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    length = len(body) if length is None else length
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode() + body)
+    response = (await reader.read()).decode()
+    writer.close()
+    head, _, content = response.partition("\r\n\r\n")
+    return int(head.split()[1]), content
+
+
+def serve(service, *requests):
+    """Answers the requests, given as argument tuples of `http`, and returns (status, content) pairs."""
+    async def main():
+        server = await service.start()
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return [await http(port, *request) for request in requests]
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    try:
+        return asyncio.run(main())
+    finally:
+        service.close()
+
+
+def events(content):
+    return [(event[len("event: "):], json.loads(data[len("data: "):]))
+            for event, data in (i.split("\n") for i in content.strip().split("\n\n"))]
+
+
+def test_process_pool_matches_thread_pool():
+    messages = []
+    process = EstimationService(INPUT_DICTIONARY)
+    try:
+        result = asyncio.run(process.estimate(REQUEST, messages.append))
+    finally:
+        process.close()
+    thread = EstimationService(INPUT_DICTIONARY, executor="thread")
+    try:
+        assert result == asyncio.run(thread.estimate(REQUEST))
+    finally:
+        thread.close()
+    # progress messages are forwarded from the worker processes
+    assert messages == ["[1/2] - Processing algorithm: 'Prange'", "[2/2] - Processing algorithm: 'Stern'"]
+
+
+def test_stream_emits_progress_followed_by_the_result():
+    service = EstimationService(INPUT_DICTIONARY, executor="thread")
+    [(status, content)] = serve(service, ("POST", "/estimate/stream", json.dumps(REQUEST).encode()))
+
+    assert status == 200
+    stream = events(content)
+    assert [event for event, _ in stream] == ["progress", "progress", "result"]
+    assert stream[-1][1] == service.results[next(iter(service.results))]
+
+
+def test_stream_reports_failed_estimations_as_error_event():
+    request = {"estimator_id": "SDEstimator", "parameters": {"n": 50, "k": 60, "w": 10}}
+    [(status, content)] = serve(EstimationService(INPUT_DICTIONARY, executor="thread"),
+                                ("POST", "/estimate/stream", json.dumps(request).encode()))
+
+    assert status == 200
+    assert events(content) == [("error", {"error": "k must be smaller or equal to n"})]
+
+
+def test_concurrent_identical_requests_are_estimated_once(monkeypatch):
+    calls = []
+
+    def run_estimate(Estimator, kwargs, progress):
+        calls.append(kwargs)
+        return original(Estimator, kwargs, progress)
+
+    original = estimation_service._run_estimate
+    monkeypatch.setattr(estimation_service, "_run_estimate", run_estimate)
+    other = {"estimator_id": "SDEstimator", "parameters": {**REQUEST["parameters"], "w": 11}}
+    service = EstimationService(INPUT_DICTIONARY, executor="thread", workers=2)
+
+    async def concurrent():
+        return await asyncio.gather(service.estimate(REQUEST), service.estimate(REQUEST), service.estimate(other))
+
+    try:
+        A, B, C = asyncio.run(concurrent())
+        assert A == B != C
+        assert len(calls) == 2
+        # finished requests are answered from the results
+        assert asyncio.run(service.estimate(REQUEST)) == A
+        assert len(calls) == 2
+    finally:
+        service.close()
+
+
+@pytest.mark.parametrize("method, path, body, status, error", [
+    ("POST", "/estimate", b"{", 400, "Expecting property name enclosed in double quotes: line 1 column 2 (char 1)"),
+    ("POST", "/estimate", b'{"estimator_id": "SDEstimator", "parameters": {"n": 100.5, "k": 50, "w": 10}}', 400,
+     "parameter 'n' must be an integer"),
+    ("POST", "/estimate", b'{"estimator_id": "SDEstimator", "parameters": {"n": 50, "k": 60, "w": 10}}', 400,
+     "k must be smaller or equal to n"),
+    ("GET", "/estimate", b"", 405, "use POST"),
+    ("POST", "/estimators", b"", 405, "use GET"),
+    ("GET", "/unknown", b"", 404, "unknown path '/unknown'"),
+])
+def test_error_statuses(method, path, body, status, error):
+    [response] = serve(EstimationService(INPUT_DICTIONARY, executor="thread"), (method, path, body))
+
+    assert response == (status, json.dumps({"error": error}))
+
+
+def test_large_bodies_are_rejected_before_reading_them():
+    [response] = serve(EstimationService(INPUT_DICTIONARY, executor="thread"),
+                       ("POST", "/estimate", b"", SERVICE_MAX_BODY_SIZE + 1))
+
+    assert response == (413, json.dumps({"error": "request body too large"}))
+
+
+def test_unexpected_errors_are_internal_server_errors(monkeypatch):
+    def run_estimate(Estimator, kwargs, progress):
+        progress.put(None)
+        raise RuntimeError("worker failed")
+
+    monkeypatch.setattr(estimation_service, "_run_estimate", run_estimate)
+    [response] = serve(EstimationService(INPUT_DICTIONARY, executor="thread"),
+                       ("POST", "/estimate", json.dumps(REQUEST).encode()))
+
+    assert response == (500, json.dumps({"error": "worker failed"}))
+
+
+def test_estimators_lists_the_input_dictionary():
+    [(status, content)] = serve(EstimationService(INPUT_DICTIONARY, executor="thread"), ("GET", "/estimators", b""))
+
+    with open(INPUT_DICTIONARY, encoding="utf-8") as f:
+        expected = [i["estimator_id"] for i in json.load(f)["estimators"]]
+    assert (status, json.loads(content)) == (200, {"estimators": expected})
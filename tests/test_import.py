@@ -0,0 +1,73 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# generous upper bounds in seconds, the imports take about 0.1 seconds on a
+# development machine; exceeding them means an expensive import became eager
+IMPORT_TIME_BUDGETS = {
+    "import cryptographic_estimators": 1.0,
+    "from cryptographic_estimators.SDEstimator import SDEstimator": 1.5,
+}
+
+HEAVY_MODULES = ["scipy", "sympy", "pytest"]
+
+SCRIPT = """
+import json, sys
+from time import perf_counter
+start = perf_counter()
+{statement}
+elapsed = perf_counter() - start
+subpackages = sorted(name.split(".")[1] for name in sys.modules
+                     if name.count(".") == 1 and name.split(".")[1].endswith("Estimator")
+                     and name.startswith("cryptographic_estimators."))
+print(json.dumps({{"time": elapsed, "modules": sorted(sys.modules), "subpackages": subpackages}}))
+"""
+
+
+def run_import(statement: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+@pytest.mark.parametrize("statement", IMPORT_TIME_BUDGETS)
+def test_import_does_not_load_heavy_modules(statement):
+    result = run_import(statement)
+    for module in HEAVY_MODULES:
+        assert module not in result["modules"]
+
+
+@pytest.mark.parametrize("statement, budget", IMPORT_TIME_BUDGETS.items())
+def test_import_time_is_within_budget(statement, budget):
+    # the best of a few runs, to be robust against a busy machine
+    elapsed = min(run_import(statement)["time"] for _ in range(3))
+    assert elapsed < budget
+
+
+def test_estimator_subpackages_are_imported_on_first_access():
+    result = run_import("import cryptographic_estimators")
+    assert result["subpackages"] == []
+
+    result = run_import("from cryptographic_estimators.SDEstimator import SDEstimator")
+    assert result["subpackages"] == ["SDEstimator"]
+
+    result = run_import(
+        "import cryptographic_estimators\n"
+        "cryptographic_estimators.MQEstimator.MQEstimator(n=10, m=10, q=2)"
+    )
+    assert result["subpackages"] == ["MQEstimator"]
+
+
+def test_power_series_cap_is_set_on_import():
+    result = run_import(
+        "from cryptographic_estimators.MQEstimator import MQEstimator\n"
+        "from flint import ctx\n"
+        "assert ctx.cap == 20000"
+    )
+    assert "flint" in result["modules"]
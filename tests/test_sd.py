@@ -21,8 +21,22 @@ from cryptographic_estimators.SDEstimator.SDAlgorithms import (
     MayOzerov,
     Stern,
 )
+from cryptographic_estimators.helper import ComplexityType
 
 def test_sd_raises_error_when_invalid_parameters_are_passed():
     e = [Dumer, Prange, MayOzerov, BJMM, BJMMpdw, BJMMdw, BothMay, Stern]
     with pytest.raises(ValueError, match="k must be smaller or equal to n"):
         SDEstimator(n=1, k=5, w=2, excluded_algorithms=e)
+
+
+def test_sd_tilde_o_complexities_with_seed_do_not_depend_on_workfactor_workers():
+    # the estimate is rounded, the complexities differ between seeds in the last digits
+    def complexities(**kwargs):
+        estimator = SDEstimator(n=100, k=50, w=10, complexity_type=ComplexityType.TILDEO.value,
+                                workfactor_seed=5, **kwargs)
+        return [(i.time_complexity(), i.memory_complexity(), i.optimal_parameters())
+                for i in estimator.algorithms() if i.scipy_model is not None]
+
+    serial = complexities()
+    assert complexities(workfactor_workers=2) == serial
+    assert complexities(workfactor_workers=3) == serial
@@ -0,0 +1,68 @@
+import sys
+import threading
+
+from cryptographic_estimators import SubEstimatorRegistry
+from cryptographic_estimators.BIKEEstimator import BIKEProblem
+from cryptographic_estimators.BIKEEstimator.BIKEAlgorithms import SDKeyAttack
+from cryptographic_estimators.PEEstimator import PEEstimator
+from cryptographic_estimators.RegSDEstimator import RegSDEstimator
+from cryptographic_estimators.SDEstimator import SDProblem
+from cryptographic_estimators.SDEstimator.SDAlgorithms import Stern
+
+
+def test_changing_the_complexity_type_does_not_change_shared_estimators():
+    registry = SubEstimatorRegistry()
+    A = SDKeyAttack(BIKEProblem(r=101, w=10, t=12), sub_estimators=registry)
+    B = SDKeyAttack(BIKEProblem(r=101, w=10, t=12), sub_estimators=registry)
+    assert A._SDEstimator is B._SDEstimator
+    time = B.time_complexity()
+
+    A.complexity_type = 1
+    A.time_complexity()
+    assert A._SDEstimator is not B._SDEstimator
+    assert set(B._SDEstimator.complexity_type) == {0}
+    assert B.time_complexity() == time
+
+    A.complexity_type = 0
+    assert A._SDEstimator is B._SDEstimator
+    assert A.time_complexity() == time
+
+
+def test_shared_algorithm_is_optimized_once_by_concurrent_threads():
+    algorithm = Stern(SDProblem(n=200, k=100, w=20), vectorized=False)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def optimize():
+        barrier.wait()
+        results.append(algorithm.time_complexity())
+
+    threads = [threading.Thread(target=optimize) for _ in range(8)]
+    # switch threads often, so that unsynchronized optimizations would interleave
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert algorithm.optimization_statistics["optimizations"] == 1
+    assert results == [Stern(SDProblem(n=200, k=100, w=20), vectorized=False).time_complexity()] * 8
+
+
+def test_threaded_estimate_with_shared_inner_estimators():
+    # Leon and Beullens share the inner SDFqEstimator of equal weights
+    threaded = PEEstimator(n=60, k=20, q=31).estimate(workers=4, executor="thread")
+    assert threaded == PEEstimator(n=60, k=20, q=31).estimate()
+
+
+def test_process_estimate_keeps_the_inner_estimators_of_the_registry():
+    estimator = RegSDEstimator(n=954, k=582, w=106)
+    estimates = estimator.estimate(workers=2)
+
+    assert estimator.sd_attack._sub_estimators is estimator.sub_estimators
+    assert estimator.sd_attack.SDEstimator in estimator.sub_estimators._estimators.values()
+    assert estimates == RegSDEstimator(n=954, k=582, w=106).estimate()
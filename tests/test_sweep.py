@@ -0,0 +1,16 @@
+from cryptographic_estimators import sweep
+from cryptographic_estimators.BIKEEstimator import BIKEEstimator
+from cryptographic_estimators.PEEstimator import PEEstimator
+from cryptographic_estimators.RegSDEstimator import RegSDEstimator
+
+
+def test_warm_started_sweep_of_nested_estimators():
+    # the algorithms of these estimators build inner SD estimators, which must not receive the warm start
+    cases = [
+        (PEEstimator, [{"n": 60, "k": 20, "q": 31}, {"n": 60, "k": 21, "q": 31}]),
+        (RegSDEstimator, [{"n": 256, "k": 128, "w": 16}, {"n": 256, "k": 129, "w": 16}]),
+        (BIKEEstimator, [{"r": 101, "w": 10, "t": 12}, {"r": 101, "w": 10, "t": 13}]),
+    ]
+    for estimator, grid in cases:
+        warm_started = list(sweep(estimator, grid, chunksize=len(grid), warm_start=True))
+        assert warm_started == list(sweep(estimator, grid))